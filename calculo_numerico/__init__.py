@@ -0,0 +1,101 @@
+# ===================================================================
+# PACOTE: calculo_numerico
+# Descrição:
+#   Reúne os programas da disciplina como módulos importáveis:
+#     gauss         -> eliminação de Gauss e fatoração LU
+#     gauss_seidel  -> métodos iterativos (Gauss-Seidel, SOR, Krylov)
+#     trelicas      -> montagem da rigidez de treliças direto em CSR
+#     integral      -> regras de integração numérica
+#     lei_de_moore  -> regressão da Lei de Moore
+#     minimos_quadrados -> mínimos quadrados por QR em pedaços (TSQR)
+#     arquivos      -> leitura de sistemas grandes (memmap, triplas) e
+#                      gravação de soluções
+#     desempenho    -> medições de desempenho (benchmarks) em JSON
+#     instrumentacao -> tempo e contadores por fase (opcional, desligada)
+#
+#   Importar o pacote não executa nenhum programa nem importa numpy:
+#   cada submódulo só é carregado quando um de seus nomes é usado,
+#   por exemplo `calculo_numerico.resolver_sistema(A, b)`.
+#   Os programas interativos continuam disponíveis pela função main()
+#   de cada módulo e pela linha de comando (python -m calculo_numerico).
+# ===================================================================
+
+import importlib
+
+_MODULOS = ("gauss", "gauss_seidel", "trelicas", "integral", "lei_de_moore",
+            "minimos_quadrados", "arquivos", "desempenho",
+            "instrumentacao")
+
+# Nome público -> submódulo onde ele está definido
+_NOMES = {
+    # gauss
+    "fatorar_lu": "gauss",
+    "resolver_lu": "gauss",
+    "resolver_sistema": "gauss",
+    "separar_fatores": "gauss",
+    "SolucionadorLU": "gauss",
+    "resolver_lote": "gauss",
+    "resolver_precisao_mista": "gauss",
+    "largura_banda": "gauss",
+    "para_banda": "gauss",
+    "fatorar_lu_banda": "gauss",
+    "resolver_lu_banda": "gauss",
+    "resolver_tridiagonal": "gauss",
+    "reordenar_cuthill_mckee": "gauss",
+    "resolver_sistema_banda": "gauss",
+    # gauss_seidel
+    "MatrizCSR": "gauss_seidel",
+    "MonitorConvergencia": "gauss_seidel",
+    "gauss_seidel_csr": "gauss_seidel",
+    "sor_csr": "gauss_seidel",
+    "gauss_seidel_multicolor": "gauss_seidel",
+    "gradientes_conjugados": "gauss_seidel",
+    "bicgstab": "gauss_seidel",
+    # trelicas
+    "Trelica": "trelicas",
+    "trelica_retangular": "trelicas",
+    # integral
+    "trapezios_vetorizado": "integral",
+    "simpson_vetorizado": "integral",
+    "simpson_adaptativo": "integral",
+    "romberg": "integral",
+    "integrar_lote": "integral",
+    "compilar_integrando": "integral",
+    # lei_de_moore
+    "ajustar_reta": "lei_de_moore",
+    "calcular_r2": "lei_de_moore",
+    "RegressaoIncremental": "lei_de_moore",
+    "ajustar_csv": "lei_de_moore",
+    "ajustar_series": "lei_de_moore",
+    "AjusteSeries": "lei_de_moore",
+    "prever_transistores": "lei_de_moore",
+    # minimos_quadrados
+    "AcumuladorQR": "minimos_quadrados",
+    "ajustar_em_pedacos": "minimos_quadrados",
+    "ajustar_polinomio": "minimos_quadrados",
+    "ajustar_linear": "minimos_quadrados",
+    # arquivos
+    "carregar_matriz_densa": "arquivos",
+    "carregar_vetor": "arquivos",
+    "carregar_triplas_csr": "arquivos",
+    "carregar_densa_csr": "arquivos",
+    "salvar_solucao": "arquivos",
+    # instrumentacao
+    "instrumentar": "instrumentacao",
+}
+
+__all__ = list(_MODULOS) + list(_NOMES)
+
+
+def __getattr__(nome):
+    # Carrega o submódulo somente no primeiro acesso (PEP 562).
+    if nome in _MODULOS:
+        return importlib.import_module(f"{__name__}.{nome}")
+    if nome in _NOMES:
+        modulo = importlib.import_module(f"{__name__}.{_NOMES[nome]}")
+        return getattr(modulo, nome)
+    raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
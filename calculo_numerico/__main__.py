@@ -0,0 +1,310 @@
+# ===================================================================
+# LINHA DE COMANDO
+#   python -m calculo_numerico <comando> [ARQUIVO] [opções]
+#
+# Comandos em lote (sem nenhuma pergunta ao usuário). ARQUIVO é um
+# texto com números separados por espaços ou vírgulas, uma linha por
+# registro; sem ARQUIVO (ou com "-") os dados são lidos da entrada
+# padrão. Linhas iniciadas por "#" são ignoradas.
+#
+#   gauss         matriz aumentada [A|b], uma equação por linha
+#   gauss-seidel  matriz aumentada [A|b], uma equação por linha
+#   integral      linhas "a b n" (uma integral por linha)
+#   moore         linhas "ano transistores"
+#   interativo    executa um dos programas interativos originais
+#   desempenho    mede todos os métodos e grava os resultados em JSON
+#   desempenho-comparar  compara dois JSON e aponta regressões
+#
+# Os resultados vão para a saída padrão (ou para --saida) e as
+# mensagens de diagnóstico para a saída de erro.
+#
+# Para sistemas grandes, gauss e gauss-seidel aceitam --matriz e
+# --vetor no lugar da matriz aumentada: matrizes densas .npy/binárias
+# ou, com --triplas, arquivos de triplas (i, j, valor); veja o módulo
+# arquivos. Uma --saida terminada em .npy (ou binária) é gravada no
+# mesmo formato.
+#
+# Com --perfil ARQUIVO (antes do comando) a execução é instrumentada:
+# o resumo das fases vai para a saída de erro e o perfil é gravado no
+# formato Chrome trace (.json) ou de pilhas recolhidas (.folded).
+#
+# Os módulos do pacote (e o numpy) só são importados depois que o
+# comando é escolhido, para que a inicialização seja rápida.
+# ===================================================================
+
+import argparse
+import contextlib
+import importlib
+import io
+import json
+import sys
+
+PROGRAMAS_INTERATIVOS = {
+    "gauss": "gauss",
+    "gauss-seidel": "gauss_seidel",
+    "integral": "integral",
+    "moore": "lei_de_moore",
+}
+
+
+def _modulo(nome):
+    return importlib.import_module(f"calculo_numerico.{nome}")
+
+
+def _fase(nome):
+    # Fase da instrumentação, se --perfil estiver ligado.
+    instrumentacao = sys.modules.get("calculo_numerico.instrumentacao")
+    estatisticas = instrumentacao.ativa() if instrumentacao else None
+    return estatisticas.fase(nome) if estatisticas else contextlib.nullcontext()
+
+
+def _ler_tabela(caminho):
+    # Lê o arquivo (ou a entrada padrão) como uma tabela 2-D de floats.
+    import numpy as np
+
+    with _fase("cli/entrada"):
+        if caminho in (None, "-"):
+            texto = sys.stdin.read()
+        else:
+            with open(caminho, encoding="utf-8") as arquivo:
+                texto = arquivo.read()
+        return np.loadtxt(io.StringIO(texto.replace(",", " ")), ndmin=2)
+
+
+def _escrever(valores, caminho):
+    import numpy as np
+
+    with _fase("cli/saida"):
+        if caminho in (None, "-"):
+            np.savetxt(sys.stdout, valores, fmt="%.17g")
+        elif getattr(valores, "ndim", 2) == 1:
+            _modulo("arquivos").salvar_solucao(caminho, valores)
+        else:
+            np.savetxt(caminho, valores, fmt="%.17g")
+
+
+def _separar_sistema(tabela):
+    if tabela.shape[1] != tabela.shape[0] + 1:
+        raise ValueError(f"Esperada matriz aumentada n×(n+1); recebida {tabela.shape[0]}×{tabela.shape[1]}.")
+    return tabela[:, :-1], tabela[:, -1]
+
+
+def _ler_sistema(args, esparso):
+    # Devolve (A, b): da matriz aumentada em texto ou de --matriz/--vetor.
+    if args.matriz is None:
+        A, b = _separar_sistema(_ler_tabela(args.arquivo))
+        return (_modulo("gauss_seidel").MatrizCSR.de_densa(A) if esparso else A), b
+    if args.vetor is None:
+        raise ValueError("--matriz exige também --vetor.")
+
+    arquivos = _modulo("arquivos")
+    if args.triplas:
+        A = arquivos.carregar_triplas_csr(args.matriz)
+        A = A if esparso else A.para_densa()
+    elif esparso:
+        A = arquivos.carregar_densa_csr(args.matriz)
+    else:
+        A = arquivos.carregar_matriz_densa(args.matriz)
+    b = arquivos.carregar_vetor(args.vetor)
+    if b.shape[0] != (A.n if esparso else A.shape[0]):
+        raise ValueError("O vetor b não tem o tamanho da matriz.")
+    return A, b
+
+
+def comando_gauss(args):
+    gauss = _modulo("gauss")
+    A, b = _ler_sistema(args, esparso=False)
+    if args.precisao == "mista":
+        x, refinamentos, erro, precisao = gauss.resolver_precisao_mista(A, b)
+        print(f"precisão {precisao}: {refinamentos} refinamentos, erro retroativo {erro:.3g}",
+              file=sys.stderr)
+    else:
+        x = gauss.resolver_sistema(A, b)
+    _escrever(x, args.saida)
+
+
+def comando_gauss_seidel(args):
+    gauss_seidel = _modulo("gauss_seidel")
+    A, b = _ler_sistema(args, esparso=True)
+    # Com --exibir-iteracoes, o progresso vai para a saída de erro (a
+    # saída padrão pode ser a própria solução).
+    monitor = (gauss_seidel.MonitorConvergencia(A=A, b=b, exibir=True, saida=sys.stderr)
+               if args.exibir_iteracoes else None)
+
+    if args.metodo in ("cg", "bicgstab"):
+        solucionador = (gauss_seidel.gradientes_conjugados if args.metodo == "cg"
+                        else gauss_seidel.bicgstab)
+        x, iteracoes, convergiu, _ = solucionador(A, b, args.tol, args.max_iter,
+                                                  precondicionador=args.precondicionador)
+    elif args.metodo == "multicolor":
+        x, iteracoes, convergiu = gauss_seidel.gauss_seidel_multicolor(
+            A, b, args.tol, args.max_iter, num_trabalhadores=args.processos or 1,
+            monitor=monitor)
+    else:
+        omega = 1.0 if args.metodo == "gauss-seidel" else args.omega
+        omega = omega if omega == "auto" else float(omega)
+        x, iteracoes, convergiu, _ = gauss_seidel.sor_csr(
+            A, b, args.tol, args.max_iter, omega, simetrico=args.metodo == "ssor",
+            monitor=monitor)
+
+    if not convergiu:
+        print(f"ATENÇÃO: {iteracoes} iterações sem convergência.", file=sys.stderr)
+    _escrever(x, args.saida)
+
+
+def comando_integral(args):
+    tabela = _ler_tabela(args.arquivo)
+    if tabela.shape[1] != 3:
+        raise ValueError("Cada linha deve conter 'a b n'.")
+
+    integral = _modulo("integral")
+    funcao = args.funcao if args.funcao else integral.f
+    resultados = integral.integrar_lote(tabela[:, 0], tabela[:, 1], tabela[:, 2].astype(int),
+                                        funcao=funcao, regra=args.regra,
+                                        num_processos=args.processos)
+    _escrever(resultados, args.saida)
+
+
+def comando_moore(args):
+    # O arquivo é lido em pedaços pela regressão incremental.
+    lei_de_moore = _modulo("lei_de_moore")
+    regressao = lei_de_moore.ajustar_csv(
+        sys.stdin if args.arquivo in (None, "-") else args.arquivo)
+    a, b = regressao.coeficientes()
+    r2 = regressao.r2()
+
+    linhas = [f"a = {a:.17g}", f"b = {b:.17g}", f"r2 = {r2:.17g}"]
+    for ano in args.prever:
+        linhas.append(f"{ano:g} {lei_de_moore.calcular_transistores(ano, a, b):.17g}")
+    texto = "\n".join(linhas) + "\n"
+
+    if args.saida in (None, "-"):
+        sys.stdout.write(texto)
+    else:
+        with open(args.saida, "w", encoding="utf-8") as arquivo:
+            arquivo.write(texto)
+
+
+def comando_desempenho(args):
+    desempenho = _modulo("desempenho")
+    resultados = desempenho.executar_suite(
+        args.filtro, args.repeticoes, args.semente, args.escala,
+        progresso=lambda r: print(desempenho.formatar_registro(r), file=sys.stderr))
+    texto = json.dumps(resultados, indent=2, ensure_ascii=False) + "\n"
+    if args.saida in (None, "-"):
+        sys.stdout.write(texto)
+    else:
+        desempenho.salvar_resultados(resultados, args.saida)
+
+
+def comando_desempenho_comparar(args):
+    desempenho = _modulo("desempenho")
+    comparacao = desempenho.comparar(desempenho.carregar_resultados(args.antes),
+                                     desempenho.carregar_resultados(args.depois), args.limiar)
+    print(desempenho.formatar_comparacao(comparacao))
+    regressoes = sum(1 for *_, situacao in comparacao if situacao == "regressão")
+    if regressoes:
+        print(f"{regressoes} regressões acima de {args.limiar:.0%}.", file=sys.stderr)
+    return 1 if regressoes else 0
+
+
+def comando_interativo(args):
+    _modulo(PROGRAMAS_INTERATIVOS[args.programa]).main()
+
+
+def criar_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m calculo_numerico",
+        description="Métodos de Cálculo Numérico em lote (sem perguntas ao usuário).")
+    parser.add_argument("--perfil", metavar="ARQUIVO",
+                        help="instrumenta a execução e grava o perfil (.json: Chrome trace; "
+                             ".folded: pilhas para flamegraph)")
+    parser.add_argument("--perfil-memoria", action="store_true",
+                        help="com --perfil, registra também o pico de memória de cada fase")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    def comando(nome, executar, ajuda):
+        p = sub.add_parser(nome, help=ajuda)
+        p.set_defaults(executar=executar)
+        if nome != "interativo":
+            p.add_argument("arquivo", nargs="?", help="arquivo de entrada (padrão: entrada padrão)")
+            p.add_argument("-o", "--saida", help="arquivo de saída (padrão: saída padrão)")
+        if nome in ("gauss", "gauss-seidel"):
+            p.add_argument("--matriz", help="matriz A em .npy, binário float64 ou triplas")
+            p.add_argument("--vetor", help="vetor b em .npy, texto ou binário float64")
+            p.add_argument("--triplas", action="store_true",
+                           help="--matriz contém triplas (i, j, valor)")
+        return p
+
+    p = comando("gauss", comando_gauss, "resolve A·x = b por fatoração LU")
+    p.add_argument("--precisao", default="dupla", choices=["dupla", "mista"],
+                   help="mista: fatoração em float32 com refinamento iterativo em float64")
+
+    p = comando("gauss-seidel", comando_gauss_seidel, "resolve A·x = b por método iterativo")
+    p.add_argument("--metodo", default="gauss-seidel",
+                   choices=["gauss-seidel", "sor", "ssor", "multicolor", "cg", "bicgstab"])
+    p.add_argument("--tol", type=float, default=1e-8)
+    p.add_argument("--max-iter", type=int, default=10000)
+    p.add_argument("--omega", default="auto", help="fator de relaxação para sor/ssor (ou 'auto')")
+    p.add_argument("--precondicionador", choices=["jacobi", "gauss-seidel"])
+    p.add_argument("--processos", type=int, help="threads do método multicolor")
+    p.add_argument("--exibir-iteracoes", action="store_true",
+                   help="mostra o erro de cada iteração (e, periodicamente, o resíduo) "
+                        "na saída de erro (gauss-seidel, sor, ssor, multicolor)")
+
+    p = comando("integral", comando_integral, "integra f em cada linha 'a b n'")
+    p.add_argument("--regra", default="simpson", choices=["simpson", "trapezios"])
+    p.add_argument("--funcao", help="expressão em x (padrão: f do módulo integral)")
+    p.add_argument("--processos", type=int, help="número de processos (padrão: todos os núcleos)")
+
+    p = comando("moore", comando_moore, "ajusta log10(N) = a + b·ano")
+    p.add_argument("--prever", type=float, nargs="*", default=[], metavar="ANO")
+
+    p = comando("interativo", comando_interativo, "executa um programa interativo original")
+    p.add_argument("programa", choices=sorted(PROGRAMAS_INTERATIVOS))
+
+    p = sub.add_parser("desempenho", help="mede os métodos e grava os resultados em JSON")
+    p.set_defaults(executar=comando_desempenho)
+    p.add_argument("-o", "--saida", help="arquivo JSON (padrão: saída padrão)")
+    p.add_argument("--filtro", help="mede só os casos cujo nome contém este texto")
+    p.add_argument("--repeticoes", type=int, default=3)
+    p.add_argument("--semente", type=int, default=0)
+    p.add_argument("--escala", type=float, default=1.0,
+                   help="fator aplicado aos tamanhos (ex.: 0.1 para uma execução rápida)")
+
+    p = sub.add_parser("desempenho-comparar", help="compara duas execuções de desempenho")
+    p.set_defaults(executar=comando_desempenho_comparar)
+    p.add_argument("antes")
+    p.add_argument("depois")
+    p.add_argument("--limiar", type=float, default=0.10,
+                   help="aumento relativo de tempo considerado regressão (padrão: 0.10)")
+
+    return parser
+
+
+def _executar_com_perfil(args):
+    instrumentacao = _modulo("instrumentacao")
+    with instrumentacao.instrumentar(memoria=args.perfil_memoria) as estatisticas:
+        with estatisticas.fase(f"cli/{args.comando}"):
+            codigo = args.executar(args)
+    print(estatisticas.resumo(), file=sys.stderr)
+    if args.perfil.endswith((".folded", ".txt")):
+        estatisticas.salvar_pilhas(args.perfil)
+    else:
+        estatisticas.salvar_chrome_trace(args.perfil)
+    return codigo
+
+
+def main(argv=None):
+    args = criar_parser().parse_args(argv)
+    try:
+        if args.perfil:
+            return _executar_com_perfil(args) or 0
+        return args.executar(args) or 0
+    except (OSError, ValueError) as erro:
+        print(f"Erro: {erro}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
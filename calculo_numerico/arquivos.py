@@ -0,0 +1,221 @@
+# ===================================================================
+# MÓDULO: Leitura e gravação de sistemas lineares em arquivos
+#
+# Descrição:
+#   Carrega matrizes grandes geradas por outros programas sem passar
+#   pela digitação coeficiente a coeficiente:
+#     - matrizes densas .npy ou binárias cruas (float64) são abertas
+#       por mapeamento em memória (memmap): só as partes usadas são
+#       lidas do disco;
+#     - matrizes esparsas em triplas (i, j, valor), em texto ou em
+#       binário, são lidas em pedaços e montadas direto no formato CSR,
+#       sem listas Python intermediárias.
+#   Também grava as soluções nos mesmos formatos.
+#
+#   Convenções: índices começam em 0; arquivos terminados em .npy
+#   usam o formato do numpy, .txt/.csv são texto e qualquer outra
+#   extensão é tratada como binário cru.
+# ===================================================================
+
+import os
+
+import numpy as np
+
+from .gauss_seidel import MatrizCSR
+from .instrumentacao import instrumentado
+
+# Registro binário de uma tripla: linha, coluna (int64) e valor (float64)
+TIPO_TRIPLA = np.dtype([("i", "<i8"), ("j", "<i8"), ("valor", "<f8")])
+
+TAMANHO_PEDACO_TRIPLAS = 1 << 20   # triplas lidas por vez
+EXTENSOES_TEXTO = (".txt", ".csv")
+
+
+def _eh_texto(caminho):
+    return os.path.splitext(str(caminho))[1].lower() in EXTENSOES_TEXTO
+
+
+@instrumentado("arquivos/matriz_densa")
+def carregar_matriz_densa(caminho, formato=None, dtype=np.float64):
+    """
+    Abre uma matriz densa por mapeamento em memória (somente leitura).
+
+    Para .npy o formato vem do próprio arquivo. Para binário cru é
+    preciso informar `formato` (linhas, colunas); se omitido, supõe-se
+    uma matriz quadrada e n é deduzido do tamanho do arquivo.
+    """
+    if str(caminho).endswith(".npy"):
+        return np.load(caminho, mmap_mode="r")
+
+    if formato is None:
+        elementos = os.path.getsize(caminho) // np.dtype(dtype).itemsize
+        n = int(round(elementos ** 0.5))
+        if n * n != elementos:
+            raise ValueError(f"O arquivo tem {elementos} valores, que não formam uma matriz quadrada.")
+        formato = (n, n)
+    return np.memmap(caminho, dtype=dtype, mode="r", shape=tuple(formato))
+
+
+@instrumentado("arquivos/vetor")
+def carregar_vetor(caminho, dtype=np.float64):
+    """Abre um vetor (.npy, texto ou binário cru) por mapeamento em memória."""
+    if str(caminho).endswith(".npy"):
+        return np.load(caminho, mmap_mode="r")
+    if _eh_texto(caminho):
+        return np.loadtxt(caminho, delimiter="," if str(caminho).endswith(".csv") else None, ndmin=1)
+    return np.memmap(caminho, dtype=dtype, mode="r")
+
+
+@instrumentado("arquivos/salvar_solucao")
+def salvar_solucao(caminho, x):
+    """Grava o vetor solução em .npy, texto (.txt/.csv) ou binário cru."""
+    x = np.asarray(x, dtype=np.float64)
+    if str(caminho).endswith(".npy"):
+        np.save(caminho, x)
+    elif _eh_texto(caminho):
+        np.savetxt(caminho, x, fmt="%.17g")
+    else:
+        x.tofile(caminho)
+
+
+def _pedacos_triplas(caminho, tamanho_pedaco):
+    """Gera as triplas do arquivo em pedaços (linhas, colunas, valores)."""
+    if _eh_texto(caminho):
+        with open(caminho, encoding="utf-8") as arquivo:
+            while True:
+                linhas = [linha.replace(",", " ") for _, linha in zip(range(tamanho_pedaco), arquivo)]
+                if not linhas:
+                    return
+                tabela = np.loadtxt(linhas, ndmin=2)
+                if tabela.size:
+                    yield (tabela[:, 0].astype(np.int64), tabela[:, 1].astype(np.int64),
+                           tabela[:, 2])
+    else:
+        with open(caminho, "rb") as arquivo:
+            while True:
+                registros = np.fromfile(arquivo, dtype=TIPO_TRIPLA, count=tamanho_pedaco)
+                if registros.size == 0:
+                    return
+                yield registros["i"], registros["j"], registros["valor"]
+
+
+def _pedacos_densa(A, linhas_por_bloco):
+    """Gera os coeficientes não nulos de uma matriz densa, bloco de linhas por bloco."""
+    for inicio in range(0, A.shape[0], linhas_por_bloco):
+        bloco = np.asarray(A[inicio:inicio + linhas_por_bloco])
+        linhas, colunas = np.nonzero(bloco)
+        yield linhas + inicio, colunas, bloco[linhas, colunas]
+
+
+@instrumentado("arquivos/montagem_csr", lambda r, _: {"nnz": r.nnz})
+def montar_csr_em_pedacos(gerar_pedacos, n=None, tamanho_pedaco=TAMANHO_PEDACO_TRIPLAS):
+    """
+    Monta uma MatrizCSR a partir de pedaços (linhas, colunas, valores).
+
+    `gerar_pedacos` é uma função sem argumentos que devolve um iterador
+    novo sobre os pedaços; ela é chamada duas vezes:
+      1ª passada: conta os coeficientes de cada linha (e descobre n);
+      2ª passada: copia cada pedaço direto para a posição final nos
+                  arrays do CSR.
+    Assim a memória fica próxima do tamanho da matriz final, mais um
+    pedaço. Cada coeficiente é guardado com a chave única linha·n +
+    coluna (da qual a coluna é recuperada no fim), o que permite
+    ordenar e somar triplas repetidas sem arrays extras de índices.
+    Zeros são descartados. Sem nenhuma tripla, devolve a matriz nula
+    n×n se `n` for informado; caso contrário levanta ValueError.
+    """
+    contagem = np.zeros(0 if n is None else n, dtype=np.int64)
+    maior_indice = -1
+    for linhas, colunas, valores in gerar_pedacos():
+        if linhas.size == 0:
+            continue
+        if linhas.min() < 0 or colunas.min() < 0:
+            raise ValueError("Índices negativos no arquivo de triplas (os índices começam em 0).")
+        maior_indice = max(maior_indice, int(linhas.max()), int(colunas.max()))
+        if maior_indice >= contagem.shape[0]:
+            if n is not None:
+                raise ValueError(f"Índice {maior_indice} fora de uma matriz {n}×{n}.")
+            contagem = np.concatenate([contagem, np.zeros(maior_indice + 1 - contagem.shape[0],
+                                                          dtype=np.int64)])
+        contagem += np.bincount(linhas, minlength=contagem.shape[0])
+
+    n = contagem.shape[0] if n is None else n
+    if n == 0:
+        raise ValueError("Nenhuma tripla encontrada: não é possível deduzir a ordem da matriz.")
+    ponteiros = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(contagem, out=ponteiros[1:])
+    valores_csr = np.empty(ponteiros[-1])
+    chaves_csr = np.empty(ponteiros[-1], dtype=np.int64)
+
+    cursor = ponteiros[:-1].copy()
+    for linhas, colunas, valores in gerar_pedacos():
+        if linhas.size == 0:
+            continue
+        ordem = np.argsort(linhas, kind="stable")
+        linhas = linhas[ordem]
+        # Posição de cada tripla dentro do grupo da sua linha no pedaço
+        inicio_grupo = np.searchsorted(linhas, linhas)
+        destino = cursor[linhas] + np.arange(linhas.shape[0]) - inicio_grupo
+        valores_csr[destino] = valores[ordem]
+        chaves_csr[destino] = linhas * n + colunas[ordem]
+        cursor += np.bincount(linhas, minlength=n)
+
+    linhas = colunas = valores = cursor = None
+
+    # Ordena as colunas de cada linha e soma as triplas repetidas.
+    if np.any(chaves_csr[1:] <= chaves_csr[:-1]):
+        _ordenar_por_faixas(valores_csr, chaves_csr, ponteiros, tamanho_pedaco)
+        inicios = np.flatnonzero(np.concatenate(([True], chaves_csr[1:] != chaves_csr[:-1])))
+        if inicios.shape[0] != chaves_csr.shape[0]:
+            valores_csr = np.add.reduceat(valores_csr, inicios)
+            chaves_csr = chaves_csr[inicios]
+        del inicios
+
+    mantidos = valores_csr != 0.0
+    if not np.all(mantidos):
+        chaves_csr, valores_csr = chaves_csr[mantidos], valores_csr[mantidos]
+    del mantidos
+
+    np.cumsum(np.bincount(chaves_csr // n, minlength=n), out=ponteiros[1:])
+    colunas_csr = chaves_csr % n
+    del chaves_csr
+    return MatrizCSR(valores_csr, colunas_csr, ponteiros, n)
+
+
+def _ordenar_por_faixas(valores, chave, ponteiros, tamanho_pedaco):
+    """
+    Ordena, no próprio lugar, os coeficientes pela chave linha·n + coluna.
+
+    Como os coeficientes já estão agrupados por linha, basta ordenar
+    cada faixa de linhas separadamente, com faixas de cerca de
+    `tamanho_pedaco` coeficientes; assim a ordenação não precisa de
+    arrays auxiliares do tamanho da matriz inteira.
+    """
+    nnz = chave.shape[0]
+    cortes = np.unique(np.searchsorted(ponteiros, np.arange(0, nnz, tamanho_pedaco)))
+    limites = np.append(ponteiros[np.minimum(cortes, ponteiros.shape[0] - 1)], nnz)
+    for inicio, fim in zip(limites[:-1], limites[1:]):
+        ordem = np.argsort(chave[inicio:fim], kind="stable")
+        chave[inicio:fim] = chave[inicio:fim][ordem]
+        valores[inicio:fim] = valores[inicio:fim][ordem]
+
+
+def carregar_triplas_csr(caminho, n=None, tamanho_pedaco=TAMANHO_PEDACO_TRIPLAS):
+    """
+    Lê um arquivo de triplas (i, j, valor) em pedaços e devolve uma
+    MatrizCSR n×n. Em texto, uma tripla por linha (espaços ou vírgulas);
+    em binário, registros TIPO_TRIPLA. Sem `n`, usa o maior índice + 1.
+    """
+    return montar_csr_em_pedacos(lambda: _pedacos_triplas(caminho, tamanho_pedaco), n,
+                                 tamanho_pedaco)
+
+
+def carregar_densa_csr(caminho, formato=None, linhas_por_bloco=1024):
+    """
+    Converte uma matriz densa em arquivo (.npy ou binário cru) para CSR,
+    lendo um bloco de linhas por vez do mapeamento em memória.
+    """
+    A = carregar_matriz_densa(caminho, formato)
+    if A.shape[0] != A.shape[1]:
+        raise ValueError("A matriz de coeficientes deve ser quadrada.")
+    return montar_csr_em_pedacos(lambda: _pedacos_densa(A, linhas_por_bloco), A.shape[0])
@@ -0,0 +1,488 @@
+# ===================================================================
+# MÓDULO: Medições de desempenho (benchmarks)
+#
+# Descrição:
+#   Mede os solucionadores e integradores do pacote em problemas
+#   sintéticos reproduzíveis (sementes fixas), variando o tamanho:
+#     - sistemas densos aleatórios e sistemas esparsos diagonalmente
+#       dominantes (eliminação de Gauss, LU, cache de fatores, lote,
+#       banda, precisão mista, Gauss-Seidel/SOR/SSOR, multicolorido,
+#       Gradientes Conjugados, BiCGSTAB);
+#     - integrandos polinomiais e oscilatórios (trapézios, Simpson,
+#       Simpson adaptativo, Romberg, integração em lote);
+#     - regressões com muitos dados (Lei de Moore incremental, por CSV
+#       e por séries; mínimos quadrados);
+#     - montagem de treliças.
+#   Para cada caso e tamanho registra o tempo de parede (menor de
+#   várias repetições), o pico de memória alocada (tracemalloc) e a
+#   vazão, e grava tudo em JSON. O expoente empírico t ∝ tamanho^p de
+#   cada caso resume a curva de escalonamento.
+#
+#   Duas execuções podem ser comparadas para apontar regressões:
+#     python -m calculo_numerico desempenho -o antes.json
+#     (altera o código)
+#     python -m calculo_numerico desempenho -o depois.json
+#     python -m calculo_numerico desempenho-comparar antes.json depois.json
+# ===================================================================
+
+import io
+import json
+import math
+import platform
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+
+VERSAO_FORMATO = 1
+REPETICOES = 3
+LIMIAR_REGRESSAO = 0.10   # 10% mais lento já é regressão
+
+
+class Caso:
+    """
+    Um problema de medição. `preparar(tamanho, rng)` monta os dados
+    (fora da medição) e devolve (executar, quantidade): `executar` é a
+    função sem argumentos que é cronometrada e `quantidade` é o trabalho
+    feito por execução, na `unidade` informada, para o cálculo da vazão.
+    """
+
+    def __init__(self, nome, preparar, tamanhos, unidade):
+        self.nome = nome
+        self.preparar = preparar
+        self.tamanhos = tamanhos
+        self.unidade = unidade
+
+
+# ---------------------------------------------------------------
+# Geradores de problemas
+# ---------------------------------------------------------------
+def sistema_denso(n, rng):
+    """Sistema denso aleatório bem condicionado (diagonal reforçada)."""
+    A = rng.standard_normal((n, n)) + np.sqrt(n) * np.eye(n)
+    return A, rng.standard_normal(n)
+
+
+def sistema_esparso_dominante(n, rng, por_linha=8):
+    """MatrizCSR n×n aleatória, estritamente diagonalmente dominante."""
+    from .gauss_seidel import MatrizCSR
+
+    linhas = np.repeat(np.arange(n), por_linha)
+    colunas = rng.integers(0, n, n * por_linha)
+    valores = rng.uniform(-1.0, 1.0, n * por_linha)
+    fora = linhas != colunas
+    linhas, colunas, valores = linhas[fora], colunas[fora], valores[fora]
+    diagonal = np.bincount(linhas, weights=np.abs(valores), minlength=n) + 1.0
+    A = MatrizCSR.de_triplas(np.concatenate([linhas, np.arange(n)]),
+                             np.concatenate([colunas, np.arange(n)]),
+                             np.concatenate([valores, diagonal]), n)
+    return A, rng.standard_normal(n)
+
+
+def sistema_poisson(m):
+    """Laplaciano 2-D de 5 pontos numa grade m×m (simétrico positivo definido)."""
+    from .gauss_seidel import MatrizCSR
+
+    no = np.arange(m * m).reshape(m, m)
+    pares = [(no, no, 4.0), (no[1:], no[:-1], -1.0), (no[:-1], no[1:], -1.0),
+             (no[:, 1:], no[:, :-1], -1.0), (no[:, :-1], no[:, 1:], -1.0)]
+    linhas = np.concatenate([i.ravel() for i, _, _ in pares])
+    colunas = np.concatenate([j.ravel() for _, j, _ in pares])
+    valores = np.concatenate([np.full(i.size, v) for i, _, v in pares])
+    return MatrizCSR.de_triplas(linhas, colunas, valores, m * m), np.ones(m * m)
+
+
+def _flops_lu(n):
+    return 2.0 * n ** 3 / 3.0
+
+
+# ---------------------------------------------------------------
+# Casos medidos
+# ---------------------------------------------------------------
+def _gauss_original(n, rng):
+    from . import gauss
+
+    A, b = sistema_denso(n, rng)
+    base = [[0.0] * (n + 2)] + [[0.0] + A[i].tolist() + [b[i]] for i in range(n)]
+
+    def executar():
+        matriz = [linha.copy() for linha in base]
+        gauss.triangularizar_matriz(matriz, n)
+        gauss.substituicao_retroativa(matriz, [0.0] * (n + 1), n)
+    return executar, _flops_lu(n)
+
+
+def _gauss_lu(n, rng):
+    from . import gauss
+
+    A, b = sistema_denso(n, rng)
+    return (lambda: gauss.resolver_lu(*gauss.fatorar_lu(A), b)), _flops_lu(n)
+
+
+def _gauss_precisao_mista(n, rng):
+    from . import gauss
+
+    A, b = sistema_denso(n, rng)
+    return (lambda: gauss.resolver_precisao_mista(A, b)), _flops_lu(n)
+
+
+def _gauss_cache(n, rng, vetores=16):
+    from . import gauss
+
+    A, _ = sistema_denso(n, rng)
+    B = rng.standard_normal((vetores, n))
+    solucionador = gauss.SolucionadorLU()
+    solucionador.fatores(A)
+
+    def executar():
+        # Só acertos no cache: impressão digital de A + substituições.
+        for b in B:
+            solucionador.resolver(A, b)
+    return executar, vetores
+
+
+def _gauss_lote(lote, rng, n=8):
+    from . import gauss
+
+    A = rng.standard_normal((lote, n, n)) + np.sqrt(n) * np.eye(n)
+    b = rng.standard_normal((lote, n))
+    return (lambda: gauss.resolver_lote(A, b)), lote
+
+
+def _gauss_banda(n, rng):
+    from . import gauss
+
+    inferior = superior = 5
+    banda = rng.standard_normal((n, inferior + superior + 1))
+    banda[:, inferior] += inferior + superior + 1
+    b = rng.standard_normal(n)
+
+    def executar():
+        lu, pivos = gauss.fatorar_lu_banda(banda, inferior)
+        gauss.resolver_lu_banda(lu, pivos, inferior, b)
+    return executar, 2.0 * n * inferior * (inferior + superior)
+
+
+def _gauss_seidel(n, rng):
+    from . import gauss_seidel
+
+    A, b = sistema_esparso_dominante(n, rng)
+    executar = lambda: gauss_seidel.gauss_seidel_csr(A, b, 1e-8, 10000)
+    # Cada varredura percorre os nnz coeficientes uma vez; o número de
+    # varreduras (determinístico para os mesmos dados) vem de uma execução.
+    return executar, A.nnz * executar()[1]
+
+
+def _sor_automatico(m, rng, simetrico=False):
+    from . import gauss_seidel
+
+    A, b = sistema_poisson(m)
+    executar = lambda: gauss_seidel.sor_csr(A, b, 1e-8, 100 * A.n, "auto", simetrico)
+    # Vazão por iteração (no SSOR, cada iteração após a estimativa de ω
+    # são duas varreduras).
+    return executar, A.nnz * executar()[1]
+
+
+def _ssor_automatico(m, rng):
+    return _sor_automatico(m, rng, simetrico=True)
+
+
+def _multicolor(n, rng):
+    from . import gauss_seidel
+
+    A, b = sistema_esparso_dominante(n, rng)
+    executar = lambda: gauss_seidel.gauss_seidel_multicolor(A, b, 1e-8, 10000)
+    return executar, A.nnz * executar()[1]
+
+
+def _bicgstab(n, rng):
+    from . import gauss_seidel
+
+    A, b = sistema_esparso_dominante(n, rng)
+    executar = lambda: gauss_seidel.bicgstab(A, b, 1e-8, 10 * A.n, precondicionador="jacobi")
+    return executar, A.n
+
+
+def _gradientes_conjugados(m, rng):
+    from . import gauss_seidel
+
+    A, b = sistema_poisson(m)
+    executar = lambda: gauss_seidel.gradientes_conjugados(A, b, 1e-8, 10 * A.n,
+                                                          precondicionador="jacobi")
+    return executar, A.n
+
+
+def _trapezios_original(n, rng):
+    from . import integral
+
+    return (lambda: integral.trapezios(0.0, 5.0, n)), n
+
+
+def _simpson_original(n, rng):
+    from . import integral
+
+    return (lambda: integral.simpson(0.0, 5.0, n)), n + 1
+
+
+def _trapezios_vetorizado(n, rng):
+    from . import integral
+
+    return (lambda: integral.trapezios_vetorizado(0.0, 5.0, n, integral.f)), n + 1
+
+
+def _simpson_polinomio(n, rng):
+    from . import integral
+
+    return (lambda: integral.simpson_vetorizado(0.0, 5.0, n, integral.f)), n
+
+
+def _simpson_oscilatorio(n, rng):
+    from . import integral
+
+    funcao = integral.compilar_integrando("sin(50*x) * exp(-x)")
+    return (lambda: integral.simpson_vetorizado(0.0, 5.0, n, funcao)), n
+
+
+def _romberg_oscilatorio(frequencia, rng):
+    from . import integral
+
+    funcao = integral.compilar_integrando(f"sin({frequencia}*x) * exp(-x)")
+    executar = lambda: integral.romberg(0.0, 5.0, 1e-10, 1e-10, funcao)
+    return executar, executar()[2]
+
+
+def _simpson_adaptativo(frequencia, rng):
+    from . import integral
+
+    funcao = integral.compilar_integrando(f"sin({frequencia}*x) * exp(-x)")
+    executar = lambda: integral.simpson_adaptativo(0.0, 5.0, 1e-10, 1e-10, funcao)
+    return executar, executar()[2]
+
+
+def _integral_lote(lote, rng, n=100):
+    from . import integral
+
+    a = rng.uniform(0.0, 1.0, lote)
+    b = a + rng.uniform(0.5, 5.0, lote)
+    # Um processo só: mede a integração, não a criação do pool.
+    executar = lambda: integral.integrar_lote(a, b, n, integral.f, num_processos=1)
+    return executar, lote * (n + 1)
+
+
+def _regressao_incremental(n, rng):
+    from . import lei_de_moore
+
+    anos = rng.uniform(1970.0, 2030.0, n)
+    log_n = 0.15 * anos - 290.0 + rng.normal(0.0, 0.1, n)
+    return (lambda: lei_de_moore.RegressaoIncremental().adicionar_lote(anos, log_n)), n
+
+
+def _ajuste_csv(n, rng):
+    from . import lei_de_moore
+
+    anos = rng.integers(1970, 2030, n)
+    transistores = 10.0 ** (0.15 * anos - 290.0 + rng.normal(0.0, 0.1, n))
+    texto = "".join(f"{a},{t:.6g}\n" for a, t in zip(anos, transistores))
+    return (lambda: lei_de_moore.ajustar_csv(io.StringIO(texto))), n
+
+
+def _regressao_series(n, rng):
+    from . import lei_de_moore
+
+    series = rng.integers(0, 1000, n)
+    anos = rng.uniform(1970.0, 2030.0, n)
+    log_n = 0.15 * anos - 290.0 + rng.normal(0.0, 0.1, n)
+    return (lambda: lei_de_moore.ajustar_series(series, anos, log_n)), n
+
+
+def _minimos_quadrados(n, rng):
+    from . import minimos_quadrados
+
+    x = rng.uniform(1970.0, 2030.0, n)
+    y = 0.15 * x - 290.0 + rng.normal(0.0, 0.1, n)
+    return (lambda: minimos_quadrados.ajustar_polinomio(x, y, 3)), n
+
+
+def _montagem_trelica(paineis, rng):
+    from . import trelicas
+
+    trelica = trelicas.trelica_retangular(paineis, paineis)
+    return trelica.sistema, trelica.barras.shape[0]
+
+
+CASOS = [
+    Caso("gauss/eliminacao_original", _gauss_original, [20, 40, 80], "flop/s"),
+    Caso("gauss/lu", _gauss_lu, [200, 400, 800], "flop/s"),
+    Caso("gauss/precisao_mista", _gauss_precisao_mista, [200, 400, 800], "flop/s"),
+    Caso("gauss/cache_lu", _gauss_cache, [200, 400, 800], "resoluções/s"),
+    Caso("gauss/lote", _gauss_lote, [1000, 10000, 100000], "sistemas/s"),
+    Caso("gauss/banda", _gauss_banda, [2000, 8000, 32000], "flop/s"),
+    Caso("gauss_seidel/csr", _gauss_seidel, [1000, 4000, 16000], "nnz/s"),
+    Caso("gauss_seidel/sor_automatico", _sor_automatico, [8, 16, 32], "nnz/s"),
+    Caso("gauss_seidel/ssor_automatico", _ssor_automatico, [8, 16, 32],
+         "nnz·iterações/s"),
+    Caso("gauss_seidel/multicolor", _multicolor, [1000, 4000, 16000], "nnz/s"),
+    Caso("gauss_seidel/bicgstab", _bicgstab, [1000, 4000, 16000], "incógnitas/s"),
+    Caso("gauss_seidel/gradientes_conjugados", _gradientes_conjugados, [32, 64, 128],
+         "incógnitas/s"),
+    Caso("integral/trapezios_original", _trapezios_original, [10000, 40000, 160000],
+         "avaliações/s"),
+    Caso("integral/simpson_original", _simpson_original, [10000, 40000, 160000],
+         "avaliações/s"),
+    Caso("integral/trapezios_vetorizado", _trapezios_vetorizado, [10 ** 5, 10 ** 6, 10 ** 7],
+         "avaliações/s"),
+    Caso("integral/simpson_polinomio", _simpson_polinomio, [10 ** 5, 10 ** 6, 10 ** 7],
+         "avaliações/s"),
+    Caso("integral/simpson_oscilatorio", _simpson_oscilatorio, [10 ** 5, 10 ** 6, 10 ** 7],
+         "avaliações/s"),
+    Caso("integral/romberg_oscilatorio", _romberg_oscilatorio, [10, 50, 250], "avaliações/s"),
+    Caso("integral/simpson_adaptativo", _simpson_adaptativo, [10, 50, 250], "avaliações/s"),
+    Caso("integral/lote", _integral_lote, [1000, 10000, 100000], "avaliações/s"),
+    Caso("lei_de_moore/regressao_incremental", _regressao_incremental,
+         [10 ** 5, 10 ** 6, 4 * 10 ** 6], "linhas/s"),
+    Caso("lei_de_moore/ajuste_csv", _ajuste_csv, [10 ** 4, 10 ** 5, 10 ** 6], "linhas/s"),
+    Caso("lei_de_moore/series", _regressao_series, [10 ** 5, 10 ** 6, 4 * 10 ** 6], "linhas/s"),
+    Caso("minimos_quadrados/polinomio", _minimos_quadrados, [10 ** 5, 10 ** 6, 4 * 10 ** 6],
+         "linhas/s"),
+    Caso("trelicas/montagem", _montagem_trelica, [50, 100, 200], "barras/s"),
+]
+
+
+# ---------------------------------------------------------------
+# Execução
+# ---------------------------------------------------------------
+def medir(caso, tamanho, repeticoes=REPETICOES, semente=0):
+    """Mede um caso em um tamanho e devolve o registro (dicionário)."""
+    executar, quantidade = caso.preparar(tamanho, np.random.default_rng(semente))
+
+    # Uma execução extra só para o pico de memória (tracemalloc atrasa o
+    # código); ela também serve de aquecimento para as medições de tempo.
+    ja_rastreando = tracemalloc.is_tracing()
+    if not ja_rastreando:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    executar()
+    pico = tracemalloc.get_traced_memory()[1] - base
+    if not ja_rastreando:
+        tracemalloc.stop()
+
+    tempos = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        executar()
+        tempos.append(time.perf_counter() - inicio)
+
+    tempo = min(tempos)
+    return {
+        "caso": caso.nome,
+        "tamanho": tamanho,
+        "tempo_s": tempo,
+        "tempos_s": tempos,
+        "memoria_pico_bytes": int(pico),
+        "vazao": quantidade / tempo if tempo > 0.0 else math.inf,
+        "unidade": caso.unidade,
+    }
+
+
+def expoente_escalonamento(registros):
+    """Inclinação de log(tempo) × log(tamanho): t ∝ tamanho^expoente."""
+    if len(registros) < 2:
+        return None
+    tamanhos = np.log([r["tamanho"] for r in registros])
+    tempos = np.log([max(r["tempo_s"], 1e-9) for r in registros])
+    return float(np.polyfit(tamanhos, tempos, 1)[0])
+
+
+def executar_suite(filtro=None, repeticoes=REPETICOES, semente=0, escala=1.0,
+                   progresso=None):
+    """
+    Mede todos os casos (ou os que contêm `filtro` no nome) em todos os
+    tamanhos e devolve o dicionário que é gravado em JSON. `escala`
+    multiplica os tamanhos (0.1 para uma execução rápida, por exemplo).
+    """
+    resultados, escalonamento = [], {}
+    for caso in CASOS:
+        if filtro and filtro not in caso.nome:
+            continue
+        registros = []
+        # Com escalas pequenas, tamanhos diferentes podem virar o mesmo;
+        # cada (caso, tamanho) é medido uma vez só (é a chave de comparar()).
+        tamanhos = dict.fromkeys(max(2, int(round(t * escala))) for t in caso.tamanhos)
+        for tamanho in tamanhos:
+            registros.append(medir(caso, tamanho, repeticoes, semente))
+            if progresso:
+                progresso(registros[-1])
+        resultados.extend(registros)
+        escalonamento[caso.nome] = expoente_escalonamento(registros)
+
+    return {
+        "versao": VERSAO_FORMATO,
+        "data": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "ambiente": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "plataforma": platform.platform(),
+            "processador": platform.processor() or platform.machine(),
+        },
+        "parametros": {"repeticoes": repeticoes, "semente": semente, "escala": escala},
+        "resultados": resultados,
+        "escalonamento": escalonamento,
+    }
+
+
+def salvar_resultados(resultados, caminho):
+    with open(caminho, "w", encoding="utf-8") as arquivo:
+        json.dump(resultados, arquivo, indent=2, ensure_ascii=False)
+
+
+def carregar_resultados(caminho):
+    with open(caminho, encoding="utf-8") as arquivo:
+        resultados = json.load(arquivo)
+    if resultados.get("versao") != VERSAO_FORMATO:
+        raise ValueError(f"{caminho}: formato de resultados desconhecido.")
+    return resultados
+
+
+# ---------------------------------------------------------------
+# Comparação de duas execuções
+# ---------------------------------------------------------------
+def comparar(base, nova, limiar=LIMIAR_REGRESSAO):
+    """
+    Compara os tempos de duas execuções (caso e tamanho iguais).
+    Retorna uma lista de (caso, tamanho, tempo_base, tempo_novo, razão,
+    situação), com situação "regressão" (razão > 1 + limiar), "melhora"
+    (razão < 1 - limiar) ou "igual".
+    """
+    tempos_base = {(r["caso"], r["tamanho"]): r["tempo_s"] for r in base["resultados"]}
+    comparacao = []
+    for r in nova["resultados"]:
+        chave = (r["caso"], r["tamanho"])
+        if chave not in tempos_base:
+            continue
+        razao = r["tempo_s"] / tempos_base[chave] if tempos_base[chave] > 0.0 else math.inf
+        if razao > 1.0 + limiar:
+            situacao = "regressão"
+        elif razao < 1.0 - limiar:
+            situacao = "melhora"
+        else:
+            situacao = "igual"
+        comparacao.append((r["caso"], r["tamanho"], tempos_base[chave], r["tempo_s"],
+                           razao, situacao))
+    return comparacao
+
+
+def formatar_registro(registro):
+    return (f"{registro['caso']:<38} {registro['tamanho']:>10} "
+            f"{registro['tempo_s']:>10.4f} s {registro['memoria_pico_bytes'] / 2 ** 20:>9.1f} MiB "
+            f"{registro['vazao']:>12.4g} {registro['unidade']}")
+
+
+def formatar_comparacao(comparacao):
+    linhas = [f"{'caso':<38} {'tamanho':>10} {'antes (s)':>10} {'depois (s)':>10} "
+              f"{'razão':>7}  situação"]
+    for caso, tamanho, antes, depois, razao, situacao in comparacao:
+        linhas.append(f"{caso:<38} {tamanho:>10} {antes:>10.4f} {depois:>10.4f} "
+                      f"{razao:>7.2f}  {situacao}")
+    return "\n".join(linhas)
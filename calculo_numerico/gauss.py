@@ -0,0 +1,897 @@
+# ===================================================================
+# PROGRAMA: Método de Eliminação de Gauss Simples
+# Descrição:
+#   Resolve sistemas lineares do tipo A·x = b usando eliminação de Gauss
+#   sem pivotamento. O método transforma a matriz aumentada [A|b] em
+#   uma matriz triangular superior, permitindo calcular a solução através
+#   da substituição retroativa.
+# ===================================================================
+
+# Importamos a biblioteca numpy para o motor de fatoração LU, que opera
+# sobre arrays contíguos de float64 em vez de listas de listas.
+# hashlib e OrderedDict são usados pelo cache de fatores (SolucionadorLU).
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+from .instrumentacao import instrumentado
+
+
+def obter_numero(mensagem):
+    # ---------------------------------------------------------------
+    # Solicita um número ao usuário com tratamento de erro.
+    # A entrada só é aceita quando for possível converter para float.
+    # Se o usuário digita algo inválido, o programa informa o erro
+    # e solicita novamente.
+    # ---------------------------------------------------------------
+    while True:
+        try:
+            valor = float(input(mensagem))   # tenta converter a entrada
+            return valor                     # retorna somente se for válido
+        except ValueError:
+            print("❌ Erro: Digite um número válido!")  # mensagem amigável
+
+
+def exibir_guia_entrada(numero_equacoes):
+    # ---------------------------------------------------------------
+    # Exibe uma representação visual da matriz aumentada [A|b].
+    # Isto ajuda o usuário a entender onde cada coeficiente será inserido.
+    # Apenas informativo — não realiza cálculos.
+    # ---------------------------------------------------------------
+    print("\n" + "=" * 70)
+    print("GUIA VISUAL - Posições da Matriz Aumentada [A|b]:")
+    print("=" * 70)
+    print("\nA matriz será lida conforme o formato abaixo:")
+    print("(Coeficientes) | (Termo Independente)\n")
+
+    linha_cabecalho = "Equação |"
+    for j in range(1, numero_equacoes + 1):
+        linha_cabecalho += f" X{j} |"
+    linha_cabecalho += " b |"
+    print(linha_cabecalho)
+    print("-" * len(linha_cabecalho))
+
+    for i in range(1, numero_equacoes + 1):
+        linha = f"   {i}    |"
+        for j in range(1, numero_equacoes + 1):
+            linha += f"a{i}{j}|"
+        linha += f"b{i}|"
+        print(linha)
+
+    print("\nExemplo: Para inserir a equação '2x₁ + 3x₂ = 8'")
+    print("         Insira: X1=2  X2=3  b=8")
+    print("=" * 70)
+
+
+def exibir_matriz(matriz, numero_equacoes, titulo):
+    # ---------------------------------------------------------------
+    # Exibe a matriz aumentada de forma organizada, com sinais e
+    # duas casas decimais para facilitar a visualização.
+    # ---------------------------------------------------------------
+    print(f"\n\n\n{titulo}")
+    print("=" * (numero_equacoes * 10 + 5))
+
+    for i in range(1, numero_equacoes + 1):
+        for j in range(1, numero_equacoes + 2):
+            print(f"{matriz[i][j]:+8.2f}", end=" ")
+        print()
+
+
+@instrumentado("gauss/eliminacao",
+              lambda _, arg: {"flops": 2 * arg["numero_equacoes"] ** 3 / 3})
+def triangularizar_matriz(matriz, numero_equacoes):
+    # ---------------------------------------------------------------
+    # Executa a eliminação de Gauss sem pivotamento.
+    # Sem pivotamento não há preenchimento fora da banda da matriz:
+    # abaixo da linha k só as `inferior` linhas seguintes têm algo a
+    # zerar, e a linha k só tem coeficientes até a coluna k + superior.
+    # Por isso os laços percorrem apenas a banda (e a coluna de b).
+    # ---------------------------------------------------------------
+    inferior, superior = largura_banda_lista(matriz, numero_equacoes)
+    coluna_b = numero_equacoes + 1
+    for k in range(1, numero_equacoes):
+        for i in range(k + 1, min(k + inferior, numero_equacoes) + 1):
+            multiplicador = (-1.0) * matriz[i][k] / matriz[k][k]
+            for j in range(k, min(k + superior, numero_equacoes) + 1):
+                matriz[i][j] = matriz[i][j] + multiplicador * matriz[k][j]
+            matriz[i][coluna_b] = matriz[i][coluna_b] + multiplicador * matriz[k][coluna_b]
+
+
+def largura_banda_lista(matriz, numero_equacoes):
+    # ---------------------------------------------------------------
+    # Larguras de banda (inferior, superior) da matriz aumentada
+    # 1-indexada: maiores distâncias i - j e j - i entre um coeficiente
+    # não nulo de A e a diagonal.
+    # ---------------------------------------------------------------
+    inferior = superior = 0
+    for i in range(1, numero_equacoes + 1):
+        for j in range(1, numero_equacoes + 1):
+            if matriz[i][j] != 0.0:
+                inferior = max(inferior, i - j)
+                superior = max(superior, j - i)
+    return inferior, superior
+
+
+@instrumentado("gauss/substituicao_retroativa",
+              lambda _, arg: {"flops": arg["numero_equacoes"] ** 2})
+def substituicao_retroativa(matriz, vetor_x, numero_equacoes):
+    # ---------------------------------------------------------------
+    # Resolve o sistema pela substituição retroativa.
+    # ---------------------------------------------------------------
+    for i in range(numero_equacoes, 0, -1):
+        vetor_x[i] = matriz[i][numero_equacoes + 1]
+        for j in range(numero_equacoes, i, -1):
+            vetor_x[i] -= vetor_x[j] * matriz[i][j]
+        vetor_x[i] = vetor_x[i] / matriz[i][i]
+
+
+# ===================================================================
+# MOTOR DE FATORAÇÃO LU (NUMPY)
+#   As funções abaixo são a versão vetorizada do processo acima, para
+#   sistemas grandes. Diferenças em relação à versão simples:
+#   - índices começam em 0 e A, b são arrays numpy (não a matriz
+#     aumentada 1-indexada);
+#   - usa pivotamento parcial (troca de linhas pelo maior pivô);
+#   - a eliminação é feita em blocos: fatora-se um painel de colunas
+#     com atualizações de posto 1 e depois a submatriz restante é
+#     atualizada de uma só vez com um produto de matrizes (GEMM);
+#   - os fatores L, U e a permutação são devolvidos e podem ser
+#     reutilizados para vários vetores b.
+# ===================================================================
+
+TAMANHO_BLOCO_LU = 64   # número de colunas de cada painel da fatoração
+
+
+@instrumentado("gauss/fatoracao_lu", lambda r, _: {"flops": 2 * r[0].shape[0] ** 3 / 3})
+def fatorar_lu(matriz_a, tamanho_bloco=TAMANHO_BLOCO_LU, dtype=np.float64):
+    # ---------------------------------------------------------------
+    # Fatora P·A = L·U com pivotamento parcial.
+    # Retorna (lu, perm):
+    #   lu   -> array n×n com U no triângulo superior (incluindo a
+    #           diagonal) e L abaixo da diagonal (a diagonal de L,
+    #           igual a 1, não é armazenada);
+    #   perm -> vetor de índices tal que A[perm] = L·U.
+    # `dtype` é a precisão dos fatores (np.float32 é usado pela
+    # resolução em precisão mista).
+    # Levanta ValueError se a matriz não for quadrada ou for singular.
+    # ---------------------------------------------------------------
+    lu = np.array(matriz_a, dtype=dtype, order="C", copy=True)
+    if lu.ndim != 2 or lu.shape[0] != lu.shape[1]:
+        raise ValueError("A matriz de coeficientes deve ser quadrada.")
+
+    n = lu.shape[0]
+    perm = np.arange(n)
+
+    for k0 in range(0, n, tamanho_bloco):
+        k1 = min(k0 + tamanho_bloco, n)
+
+        # 1) Fatoração do painel (colunas k0..k1-1) com atualizações de
+        #    posto 1 restritas às colunas do próprio painel.
+        for k in range(k0, k1):
+            p = k + int(np.argmax(np.abs(lu[k:, k])))
+            if lu[p, k] == 0.0:
+                raise ValueError(f"Matriz singular: pivô nulo na coluna {k + 1}.")
+            if p != k:
+                lu[[k, p]] = lu[[p, k]]
+                perm[[k, p]] = perm[[p, k]]
+
+            lu[k + 1:, k] /= lu[k, k]
+            lu[k + 1:, k + 1:k1] -= np.outer(lu[k + 1:, k], lu[k, k + 1:k1])
+
+        if k1 == n:
+            break
+
+        # 2) Linhas de U à direita do painel: U12 = L11⁻¹ · A12.
+        for k in range(k0, k1 - 1):
+            lu[k + 1:k1, k1:] -= np.outer(lu[k + 1:k1, k], lu[k, k1:])
+
+        # 3) Atualização da submatriz restante: A22 -= L21 · U12 (GEMM).
+        lu[k1:, k1:] -= lu[k1:, k0:k1] @ lu[k0:k1, k1:]
+
+    return lu, perm
+
+
+def separar_fatores(lu):
+    # ---------------------------------------------------------------
+    # Separa a forma compacta devolvida por fatorar_lu() nas matrizes
+    # L (triangular inferior com diagonal unitária) e U.
+    # ---------------------------------------------------------------
+    matriz_l = np.tril(lu, -1) + np.eye(lu.shape[0])
+    matriz_u = np.triu(lu)
+    return matriz_l, matriz_u
+
+
+def substituicao_progressiva_vetorizada(lu, vetor_b):
+    # ---------------------------------------------------------------
+    # Resolve L·y = b (L com diagonal unitária), linha a linha, com
+    # cada linha calculada por um produto escalar vetorizado.
+    # vetor_b pode ser um vetor (n,) ou um bloco de vetores (n, k).
+    # ---------------------------------------------------------------
+    y = np.array(vetor_b, dtype=np.float64, copy=True)
+    for i in range(1, lu.shape[0]):
+        y[i] -= lu[i, :i] @ y[:i]
+    return y
+
+
+def substituicao_retroativa_vetorizada(lu, vetor_y):
+    # ---------------------------------------------------------------
+    # Resolve U·x = y começando pela última linha, como em
+    # substituicao_retroativa(), mas com um produto escalar por linha.
+    # vetor_y pode ser um vetor (n,) ou um bloco de vetores (n, k).
+    # ---------------------------------------------------------------
+    x = np.array(vetor_y, dtype=np.float64, copy=True)
+    for i in range(lu.shape[0] - 1, -1, -1):
+        x[i] = (x[i] - lu[i, i + 1:] @ x[i + 1:]) / lu[i, i]
+    return x
+
+
+@instrumentado("gauss/substituicoes", lambda x, arg: {"flops": 2 * len(arg["lu"]) * x.size})
+def resolver_lu(lu, perm, vetor_b):
+    # ---------------------------------------------------------------
+    # Resolve A·x = b reaproveitando os fatores de fatorar_lu():
+    # aplica a permutação em b, depois L·y = P·b e U·x = y.
+    # ---------------------------------------------------------------
+    vetor_b = np.asarray(vetor_b, dtype=np.float64)
+    y = substituicao_progressiva_vetorizada(lu, vetor_b[perm])
+    return substituicao_retroativa_vetorizada(lu, y)
+
+
+def resolver_sistema(matriz_a, vetor_b, tamanho_bloco=TAMANHO_BLOCO_LU):
+    # ---------------------------------------------------------------
+    # Atalho: fatora A e resolve A·x = b em uma única chamada.
+    # Matrizes grandes com banda estreita (ver usar_banda()) seguem
+    # automaticamente pelo caminho de matrizes em banda.
+    # ---------------------------------------------------------------
+    matriz_a = np.asarray(matriz_a, dtype=np.float64)
+    if matriz_a.ndim == 2 and matriz_a.shape[0] == matriz_a.shape[1]:
+        inferior, superior = largura_banda(matriz_a)
+        if usar_banda(matriz_a.shape[0], inferior, superior):
+            return resolver_sistema_banda(matriz_a, vetor_b, inferior, superior)
+    lu, perm = fatorar_lu(matriz_a, tamanho_bloco)
+    return resolver_lu(lu, perm, vetor_b)
+
+
+# ===================================================================
+# PRECISÃO MISTA COM REFINAMENTO ITERATIVO
+#   A fatoração (a parte O(n³)) é feita em float32, que movimenta
+#   metade dos bytes e tem o dobro de vazão nos produtos de matrizes.
+#   A precisão dupla é recuperada com refinamento iterativo:
+#       r = b - A·x        (em float64)
+#       A·d = r            (com os fatores float32, O(n²))
+#       x = x + d
+#   Cada passo ganha cerca de 7 algarismos enquanto cond(A) for bem
+#   menor que 1/eps(float32) ≈ 10⁷. Se o erro retroativo não cai até
+#   a tolerância (matriz mal condicionada) ou a fatoração em float32
+#   falha, o sistema é refatorado e resolvido em float64.
+#
+#   Erro retroativo (normwise): ||b - A·x||∞ / (||A||∞·||x||∞ + ||b||∞)
+# ===================================================================
+
+MAX_REFINAMENTOS = 30   # mesmo limite do dsgesv do LAPACK
+
+
+def erro_retroativo(matriz_a, vetor_x, vetor_b):
+    # ---------------------------------------------------------------
+    # Erro retroativo normwise de x como solução de A·x = b.
+    # ---------------------------------------------------------------
+    residuo = vetor_b - matriz_a @ vetor_x
+    escala = np.abs(matriz_a).sum(axis=1).max() * np.abs(vetor_x).max() + np.abs(vetor_b).max()
+    return float(np.abs(residuo).max() / escala) if escala > 0.0 else 0.0
+
+
+@instrumentado("gauss/precisao_mista", lambda r, _: {"refinamentos": r[1]})
+def resolver_precisao_mista(matriz_a, vetor_b, tol=None, max_refinamentos=MAX_REFINAMENTOS,
+                            tamanho_bloco=TAMANHO_BLOCO_LU):
+    # ---------------------------------------------------------------
+    # Resolve A·x = b fatorando A em float32 e refinando em float64.
+    # Retorna (x, refinamentos, erro_retroativo, precisao):
+    #   refinamentos -> passos de refinamento feitos com os fatores float32;
+    #   precisao     -> "mista" ou "dupla" (quando houve recurso à
+    #                   fatoração em float64).
+    # tol padrão: √n · eps(float64), o critério do dsgesv.
+    # ---------------------------------------------------------------
+    matriz_a = np.asarray(matriz_a, dtype=np.float64)
+    vetor_b = np.asarray(vetor_b, dtype=np.float64)
+    if matriz_a.ndim != 2 or matriz_a.shape[0] != matriz_a.shape[1]:
+        raise ValueError("A matriz de coeficientes deve ser quadrada.")
+    n = matriz_a.shape[0]
+    tol = np.sqrt(n) * np.finfo(np.float64).eps if tol is None else tol
+
+    refinamentos = 0
+    limite_float32 = np.finfo(np.float32).max
+    if np.abs(matriz_a).max(initial=0.0) < limite_float32:
+        try:
+            lu, perm = fatorar_lu(matriz_a, tamanho_bloco, dtype=np.float32)
+        except ValueError:
+            lu = None           # singular em float32: tenta em float64
+        if lu is not None and np.all(np.isfinite(lu)):
+            x = resolver_lu(lu, perm, vetor_b)
+            erro = erro_retroativo(matriz_a, x, vetor_b)
+            while erro > tol and refinamentos < max_refinamentos:
+                correcao = resolver_lu(lu, perm, vetor_b - matriz_a @ x)
+                x_novo = x + correcao
+                erro_novo = erro_retroativo(matriz_a, x_novo, vetor_b)
+                refinamentos += 1
+                if not erro_novo < 0.5 * erro:
+                    break       # estagnou: o refinamento não contrai mais
+                x, erro = x_novo, erro_novo
+            if erro <= tol:
+                return x, refinamentos, erro, "mista"
+
+    lu, perm = fatorar_lu(matriz_a, tamanho_bloco)
+    x = resolver_lu(lu, perm, vetor_b)
+    return x, refinamentos, erro_retroativo(matriz_a, x, vetor_b), "dupla"
+
+
+class SolucionadorLU:
+    # ---------------------------------------------------------------
+    # Resolve vários sistemas A·x = b com a mesma matriz A fatorando-a
+    # uma única vez. Os fatores ficam em um cache LRU limitado, cuja
+    # chave é uma impressão digital (hash) dos bytes de A. Assim, cada
+    # novo vetor b (ou bloco n×k de vetores) custa apenas O(n²).
+    #
+    # Os contadores `acertos` e `falhas` permitem verificar se o
+    # reaproveitamento dos fatores está realmente acontecendo.
+    # ---------------------------------------------------------------
+
+    def __init__(self, capacidade=8, tamanho_bloco=TAMANHO_BLOCO_LU):
+        if capacidade < 1:
+            raise ValueError("A capacidade do cache deve ser pelo menos 1.")
+        self.capacidade = capacidade
+        self.tamanho_bloco = tamanho_bloco
+        self.acertos = 0
+        self.falhas = 0
+        self._cache = OrderedDict()
+
+    @staticmethod
+    def impressao_digital(matriz_a):
+        # Hash do formato e dos bytes de A (convertida para float64
+        # contíguo, para que a mesma matriz gere sempre a mesma chave).
+        matriz_a = np.ascontiguousarray(matriz_a, dtype=np.float64)
+        resumo = hashlib.blake2b(digest_size=16)
+        resumo.update(str(matriz_a.shape).encode())
+        resumo.update(matriz_a.tobytes())
+        return resumo.hexdigest()
+
+    def fatores(self, matriz_a):
+        # Retorna (lu, perm) do cache ou fatora A e guarda o resultado,
+        # descartando a entrada usada há mais tempo se o cache encher.
+        chave = self.impressao_digital(matriz_a)
+        if chave in self._cache:
+            self.acertos += 1
+            self._cache.move_to_end(chave)
+            return self._cache[chave]
+
+        self.falhas += 1
+        fatores = fatorar_lu(matriz_a, self.tamanho_bloco)
+        self._cache[chave] = fatores
+        if len(self._cache) > self.capacidade:
+            self._cache.popitem(last=False)
+        return fatores
+
+    def resolver(self, matriz_a, vetor_b):
+        # vetor_b pode ser um vetor (n,) ou um bloco (n, k) de vetores.
+        lu, perm = self.fatores(matriz_a)
+        return resolver_lu(lu, perm, vetor_b)
+
+    def limpar_cache(self):
+        self._cache.clear()
+        self.acertos = 0
+        self.falhas = 0
+
+    def __len__(self):
+        return len(self._cache)
+
+
+# ===================================================================
+# MATRIZES EM BANDA
+#   Sistemas de treliças bem numeradas, splines e diferenças finitas
+#   têm coeficientes não nulos só perto da diagonal: A[i][j] = 0 se
+#   i - j > inferior ou j - i > superior. Nesses casos:
+#   - a matriz é guardada compacta, uma linha por equação:
+#         banda[i, j - i + inferior] = A[i][j]
+#     (memória O(n·banda) em vez de O(n²));
+#   - a fatoração LU com pivotamento parcial só mexe na banda
+#     (custo O(n·banda²) em vez de O(n³)). As trocas de linha aumentam
+#     a banda superior de U para superior + inferior, por isso a
+#     fatoração reserva essa largura;
+#   - sistemas tridiagonais diagonalmente dominantes usam o algoritmo
+#     de Thomas, O(n);
+#   - a reordenação de Cuthill–McKee reversa renumera as incógnitas
+#     para reduzir a banda de matrizes de padrão simétrico.
+# ===================================================================
+
+LIMITE_BANDA_AUTOMATICA = 1 / 16   # banda total máxima (fração de n) para o atalho
+MINIMO_BANDA_AUTOMATICA = 512      # n mínimo para o atalho valer a pena
+
+
+def _coordenadas_nao_nulos(matriz_a):
+    # ---------------------------------------------------------------
+    # (linhas, colunas, valores, n) dos coeficientes não nulos de uma
+    # matriz densa ou de uma MatrizCSR (sem convertê-la para densa).
+    # ---------------------------------------------------------------
+    if hasattr(matriz_a, "ponteiros_linhas"):
+        linhas = np.repeat(np.arange(matriz_a.n), np.diff(matriz_a.ponteiros_linhas))
+        return linhas, matriz_a.indices_colunas, matriz_a.valores, matriz_a.n
+    matriz_a = np.asarray(matriz_a, dtype=np.float64)
+    if matriz_a.ndim != 2 or matriz_a.shape[0] != matriz_a.shape[1]:
+        raise ValueError("A matriz de coeficientes deve ser quadrada.")
+    linhas, colunas = np.nonzero(matriz_a)
+    return linhas, colunas, matriz_a[linhas, colunas], matriz_a.shape[0]
+
+
+def _largura_coordenadas(linhas, colunas):
+    if linhas.size == 0:
+        return 0, 0
+    distancia = linhas - colunas
+    return max(int(distancia.max()), 0), max(int(-distancia.min()), 0)
+
+
+def largura_banda(matriz_a):
+    # ---------------------------------------------------------------
+    # Retorna (inferior, superior): maiores valores de i - j e j - i
+    # entre os coeficientes não nulos (matriz densa ou MatrizCSR).
+    # ---------------------------------------------------------------
+    linhas, colunas, _, _ = _coordenadas_nao_nulos(matriz_a)
+    return _largura_coordenadas(linhas, colunas)
+
+
+def usar_banda(n, inferior, superior):
+    # ---------------------------------------------------------------
+    # Critério do atalho automático em resolver_sistema().
+    # ---------------------------------------------------------------
+    return (n >= MINIMO_BANDA_AUTOMATICA
+            and 2 * inferior + superior + 1 <= LIMITE_BANDA_AUTOMATICA * n)
+
+
+def para_banda(matriz_a, inferior=None, superior=None):
+    # ---------------------------------------------------------------
+    # Converte uma matriz densa ou MatrizCSR para o armazenamento em
+    # banda: array n×(inferior + superior + 1) com
+    # banda[i, j - i + inferior] = A[i][j].
+    # Sem larguras informadas, elas são detectadas.
+    # ---------------------------------------------------------------
+    return _banda_de_coordenadas(*_coordenadas_nao_nulos(matriz_a), inferior, superior)
+
+
+def _banda_de_coordenadas(linhas, colunas, valores, n, inferior, superior):
+    if inferior is None or superior is None:
+        detectada = _largura_coordenadas(linhas, colunas)
+        inferior = detectada[0] if inferior is None else inferior
+        superior = detectada[1] if superior is None else superior
+
+    deslocamento = colunas - linhas + inferior
+    if np.any((deslocamento < 0) | (deslocamento > inferior + superior)):
+        raise ValueError("A matriz tem coeficientes fora da banda informada.")
+    banda = np.zeros((n, inferior + superior + 1))
+    np.add.at(banda, (linhas, deslocamento), valores)
+    return banda
+
+
+def _vista_banda(dados, largura, inferior):
+    # ---------------------------------------------------------------
+    # Vista n×n sobre o armazenamento em banda (n×largura, contíguo),
+    # em que vista[i, j] é o coeficiente A[i][j]. Como
+    # posição = i·largura + j - i + inferior = i·(largura - 1) + j + inferior,
+    # basta um passo de (largura - 1) elementos entre linhas. Só os
+    # elementos dentro da banda têm significado; fatias retangulares
+    # dentro dela funcionam como em uma matriz densa.
+    # ---------------------------------------------------------------
+    n = dados.shape[0]
+    plano = dados.reshape(-1)
+    passo = plano.itemsize
+    return np.lib.stride_tricks.as_strided(
+        plano[inferior:], shape=(n, n), strides=((largura - 1) * passo, passo))
+
+
+@instrumentado("gauss/fatoracao_lu_banda",
+              lambda r, arg: {"flops": 2 * r[0].size * arg["inferior"]})
+def fatorar_lu_banda(banda, inferior):
+    # ---------------------------------------------------------------
+    # Fatoração LU com pivotamento parcial de uma matriz em banda
+    # (formato de para_banda()). Retorna (lu, pivos):
+    #   lu    -> array n×(2·inferior + superior + 1): U (com banda
+    #            superior + inferior) e os multiplicadores de L;
+    #   pivos -> pivos[k] é a linha trocada com a linha k no passo k.
+    # Como no LAPACK (dgbtrf), as trocas não são aplicadas às colunas
+    # já eliminadas; resolver_lu_banda() as refaz na mesma ordem.
+    # Levanta ValueError se a matriz for singular.
+    # ---------------------------------------------------------------
+    banda = np.asarray(banda, dtype=np.float64)
+    n, largura_entrada = banda.shape
+    superior = largura_entrada - inferior - 1
+    largura = 2 * inferior + superior + 1
+    lu = np.zeros((n, largura))
+    lu[:, :largura_entrada] = banda
+    A = _vista_banda(lu, largura, inferior)
+    pivos = np.arange(n)
+
+    for k in range(n):
+        ultima_linha = min(k + inferior, n - 1) + 1
+        ultima_coluna = min(k + superior + inferior, n - 1) + 1
+        p = k + int(np.argmax(np.abs(A[k:ultima_linha, k])))
+        if A[p, k] == 0.0:
+            raise ValueError(f"Matriz singular: pivô nulo na coluna {k + 1}.")
+        if p != k:
+            pivos[k] = p
+            linha_k = A[k, k:ultima_coluna].copy()
+            A[k, k:ultima_coluna] = A[p, k:ultima_coluna]
+            A[p, k:ultima_coluna] = linha_k
+
+        if ultima_linha > k + 1:
+            A[k + 1:ultima_linha, k] /= A[k, k]
+            A[k + 1:ultima_linha, k + 1:ultima_coluna] -= np.outer(
+                A[k + 1:ultima_linha, k], A[k, k + 1:ultima_coluna])
+
+    return lu, pivos
+
+
+@instrumentado("gauss/substituicoes_banda",
+              lambda x, arg: {"flops": 2 * arg["lu"].shape[1] * x.size})
+def resolver_lu_banda(lu, pivos, inferior, vetor_b):
+    # ---------------------------------------------------------------
+    # Resolve A·x = b com os fatores de fatorar_lu_banda(): aplica as
+    # trocas e L passo a passo, depois a substituição retroativa em U.
+    # vetor_b pode ser um vetor (n,) ou um bloco de vetores (n, k).
+    # ---------------------------------------------------------------
+    n, largura = lu.shape
+    A = _vista_banda(lu, largura, inferior)
+    alcance = largura - inferior - 1          # banda superior de U
+    x = np.array(vetor_b, dtype=np.float64, copy=True)
+
+    for k in range(n):
+        p = pivos[k]
+        if p != k:
+            x[[k, p]] = x[[p, k]]
+        fim = min(k + inferior, n - 1) + 1
+        if fim > k + 1:
+            x[k + 1:fim] -= np.multiply.outer(A[k + 1:fim, k], x[k])
+
+    for i in range(n - 1, -1, -1):
+        fim = min(i + alcance, n - 1) + 1
+        x[i] = (x[i] - A[i, i + 1:fim] @ x[i + 1:fim]) / A[i, i]
+    return x
+
+
+@instrumentado("gauss/thomas", lambda x, _: {"flops": 8 * x.size})
+def resolver_tridiagonal(inferior, diagonal, superior, vetor_b):
+    # ---------------------------------------------------------------
+    # Algoritmo de Thomas para sistemas tridiagonais, O(n):
+    #   inferior[i] = A[i+1][i], diagonal[i] = A[i][i],
+    #   superior[i] = A[i][i+1]   (inferior e superior com n - 1 valores).
+    # Não usa pivotamento: é indicado para matrizes diagonalmente
+    # dominantes ou simétricas positivas definidas. Levanta ValueError
+    # se aparecer um pivô nulo.
+    # ---------------------------------------------------------------
+    a = np.asarray(inferior, dtype=np.float64).tolist()
+    d = np.asarray(diagonal, dtype=np.float64).tolist()
+    c = np.asarray(superior, dtype=np.float64).tolist()
+    vetor_b = np.asarray(vetor_b, dtype=np.float64)
+    n = len(d)
+    if len(a) != n - 1 or len(c) != n - 1 or vetor_b.shape[0] != n:
+        raise ValueError("Esperadas diagonais com n - 1, n e n - 1 valores e b com n linhas.")
+    # Vetores são tratados com floats Python (mais rápidos no laço);
+    # blocos n×k, linha a linha com numpy.
+    y = vetor_b.tolist() if vetor_b.ndim == 1 else vetor_b.copy()
+
+    c_linha = [0.0] * n
+    for i in range(n):
+        pivo = d[i] - (a[i - 1] * c_linha[i - 1] if i > 0 else 0.0)
+        if pivo == 0.0:
+            raise ValueError(f"Pivô nulo na linha {i + 1}; use fatorar_lu_banda().")
+        if i < n - 1:
+            c_linha[i] = c[i] / pivo
+        y[i] = (y[i] - a[i - 1] * y[i - 1]) / pivo if i > 0 else y[i] / pivo
+
+    for i in range(n - 2, -1, -1):
+        y[i] = y[i] - c_linha[i] * y[i + 1]
+    return np.array(y, dtype=np.float64)
+
+
+@instrumentado("gauss/cuthill_mckee")
+def reordenar_cuthill_mckee(matriz_a):
+    # ---------------------------------------------------------------
+    # Permutação de Cuthill–McKee reversa (RCM) para o padrão de
+    # A + Aᵀ. Com q = reordenar_cuthill_mckee(A), a matriz A[q][:, q]
+    # costuma ter banda bem menor. Cada componente conexa é percorrida
+    # em largura a partir de um nó de grau mínimo na última camada de
+    # uma busca inicial (aproximação de um nó periférico), visitando
+    # os vizinhos em ordem crescente de grau.
+    # ---------------------------------------------------------------
+    linhas, colunas, _, n = _coordenadas_nao_nulos(matriz_a)
+    fora_diagonal = linhas != colunas
+    origem = np.concatenate([linhas[fora_diagonal], colunas[fora_diagonal]])
+    destino = np.concatenate([colunas[fora_diagonal], linhas[fora_diagonal]])
+    chaves = np.unique(origem * n + destino)
+    origem, destino = chaves // n, chaves % n
+
+    grau = np.bincount(origem, minlength=n)
+    ponteiros = np.zeros(n + 1, dtype=np.int64)
+    np.cumsum(grau, out=ponteiros[1:])
+    # Vizinhos de cada nó já ordenados por grau crescente.
+    ordem = np.lexsort((grau[destino], origem))
+    vizinhos = destino[ordem].tolist()
+    ponteiros = ponteiros.tolist()
+    grau = grau.tolist()
+
+    def busca_largura(inicio, visitado):
+        camada, ordem_visita = [inicio], [inicio]
+        visitado[inicio] = True
+        while True:
+            proxima = []
+            for no in camada:
+                for vizinho in vizinhos[ponteiros[no]:ponteiros[no + 1]]:
+                    if not visitado[vizinho]:
+                        visitado[vizinho] = True
+                        proxima.append(vizinho)
+            if not proxima:
+                return ordem_visita, camada
+            ordem_visita.extend(proxima)
+            camada = proxima
+
+    visitado = [False] * n
+    permutacao = []
+    for no in sorted(range(n), key=grau.__getitem__):
+        if visitado[no]:
+            continue
+        # Busca preliminar para escolher um nó periférico da componente.
+        marcas = visitado.copy()
+        _, ultima_camada = busca_largura(no, marcas)
+        inicio = min(ultima_camada, key=grau.__getitem__)
+        ordem_visita, _ = busca_largura(inicio, visitado)
+        permutacao.extend(ordem_visita)
+
+    return np.array(permutacao[::-1], dtype=np.int64)
+
+
+def resolver_sistema_banda(matriz_a, vetor_b, inferior=None, superior=None,
+                           reordenar=False):
+    # ---------------------------------------------------------------
+    # Resolve A·x = b pelo caminho de matrizes em banda (A densa ou
+    # MatrizCSR). Com reordenar=True aplica antes a reordenação RCM
+    # (útil quando a numeração das incógnitas espalha a banda); as
+    # larguras são então detectadas na matriz reordenada.
+    # Matrizes tridiagonais diagonalmente dominantes usam Thomas.
+    # ---------------------------------------------------------------
+    vetor_b = np.asarray(vetor_b, dtype=np.float64)
+    linhas, colunas, valores, n = _coordenadas_nao_nulos(matriz_a)
+    permutacao = None
+    if reordenar:
+        permutacao = reordenar_cuthill_mckee(matriz_a)
+        posicao = np.empty(n, dtype=np.int64)
+        posicao[permutacao] = np.arange(n)
+        linhas, colunas = posicao[linhas], posicao[colunas]
+        vetor_b = vetor_b[permutacao]
+        inferior = superior = None
+
+    if inferior is None or superior is None:
+        inferior, superior = _largura_coordenadas(linhas, colunas)
+    banda = _banda_de_coordenadas(linhas, colunas, valores, n, inferior, superior)
+
+    tridiagonal_dominante = (
+        inferior == 1 and superior == 1
+        and np.all(np.abs(banda[:, 1]) > np.abs(banda[:, 0]) + np.abs(banda[:, 2])))
+    if tridiagonal_dominante:
+        x = resolver_tridiagonal(banda[1:, 0], banda[:, 1], banda[:-1, 2], vetor_b)
+    else:
+        lu, pivos = fatorar_lu_banda(banda, inferior)
+        x = resolver_lu_banda(lu, pivos, inferior, vetor_b)
+
+    if permutacao is not None:
+        solucao = np.empty_like(x)
+        solucao[permutacao] = x
+        return solucao
+    return x
+
+
+# ===================================================================
+# RESOLUÇÃO EM LOTE DE MUITOS SISTEMAS PEQUENOS
+#   Para milhares (ou milhões) de sistemas pequenos e independentes,
+#   o custo de chamar a eliminação sistema por sistema é dominado pelo
+#   interpretador. Aqui o laço é feito sobre as colunas (no máximo n),
+#   e cada passo da eliminação é aplicado ao lote inteiro de uma vez.
+# ===================================================================
+
+LIMIAR_MAL_CONDICIONADO = 1e-10   # razão mínima |pivô| / maior |pivô|
+TAMANHO_PEDACO_LOTE = 65536       # sistemas processados por vez
+
+
+@instrumentado("gauss/lote", lambda r, _: {"sistemas": r[0].shape[0]})
+def resolver_lote(matrizes_a, vetores_b,
+                  limiar_condicionamento=LIMIAR_MAL_CONDICIONADO,
+                  tamanho_pedaco=TAMANHO_PEDACO_LOTE):
+    # ---------------------------------------------------------------
+    # Resolve A[s]·x[s] = b[s] para cada sistema s do lote, usando
+    # eliminação de Gauss com pivotamento parcial vetorizada.
+    #   matrizes_a -> array (lote, n, n)
+    #   vetores_b  -> array (lote, n)
+    # Retorna (x, singular, mal_condicionado):
+    #   x                -> array (lote, n); sistemas singulares recebem NaN;
+    #   singular         -> array booleano (lote,) com pivô nulo (relativo
+    #                       à escala da matriz);
+    #   mal_condicionado -> array booleano (lote,) quando a razão entre o
+    #                       menor e o maior pivô fica abaixo do limiar
+    #                       (estimativa barata do condicionamento).
+    # Nenhum sistema problemático interrompe o lote: os erros são
+    # apenas sinalizados.
+    # ---------------------------------------------------------------
+    matrizes_a = np.asarray(matrizes_a, dtype=np.float64)
+    vetores_b = np.asarray(vetores_b, dtype=np.float64)
+    if (matrizes_a.ndim != 3 or matrizes_a.shape[1] != matrizes_a.shape[2]
+            or vetores_b.shape != matrizes_a.shape[:2]):
+        raise ValueError("Esperado A com formato (lote, n, n) e b com formato (lote, n).")
+
+    lote, n = vetores_b.shape
+    x = np.empty((lote, n))
+    singular = np.zeros(lote, dtype=bool)
+    mal_condicionado = np.zeros(lote, dtype=bool)
+
+    for inicio in range(0, lote, tamanho_pedaco):
+        fim = min(inicio + tamanho_pedaco, lote)
+        x[inicio:fim], singular[inicio:fim], mal_condicionado[inicio:fim] = (
+            _resolver_pedaco_lote(matrizes_a[inicio:fim], vetores_b[inicio:fim],
+                                  limiar_condicionamento)
+        )
+
+    return x, singular, mal_condicionado
+
+
+def _resolver_pedaco_lote(matrizes_a, vetores_b, limiar_condicionamento):
+    # ---------------------------------------------------------------
+    # Resolve um pedaço do lote (ver resolver_lote()). Trabalha em
+    # cópias, então as entradas do usuário não são modificadas.
+    # ---------------------------------------------------------------
+    a = np.array(matrizes_a, copy=True)
+    b = np.array(vetores_b, copy=True)
+    lote, n = b.shape
+    indices = np.arange(lote)
+
+    escala = np.abs(a).max(axis=(1, 2))
+    escala[escala == 0.0] = 1.0
+    tolerancia_pivo = n * np.finfo(np.float64).eps * escala
+
+    singular = np.zeros(lote, dtype=bool)
+    menor_pivo = np.full(lote, np.inf)
+    maior_pivo = np.zeros(lote)
+
+    # Eliminação: em cada coluna k, escolhe o maior pivô de cada sistema,
+    # troca as linhas e zera os elementos abaixo da diagonal.
+    for k in range(n):
+        p = k + np.argmax(np.abs(a[:, k:, k]), axis=1)
+        linha_k = a[indices, k].copy()
+        a[indices, k] = a[indices, p]
+        a[indices, p] = linha_k
+        termo_k = b[indices, k].copy()
+        b[indices, k] = b[indices, p]
+        b[indices, p] = termo_k
+
+        pivo = a[:, k, k]
+        modulo_pivo = np.abs(pivo)
+        singular |= modulo_pivo <= tolerancia_pivo
+        menor_pivo = np.minimum(menor_pivo, modulo_pivo)
+        maior_pivo = np.maximum(maior_pivo, modulo_pivo)
+
+        pivo_seguro = np.where(singular, 1.0, pivo)
+        multiplicadores = a[:, k + 1:, k] / pivo_seguro[:, None]
+        a[:, k + 1:, k:] -= multiplicadores[:, :, None] * a[:, None, k, k:]
+        b[:, k + 1:] -= multiplicadores * b[:, k, None]
+
+    # Substituição retroativa, também vetorizada sobre o lote.
+    diagonal = np.where(singular[:, None], 1.0, np.diagonal(a, axis1=1, axis2=2))
+    x = np.empty_like(b)
+    for i in range(n - 1, -1, -1):
+        soma = np.einsum("sj,sj->s", a[:, i, i + 1:], x[:, i + 1:])
+        x[:, i] = (b[:, i] - soma) / diagonal[:, i]
+
+    x[singular] = np.nan
+    mal_condicionado = ~singular & (menor_pivo < limiar_condicionamento * maior_pivo)
+    return x, singular, mal_condicionado
+
+
+def main():
+    # ---------------------------------------------------------------
+    # Função principal do programa. Aqui acontece todo o processo:
+    # 1) O usuário informa o número de equações do sistema.
+    # 2) O programa mostra um guia visual explicando a matriz aumentada.
+    # 3) São lidos todos os coeficientes A e os termos independentes b.
+    # 4) A matriz original é exibida.
+    # 5) A eliminação de Gauss é aplicada para triangular a matriz.
+    # 6) A matriz triangular é exibida.
+    # 7) A substituição retroativa é executada para obter as incógnitas.
+    # 8) O programa mostra os valores finais de cada X[i].
+    # Essa função coordena todo o fluxo chamando funções auxiliares.
+    # ---------------------------------------------------------------
+
+    matriz = [[0.0 for _ in range(10)] for _ in range(10)]   # matriz aumentada
+    vetor_x = [0.0] * 10                                      # vetor solução
+
+    print("=" * 50)
+    print("RESOLUÇÃO DE SISTEMAS LINEARES - ELIMINAÇÃO DE GAUSS")
+    print("=" * 50)
+
+    # ---------------------------------------------------------------
+    # 1) Leitura da quantidade de equações.
+    # O programa aceita valores somente entre 1 e 9.
+    # A função obter_numero() garante que a entrada seja numérica.
+    # ---------------------------------------------------------------
+    while True:
+        numero_equacoes = obter_numero("\nDigite o número de equações (1-9): ")
+        if 1 <= numero_equacoes <= 9:
+            numero_equacoes = int(numero_equacoes)
+            break
+        else:
+            print("❌ Erro: O número de equações deve estar entre 1 e 9!")
+
+    # ---------------------------------------------------------------
+    # 2) Mostra o guia visual para ajudar o usuário a entender
+    # como funciona a matriz aumentada [A|b] e onde os valores serão inseridos.
+    # ---------------------------------------------------------------
+    exibir_guia_entrada(numero_equacoes)
+
+    print("\n" + "=" * 50)
+    print("ENTRADA DE DADOS DA MATRIZ")
+    print("=" * 50)
+
+    # ---------------------------------------------------------------
+    # 3) Leitura dos coeficientes da matriz A e dos termos independentes b.
+    # A matriz aumentada tem a forma:
+    # [ a11 a12 ... a1n | b1 ]
+    # [ a21 a22 ... a2n | b2 ]
+    # Cada coeficiente é digitado individualmente pelo usuário.
+    # ---------------------------------------------------------------
+    for i in range(1, numero_equacoes + 1):
+        print(f"\n--- Equação {i} ---")
+        for j in range(1, numero_equacoes + 1):
+            matriz[i][j] = obter_numero(f"  a[{i},{j}] (coeficiente de X{j}): ")
+        matriz[i][numero_equacoes + 1] = obter_numero(
+            f"  b[{i}]    (termo independente): "
+        )
+
+    exibir_matriz(matriz, numero_equacoes, "MATRIZ ORIGINAL (AUMENTADA):")
+
+    # ---------------------------------------------------------------
+    # 4) Aplicação da eliminação de Gauss.
+    # Essa etapa transforma a matriz aumentada em uma matriz triangular
+    # superior, zerando os elementos abaixo da diagonal principal usando
+    # combinações lineares das linhas. Não é utilizado pivotamento.
+    # ---------------------------------------------------------------
+    print("\n" + "=" * 50)
+    print("EXECUTANDO ELIMINAÇÃO DE GAUSS...")
+    print("=" * 50)
+
+    triangularizar_matriz(matriz, numero_equacoes)
+    exibir_matriz(matriz, numero_equacoes, "MATRIZ MODIFICADA (TRIANGULAR):")
+
+    input("\nPressione ENTER para continuar com a substituição retroativa...")
+
+    # ---------------------------------------------------------------
+    # 5) Execução da substituição retroativa.
+    # A solução começa pela última linha (que contém apenas uma incógnita)
+    # e segue voltando até chegar na primeira equação. Cada valor de X[i]
+    # é calculado usando os valores já encontrados anteriormente.
+    # ---------------------------------------------------------------
+    print("\n" + "=" * 50)
+    print("EXECUTANDO SUBSTITUIÇÃO RETROATIVA...")
+    print("=" * 50)
+
+    substituicao_retroativa(matriz, vetor_x, numero_equacoes)
+
+    # ---------------------------------------------------------------
+    # 6) Exibição final da solução do sistema.
+    # Os valores são exibidos com duas casas decimais e sinal.
+    # ---------------------------------------------------------------
+    print("\n" + "=" * 50)
+    print("SOLUÇÃO DO SISTEMA LINEAR:")
+    print("=" * 50)
+
+    for i in range(1, numero_equacoes + 1):
+        print(f"X[{i}] = {vetor_x[i]:+8.2f}")
+
+    print("\n" + "=" * 50)
+    print("FIM DO PROGRAMA")
+    print("=" * 50)
+
+
+if __name__ == "__main__":
+    main()
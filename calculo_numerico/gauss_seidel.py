@@ -0,0 +1,838 @@
+# ===================================================================
+# ======================   MÉTODO DE GAUSS–SEIDEL   =================
+# ===================================================================
+# PROGRAMA: Método de Gauss-Seidel
+#
+# Descrição:
+#   Resolve sistemas de equações lineares do tipo A·x = b utilizando
+#   o método iterativo de Gauss-Seidel.
+# ===================================================================
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .instrumentacao import instrumentado
+
+
+def obter_numero(mensagem):
+    """
+    Solicita um número ao usuário com validação.
+    Garante que sempre será digitado um valor numérico real.
+    """
+    while True:
+        try:
+            return float(input(mensagem))
+        except ValueError:
+            print("Entrada inválida! Digite um número.")
+
+
+# ================================================================
+# Matriz esparsa no formato CSR (Compressed Sparse Row)
+# ================================================================
+class MatrizCSR:
+    """
+    Matriz quadrada n×n armazenada apenas pelos coeficientes não nulos.
+
+    Os dados ficam em três arrays:
+      valores          -> coeficientes não nulos, linha por linha;
+      indices_colunas  -> coluna de cada coeficiente em `valores`;
+      ponteiros_linhas -> (n + 1) posições; os coeficientes da linha i
+                          estão em valores[ponteiros_linhas[i]:ponteiros_linhas[i+1]].
+    A diagonal é guardada à parte em `diagonal` para o método iterativo.
+    """
+
+    def __init__(self, valores, indices_colunas, ponteiros_linhas, n):
+        self.valores = np.asarray(valores, dtype=np.float64)
+        self.indices_colunas = np.asarray(indices_colunas, dtype=np.int64)
+        self.ponteiros_linhas = np.asarray(ponteiros_linhas, dtype=np.int64)
+        self.n = int(n)
+
+        if self.ponteiros_linhas.shape != (self.n + 1,):
+            raise ValueError("ponteiros_linhas deve ter n + 1 posições.")
+
+        self._linhas = np.repeat(np.arange(self.n), np.diff(self.ponteiros_linhas))
+        self.diagonal = np.zeros(self.n)
+        na_diagonal = self._linhas == self.indices_colunas
+        np.add.at(self.diagonal, self._linhas[na_diagonal], self.valores[na_diagonal])
+        self._listas = None
+
+    @classmethod
+    @instrumentado("csr/montagem")
+    def de_triplas(cls, linhas, colunas, valores, n):
+        """
+        Monta a matriz a partir de triplas (i, j, valor), com índices
+        começando em 0. Triplas repetidas na mesma posição são somadas
+        e zeros explícitos são descartados. Levanta ValueError se algum
+        índice estiver fora de 0..n-1.
+        """
+        linhas = np.asarray(linhas, dtype=np.int64)
+        colunas = np.asarray(colunas, dtype=np.int64)
+        valores = np.asarray(valores, dtype=np.float64)
+        if not linhas.shape == colunas.shape == valores.shape:
+            raise ValueError("linhas, colunas e valores devem ter o mesmo tamanho.")
+        for nome, indices in (("linha", linhas), ("coluna", colunas)):
+            if indices.size and (indices.min() < 0 or indices.max() >= n):
+                fora = indices[(indices < 0) | (indices >= n)][0]
+                raise ValueError(f"Índice de {nome} {fora} fora de uma matriz {n}×{n}.")
+
+        chaves = linhas * n + colunas
+        chaves_unicas, posicao = np.unique(chaves, return_inverse=True)
+        somas = np.zeros(chaves_unicas.shape[0])
+        np.add.at(somas, posicao, valores)
+
+        mantidos = somas != 0.0
+        chaves_unicas = chaves_unicas[mantidos]
+        somas = somas[mantidos]
+
+        linhas_unicas = chaves_unicas // n
+        ponteiros = np.zeros(n + 1, dtype=np.int64)
+        np.cumsum(np.bincount(linhas_unicas, minlength=n), out=ponteiros[1:])
+        return cls(somas, chaves_unicas % n, ponteiros, n)
+
+    @classmethod
+    def de_densa(cls, A):
+        """Converte uma matriz densa (lista de listas ou array) para CSR."""
+        A = np.asarray(A, dtype=np.float64)
+        linhas, colunas = np.nonzero(A)
+        return cls.de_triplas(linhas, colunas, A[linhas, colunas], A.shape[0])
+
+    @property
+    def nnz(self):
+        """Número de coeficientes armazenados."""
+        return self.valores.shape[0]
+
+    def multiplicar(self, x):
+        """Produto matriz-vetor A·x em O(nnz)."""
+        x = np.asarray(x, dtype=np.float64)
+        return np.bincount(self._linhas, weights=self.valores * x[self.indices_colunas],
+                           minlength=self.n)
+
+    def para_densa(self):
+        """Converte para um array denso n×n (apenas para sistemas pequenos)."""
+        A = np.zeros((self.n, self.n))
+        A[self._linhas, self.indices_colunas] = self.valores
+        return A
+
+    def listas(self):
+        """
+        Versão em listas Python dos arrays CSR, usada pelas varreduras
+        linha a linha (acesso a elementos de lista é bem mais rápido
+        que a elementos de array numpy). Calculada uma única vez.
+        """
+        if self._listas is None:
+            self._listas = (self.valores.tolist(),
+                            self.indices_colunas.tolist(),
+                            self.ponteiros_linhas.tolist(),
+                            self.diagonal.tolist())
+        return self._listas
+
+
+# ================================================================
+# Monitor de convergência
+# ================================================================
+INTERVALO_RESIDUO = 10   # iterações entre dois cálculos do resíduo no monitor
+
+
+class MonitorConvergencia:
+    """
+    Registra, a cada iteração, (iteração, erro, norma do resíduo, tempo
+    decorrido em segundos) em um array pré-alocado, sem formatar texto
+    dentro do laço do método.
+
+    Os solucionadores chamam monitor(k, erro, x). A norma do resíduo
+    ||b - A·x|| custa um produto matriz-vetor, por isso só é calculada
+    quando A e b são informados, e apenas a cada `intervalo_residuo`
+    iterações (0: nunca; nas demais é registrada como NaN). O método
+    residuo(x) a calcula sob demanda, por exemplo para a solução final.
+
+    Com `exibir=True`, cada iteração também é impressa em `saida`
+    (padrão: saída padrão), com o resíduo quando ele é calculado.
+
+    Com `arquivo` e `intervalo_gravacao` = N, os registros são gravados
+    a cada N iterações (e ao fechar), em CSV ou em binário ("bin": float64
+    cru, 4 colunas por linha). Sem arquivo, o histórico inteiro fica em
+    memória, crescendo em blocos de `capacidade` linhas.
+    """
+
+    COLUNAS = ("iteracao", "erro", "residuo", "tempo")
+
+    def __init__(self, capacidade=1024, A=None, b=None, arquivo=None,
+                 intervalo_gravacao=1000, formato="csv",
+                 intervalo_residuo=INTERVALO_RESIDUO, exibir=False, saida=None):
+        if formato not in ("csv", "bin"):
+            raise ValueError(f"Formato de log desconhecido: {formato!r}.")
+        if (A is None) != (b is None):
+            raise ValueError("Para o resíduo, informe A e b juntos (ou nenhum dos dois).")
+        if arquivo is not None:
+            capacidade = intervalo_gravacao
+
+        self.registros = np.empty((max(capacidade, 1), 4))
+        self.quantidade = 0
+        self.total_iteracoes = 0
+        self.A = A
+        self.b = None if b is None else np.asarray(b, dtype=np.float64)
+        self._operador = None if A is None else _operador_matriz(A)
+        self.intervalo_residuo = intervalo_residuo
+        self.exibir = exibir
+        self.saida = saida
+        self.formato = formato
+        self._arquivo = None
+        if arquivo is not None:
+            self._arquivo = open(arquivo, "w" if formato == "csv" else "wb")
+            if formato == "csv":
+                self._arquivo.write(",".join(self.COLUNAS) + "\n")
+        self._inicio = time.perf_counter()
+
+    def __call__(self, iteracao, erro, x=None):
+        if self.quantidade == self.registros.shape[0]:
+            if self._arquivo is not None:
+                self.descarregar()
+            else:
+                self.registros = np.resize(self.registros, (2 * self.quantidade, 4))
+
+        residuo = np.nan
+        if x is not None and self.intervalo_residuo and iteracao % self.intervalo_residuo == 0:
+            residuo = self.residuo(x)
+
+        self.registros[self.quantidade] = (iteracao, erro, residuo,
+                                           time.perf_counter() - self._inicio)
+        self.quantidade += 1
+        self.total_iteracoes += 1
+
+        if self.exibir:
+            texto = f"It {iteracao:3d} | Erro = {erro:e}"
+            if not np.isnan(residuo):
+                texto += f" | Resíduo = {residuo:e}"
+            print(texto, file=self.saida or sys.stdout)
+
+    def residuo(self, x):
+        """Norma ||b - A·x|| (NaN se A e b não foram informados)."""
+        if self._operador is None:
+            return np.nan
+        return float(np.linalg.norm(self.b - self._operador(np.asarray(x, dtype=np.float64))))
+
+    @property
+    def historico(self):
+        """Registros ainda em memória (os já gravados em arquivo saem daqui)."""
+        return self.registros[:self.quantidade]
+
+    def descarregar(self):
+        """Grava os registros em memória no arquivo e esvazia o buffer."""
+        if self._arquivo is None or self.quantidade == 0:
+            return
+        if self.formato == "csv":
+            np.savetxt(self._arquivo, self.historico, delimiter=",",
+                       fmt=("%d", "%.17g", "%.17g", "%.9f"))
+        else:
+            self.historico.tofile(self._arquivo)
+        self._arquivo.flush()
+        self.quantidade = 0
+
+    def fechar(self):
+        if self._arquivo is not None:
+            self.descarregar()
+            self._arquivo.close()
+            self._arquivo = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+
+def varredura_gauss_seidel_csr(A, b, x):
+    """
+    Executa UMA varredura de Gauss-Seidel sobre a matriz CSR `A`,
+    atualizando a lista `x` no próprio lugar, e retorna o erro
+    max |x_novo - x_anterior| da varredura.
+
+    Somente os coeficientes armazenados são visitados, então o custo é
+    O(nnz). A soma inclui o termo da diagonal com o valor antigo de
+    x[i]; por isso x[i] += (b[i] - soma) / a_ii equivale à fórmula
+    x[i] = (b[i] - Σ_{j≠i} a_ij x[j]) / a_ii, sem o teste `j != i`.
+    """
+    return varredura_sor_csr(A, b, x, 1.0)
+
+
+def varredura_sor_csr(A, b, x, omega, reversa=False):
+    """
+    Varredura de sobre-relaxação sucessiva (SOR):
+        x[i] += ω · (b[i] - Σ_j a_ij x[j]) / a_ii
+    Com ω = 1 é exatamente Gauss-Seidel. Com `reversa=True` as linhas
+    são percorridas da última para a primeira (usado pelo SSOR).
+    Retorna o erro max |x_novo - x_anterior| da varredura.
+    """
+    valores, colunas, ponteiros, diagonal = A.listas()
+    erro = 0.0
+    ordem = range(A.n - 1, -1, -1) if reversa else range(A.n)
+    for i in ordem:
+        soma = 0.0
+        for p in range(ponteiros[i], ponteiros[i + 1]):
+            soma += valores[p] * x[colunas[p]]
+
+        delta = omega * (b[i] - soma) / diagonal[i]
+        x[i] += delta
+        if abs(delta) > erro:
+            erro = abs(delta)
+    return erro
+
+
+def varredura_ssor_csr(A, b, x, omega):
+    """
+    Varredura de SOR simétrico (SSOR): uma varredura SOR direta seguida
+    de uma reversa. Indicado para matrizes simétricas positivas definidas.
+    Retorna o maior erro entre as duas meias-varreduras.
+    """
+    erro_ida = varredura_sor_csr(A, b, x, omega)
+    erro_volta = varredura_sor_csr(A, b, x, omega, reversa=True)
+    return max(erro_ida, erro_volta)
+
+
+JANELA_ESTIMATIVA_OMEGA = 10           # varreduras usadas em cada estimativa de ρ
+MAX_ITERACOES_ESTIMATIVA_OMEGA = 500   # limite de varreduras antes de fixar ω
+
+
+def estimar_raio_espectral(historico_erros, janela=JANELA_ESTIMATIVA_OMEGA):
+    """
+    Estima o raio espectral ρ_GS da iteração de Gauss-Seidel pela taxa
+    média de decaimento dos erros nas últimas `janela` varreduras.
+
+    Retorna (rho, estavel): `estavel` indica que a estimativa da janela
+    atual difere pouco da janela anterior, isto é, os erros já decaem
+    na taxa assintótica. Enquanto não houver dados suficientes, retorna
+    (1.0, False).
+    """
+    if len(historico_erros) < 2 * janela + 1:
+        return 1.0, False
+
+    e_atual, e_meio, e_inicio = (historico_erros[-1], historico_erros[-1 - janela],
+                                 historico_erros[-1 - 2 * janela])
+    if min(e_atual, e_meio, e_inicio) <= 0.0:
+        return 1.0, False
+
+    rho = (e_atual / e_meio) ** (1.0 / janela)
+    rho_anterior = (e_meio / e_inicio) ** (1.0 / janela)
+    estavel = rho < 1.0 and abs(rho - rho_anterior) < 0.1 * (1.0 - rho)
+    return rho, estavel
+
+
+def omega_otimo(rho_gs, simetrico=False):
+    """
+    ω próximo do ótimo a partir do raio espectral ρ_GS de Gauss-Seidel.
+
+    Para matrizes consistentemente ordenadas (caso típico de treliças e
+    diferenças finitas) ρ_GS = ρ_J², e:
+        SOR : ω = 2 / (1 + √(1 - ρ_GS))
+        SSOR: ω = 2 / (1 + √(2 · (1 - ρ_J)))   (aproximação de Young)
+    Se ρ_GS não estiver em (0, 1) retorna 1, ou seja, Gauss-Seidel puro.
+    """
+    if not 0.0 < rho_gs < 1.0:
+        return 1.0
+
+    if simetrico:
+        omega = 2.0 / (1.0 + (2.0 * (1.0 - rho_gs ** 0.5)) ** 0.5)
+    else:
+        omega = 2.0 / (1.0 + (1.0 - rho_gs) ** 0.5)
+    return min(max(omega, 1.0), 1.99)
+
+
+def gauss_seidel_csr(A, b, tol, max_iter, x0=None, monitor=None):
+    """
+    Método de Gauss-Seidel completo sobre uma matriz CSR.
+
+    `monitor`, se informado, é chamado como monitor(k, erro, x) ao fim
+    de cada iteração (ver MonitorConvergencia).
+    Retorna (x, iteracoes, convergiu), com x como lista Python.
+    Levanta ValueError se algum elemento da diagonal for nulo.
+    """
+    x, iteracoes, convergiu, _ = sor_csr(A, b, tol, max_iter, 1.0, x0=x0,
+                                         monitor=monitor)
+    return x, iteracoes, convergiu
+
+
+@instrumentado("gauss_seidel/sor",
+              lambda r, arg: {"iteracoes": r[1], "flops": 2 * arg["A"].nnz * r[1]})
+def sor_csr(A, b, tol, max_iter, omega="auto", simetrico=False, x0=None,
+            iteracoes_estimativa=MAX_ITERACOES_ESTIMATIVA_OMEGA, monitor=None):
+    """
+    Método SOR (ou SSOR, com `simetrico=True`) sobre uma matriz CSR.
+
+    `omega` pode ser um número em (0, 2) ou "auto": nesse caso as
+    primeiras varreduras são de Gauss-Seidel e, assim que a taxa de
+    convergência se estabiliza (ou após `iteracoes_estimativa`
+    varreduras), ω é calculado por omega_otimo().
+
+    `monitor`, se informado, é chamado como monitor(k, erro, x) ao fim
+    de cada iteração (ver MonitorConvergencia).
+
+    Retorna (x, iteracoes, convergiu, omega_usado), com x como lista.
+    Levanta ValueError se algum elemento da diagonal for nulo ou se ω
+    estiver fora do intervalo (0, 2).
+    """
+    if np.any(A.diagonal == 0.0):
+        raise ValueError("A diagonal da matriz possui elemento nulo.")
+
+    automatico = omega == "auto"
+    if automatico:
+        omega = 1.0
+    elif not 0.0 < omega < 2.0:
+        raise ValueError("O fator de relaxação ω deve estar no intervalo (0, 2).")
+
+    varredura = varredura_ssor_csr if simetrico else varredura_sor_csr
+    b = [float(v) for v in b]
+    x = [0.0] * A.n if x0 is None else [float(v) for v in x0]
+    historico_erros = []
+
+    for k in range(1, max_iter + 1):
+        if automatico:
+            # Fase de estimativa: varreduras de Gauss-Seidel puras
+            erro = varredura_sor_csr(A, b, x, 1.0)
+            historico_erros.append(erro)
+            rho, estavel = estimar_raio_espectral(historico_erros)
+            if estavel or k >= iteracoes_estimativa:
+                omega = omega_otimo(rho, simetrico)
+                automatico = False
+        else:
+            erro = varredura(A, b, x, omega)
+
+        if monitor is not None:
+            monitor(k, erro, x)
+        if erro < tol:
+            return x, k, True, omega
+
+    return x, max_iter, False, omega
+
+
+# ================================================================
+# Métodos de Krylov: Gradientes Conjugados e BiCGSTAB
+# ================================================================
+def _operador_matriz(A):
+    """Retorna a função x -> A·x, para matriz CSR ou densa."""
+    if isinstance(A, MatrizCSR):
+        return A.multiplicar
+    A = np.asarray(A, dtype=np.float64)
+    return lambda x: A @ x
+
+
+def criar_precondicionador(A, tipo):
+    """
+    Retorna a função r -> M⁻¹·r do pré-condicionador escolhido:
+      None           -> sem pré-condicionamento (M = I);
+      "jacobi"       -> M = D (diagonal de A);
+      "gauss-seidel" -> Gauss-Seidel simétrico, M = (D + L) D⁻¹ (D + U).
+                        Aplicar M⁻¹ equivale a uma varredura SSOR com
+                        ω = 1 partindo de z = 0, e mantém M simétrica
+                        quando A é simétrica (exigência do CG).
+    Levanta ValueError para tipo desconhecido ou diagonal com zero.
+    """
+    if tipo is None:
+        return lambda r: r
+
+    A_csr = A if isinstance(A, MatrizCSR) else MatrizCSR.de_densa(A)
+    if np.any(A_csr.diagonal == 0.0):
+        raise ValueError("A diagonal da matriz possui elemento nulo.")
+
+    if tipo == "jacobi":
+        diagonal = A_csr.diagonal
+        return lambda r: r / diagonal
+
+    if tipo == "gauss-seidel":
+        def aplicar(r):
+            z = [0.0] * A_csr.n
+            varredura_ssor_csr(A_csr, r.tolist(), z, 1.0)
+            return np.array(z)
+        return aplicar
+
+    raise ValueError(f"Pré-condicionador desconhecido: {tipo!r}.")
+
+
+@instrumentado("krylov/gradientes_conjugados",
+              lambda r, _: {"iteracoes": r[1], "produtos_matriz_vetor": r[1] + 1})
+def gradientes_conjugados(A, b, tol, max_iter, x0=None, precondicionador=None):
+    """
+    Método dos Gradientes Conjugados (pré-condicionado) para matrizes
+    simétricas positivas definidas, densas ou MatrizCSR.
+
+    O critério de parada é o resíduo relativo ||b - A·x|| <= tol·||b||.
+    Retorna (x, iteracoes, convergiu, historico_residuos), onde o
+    histórico contém ||b - A·x|| no chute inicial e após cada iteração.
+    """
+    aplicar_A = _operador_matriz(A)
+    aplicar_M = criar_precondicionador(A, precondicionador)
+
+    b = np.asarray(b, dtype=np.float64)
+    x = np.zeros_like(b) if x0 is None else np.array(x0, dtype=np.float64)
+    limite = tol * np.linalg.norm(b)
+
+    r = b - aplicar_A(x)
+    historico_residuos = [np.linalg.norm(r)]
+    if historico_residuos[-1] <= limite:
+        return x, 0, True, historico_residuos
+
+    z = aplicar_M(r)
+    p = z.copy()
+    rz = r @ z
+
+    for k in range(1, max_iter + 1):
+        Ap = aplicar_A(p)
+        alfa = rz / (p @ Ap)
+        x += alfa * p
+        r -= alfa * Ap
+
+        historico_residuos.append(np.linalg.norm(r))
+        if historico_residuos[-1] <= limite:
+            return x, k, True, historico_residuos
+
+        z = aplicar_M(r)
+        rz_novo = r @ z
+        p = z + (rz_novo / rz) * p
+        rz = rz_novo
+
+    return x, max_iter, False, historico_residuos
+
+
+@instrumentado("krylov/bicgstab",
+              lambda r, _: {"iteracoes": r[1], "produtos_matriz_vetor": 2 * r[1] + 1})
+def bicgstab(A, b, tol, max_iter, x0=None, precondicionador=None):
+    """
+    Método BiCGSTAB (pré-condicionado à direita) para matrizes não
+    simétricas, densas ou MatrizCSR.
+
+    Mesmo critério de parada e mesmo retorno de gradientes_conjugados().
+    Em caso de colapso numérico (ρ ou ω nulos) retorna convergiu=False.
+    """
+    aplicar_A = _operador_matriz(A)
+    aplicar_M = criar_precondicionador(A, precondicionador)
+
+    b = np.asarray(b, dtype=np.float64)
+    x = np.zeros_like(b) if x0 is None else np.array(x0, dtype=np.float64)
+    limite = tol * np.linalg.norm(b)
+
+    r = b - aplicar_A(x)
+    historico_residuos = [np.linalg.norm(r)]
+    if historico_residuos[-1] <= limite:
+        return x, 0, True, historico_residuos
+
+    r_sombra = r.copy()
+    rho = alfa = omega = 1.0
+    v = np.zeros_like(b)
+    p = np.zeros_like(b)
+
+    for k in range(1, max_iter + 1):
+        rho_novo = r_sombra @ r
+        if rho_novo == 0.0 or omega == 0.0:
+            break
+
+        p = r + (rho_novo / rho) * (alfa / omega) * (p - omega * v)
+        p_chapeu = aplicar_M(p)
+        v = aplicar_A(p_chapeu)
+        alfa = rho_novo / (r_sombra @ v)
+        s = r - alfa * v
+
+        if np.linalg.norm(s) <= limite:
+            x += alfa * p_chapeu
+            historico_residuos.append(np.linalg.norm(s))
+            return x, k, True, historico_residuos
+
+        s_chapeu = aplicar_M(s)
+        t = aplicar_A(s_chapeu)
+        omega = (t @ s) / (t @ t)
+        x += alfa * p_chapeu + omega * s_chapeu
+        r = s - omega * t
+        rho = rho_novo
+
+        historico_residuos.append(np.linalg.norm(r))
+        if historico_residuos[-1] <= limite:
+            return x, k, True, historico_residuos
+
+    return x, len(historico_residuos) - 1, False, historico_residuos
+
+
+# ================================================================
+# Gauss-Seidel multicolorido (red-black generalizado)
+# ================================================================
+def colorir_grafo(A, semente=0):
+    """
+    Colore o grafo de esparsidade de A (vértices = incógnitas, arestas =
+    coeficientes a_ij ≠ 0 fora da diagonal, tratados como simétricos) de
+    modo que incógnitas da mesma cor nunca dependam umas das outras.
+
+    Cada cor é um conjunto independente maximal obtido pelo algoritmo de
+    Luby, todo vetorizado: a cada rodada entram na cor os vértices cuja
+    prioridade aleatória supera a de todos os vizinhos ainda candidatos,
+    e esses vizinhos deixam de ser candidatos para a cor atual.
+
+    Retorna um array com a cor (0, 1, 2, ...) de cada incógnita.
+    """
+    fora_diagonal = A._linhas != A.indices_colunas
+    origem = np.concatenate([A._linhas[fora_diagonal], A.indices_colunas[fora_diagonal]])
+    destino = np.concatenate([A.indices_colunas[fora_diagonal], A._linhas[fora_diagonal]])
+
+    prioridade = np.random.default_rng(semente).permutation(A.n)
+    cores = np.full(A.n, -1, dtype=np.int64)
+    cor = 0
+
+    while np.any(cores < 0):
+        candidatos = cores < 0
+        while np.any(candidatos):
+            ativas = candidatos[origem] & candidatos[destino]
+            maior_vizinho = np.full(A.n, -1, dtype=np.int64)
+            np.maximum.at(maior_vizinho, origem[ativas], prioridade[destino[ativas]])
+
+            escolhidos = candidatos & (prioridade > maior_vizinho)
+            cores[escolhidos] = cor
+            candidatos &= ~escolhidos
+
+            # Vizinhos dos escolhidos não podem receber a mesma cor
+            bloqueados = destino[escolhidos[origem]]
+            candidatos[bloqueados] = False
+        cor += 1
+
+    return cores
+
+
+def preparar_multicolor(A, num_trabalhadores=1, semente=0):
+    """
+    Pré-processa A para o Gauss-Seidel multicolorido.
+
+    Retorna uma lista com um item por cor; cada item é uma lista de até
+    `num_trabalhadores` blocos de linhas (linhas, ponteiros, colunas,
+    valores, diagonal), em que (ponteiros, colunas, valores) é o CSR
+    apenas das linhas do bloco. Os blocos de uma mesma cor podem ser
+    atualizados ao mesmo tempo, pois não leem as incógnitas uns dos outros.
+    """
+    cores = colorir_grafo(A, semente)
+    tamanhos_linhas = np.diff(A.ponteiros_linhas)
+    blocos_por_cor = []
+
+    for cor in range(cores.max() + 1):
+        linhas_cor = np.flatnonzero(cores == cor)
+        blocos = []
+        for linhas in np.array_split(linhas_cor, min(num_trabalhadores, len(linhas_cor))):
+            tamanhos = tamanhos_linhas[linhas]
+            ponteiros = np.zeros(len(linhas) + 1, dtype=np.int64)
+            np.cumsum(tamanhos, out=ponteiros[1:])
+            # Posições de todos os coeficientes das linhas do bloco
+            posicoes = (np.repeat(A.ponteiros_linhas[linhas] - ponteiros[:-1], tamanhos)
+                        + np.arange(ponteiros[-1]))
+            blocos.append((linhas, ponteiros[:-1], A.indices_colunas[posicoes],
+                           A.valores[posicoes], A.diagonal[linhas]))
+        blocos_por_cor.append(blocos)
+
+    return blocos_por_cor
+
+
+def _atualizar_bloco_multicolor(bloco, b, x, omega):
+    """Atualiza as incógnitas de um bloco e retorna o maior |Δx|."""
+    linhas, ponteiros, colunas, valores, diagonal = bloco
+    soma = np.add.reduceat(valores * x[colunas], ponteiros)
+    delta = omega * (b[linhas] - soma) / diagonal
+    x[linhas] += delta
+    return np.abs(delta).max()
+
+
+def varredura_multicolor(blocos_por_cor, b, x, omega=1.0, executor=None):
+    """
+    Uma varredura de Gauss-Seidel (ou SOR) multicolorida: as cores são
+    processadas em sequência e, dentro de cada cor, todas as incógnitas
+    são atualizadas de uma vez (vetorizado). Com um `executor`, os blocos
+    de cada cor são distribuídos entre as threads, que compartilham `x`.
+    Retorna o erro max |x_novo - x_anterior| da varredura.
+    """
+    erro = 0.0
+    for blocos in blocos_por_cor:
+        if executor is None or len(blocos) == 1:
+            erros = [_atualizar_bloco_multicolor(bloco, b, x, omega) for bloco in blocos]
+        else:
+            erros = list(executor.map(
+                lambda bloco: _atualizar_bloco_multicolor(bloco, b, x, omega), blocos))
+        erro = max(erro, max(erros))
+    return erro
+
+
+@instrumentado("gauss_seidel/multicolor",
+              lambda r, arg: {"iteracoes": r[1], "flops": 2 * arg["A"].nnz * r[1]})
+def gauss_seidel_multicolor(A, b, tol, max_iter, x0=None, omega=1.0,
+                            num_trabalhadores=1, monitor=None):
+    """
+    Gauss-Seidel com ordenação multicolorida sobre uma matriz CSR.
+
+    Converge para a mesma solução do Gauss-Seidel sequencial (a ordem
+    das incógnitas muda, não o método). Com num_trabalhadores > 1 cada
+    cor é dividida entre threads; as operações do numpy liberam o GIL,
+    então as threads rodam de fato em paralelo em sistemas grandes.
+    `monitor` funciona como em gauss_seidel_csr().
+
+    Retorna (x, iteracoes, convergiu), com x como array numpy.
+    """
+    if np.any(A.diagonal == 0.0):
+        raise ValueError("A diagonal da matriz possui elemento nulo.")
+
+    blocos_por_cor = preparar_multicolor(A, num_trabalhadores)
+    b = np.asarray(b, dtype=np.float64)
+    x = np.zeros(A.n) if x0 is None else np.array(x0, dtype=np.float64)
+
+    executor = ThreadPoolExecutor(num_trabalhadores) if num_trabalhadores > 1 else None
+    try:
+        for k in range(1, max_iter + 1):
+            erro = varredura_multicolor(blocos_por_cor, b, x, omega, executor)
+            if monitor is not None:
+                monitor(k, erro, x)
+            if erro < tol:
+                return x, k, True
+        return x, max_iter, False
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+
+# ================================================================
+# Programa interativo
+# ================================================================
+# Modelo da matriz exibido ao usuário antes da digitação dos dados.
+GUIA_VISUAL = """
+A matriz será preenchida conforme o formato abaixo:
+(Coeficientes)  |  (Termo Independente)
+
+Equação | X1 | X2 | X3 | ... | Xn | b |
+----------------------------------------
+
+   1    | a11| a12| a13| ... | a1n| b1|
+   2    | a21| a22| a23| ... | a2n| b2|
+   3    | a31| a32| a33| ... | a3n| b3|
+  ...   | ... ... ... ... ... ... ...
+   n    | an1| an2| an3| ... | ann| bn|
+
+Exemplo:
+Para a equação "2x1 + 3x2 = 8", digite:
+a[1,1] = 2
+a[1,2] = 3
+b[1]   = 8
+"""
+
+# Por padrão nada é impresso dentro do laço do método: o erro de cada
+# iteração fica no monitor. Para acompanhar iteração por iteração, use
+# main(exibir_iteracoes=True) (ou --exibir-iteracoes na linha de comando).
+EXIBIR_ITERACOES = False
+
+
+def main(exibir_iteracoes=EXIBIR_ITERACOES):
+    """
+    Programa interativo: lê o sistema digitado pelo usuário, aplica
+    Gauss-Seidel (com SOR opcional) e exibe a solução.
+    """
+    print("\n" + "="*70)
+    print("                MÉTODO ITERATIVO DE GAUSS–SEIDEL")
+    print("="*70 + "\n")
+    # ================================================================
+    # 1. Entrada do tamanho do sistema
+    # ================================================================
+    while True:
+        try:
+            n = int(input("Digite o número de equações (Ordem do sistema): "))
+            if n >= 1:
+                break
+            else:
+                print("Digite um valor maior ou igual a 1.")
+        except ValueError:
+            print("Digite um número inteiro válido!")
+
+
+    # ================================================================
+    # 2. Exibir GUIA VISUAL (modelo da matriz)
+    # ================================================================
+    print("\n" + "="*70)
+    print("GUIA VISUAL - Posições da Matriz [A | b]")
+    print("="*70)
+
+    print(GUIA_VISUAL)
+    print("="*70)
+
+
+    # ================================================================
+    # 3. Entrada da matriz A e do vetor b
+    #    Apenas os coeficientes não nulos são guardados (formato CSR).
+    # ================================================================
+    linhas_A, colunas_A, valores_A = [], [], []
+    b = [0.0 for _ in range(n)]
+
+    print("\nAgora insira os coeficientes do sistema:")
+
+    for i in range(n):
+        print(f"\n--- Equação {i+1} ---")
+
+        for j in range(n):
+            valor = obter_numero(f"a[{i+1},{j+1}] (coef. de X{j+1}): ")
+            if valor != 0.0:
+                linhas_A.append(i)
+                colunas_A.append(j)
+                valores_A.append(valor)
+
+        b[i] = obter_numero(f"b[{i+1}] (termo independente): ")
+
+    A = MatrizCSR.de_triplas(linhas_A, colunas_A, valores_A, n)
+
+
+    # ================================================================
+    # 4. Parâmetros do método
+    # ================================================================
+    tol = obter_numero("\nDigite a tolerância desejada (ex: 0.001): ")
+    max_iter = int(obter_numero("Digite o número máximo de iterações: "))
+
+    while True:
+        omega = obter_numero("Digite o fator de relaxação ω (1 = Gauss-Seidel, 0 = automático): ")
+        if 0 <= omega < 2:
+            break
+        print("O fator de relaxação deve estar entre 0 e 2.")
+
+    omega_automatico = omega == 0
+
+
+    # ================================================================
+    # 5. Método de Gauss-Seidel (com sobre-relaxação opcional, SOR)
+    #    A iteração (e a estimativa automática de ω) é a de sor_csr();
+    #    o histórico de cada iteração fica no monitor; o resíduo só é
+    #    calculado no fim.
+    # ================================================================
+    monitor = MonitorConvergencia(capacidade=min(max_iter, 1024), A=A, b=b,
+                                  intervalo_residuo=0, exibir=exibir_iteracoes)
+
+    print("\n\n================ INICIANDO GAUSS-SEIDEL ================\n")
+
+    x, _, convergiu, omega_usado = sor_csr(A, b, tol, max_iter,
+                                           "auto" if omega_automatico else omega,
+                                           monitor=monitor)
+
+    # ω continua 1 (Gauss-Seidel) se a convergência vier antes da estimativa.
+    if omega_automatico and omega_usado != 1.0:
+        print(f"ω estimado = {omega_usado:.4f}")
+
+    if convergiu:
+        print("\nConvergência atingida!")
+    else:
+        print("\nATENÇÃO: Número máximo de iterações atingido sem convergência.")
+
+    if monitor.quantidade > 0:
+        iteracao_final, erro_final, _, tempo_total = monitor.historico[-1]
+        residuo_final = monitor.residuo(x)
+        print(f"Iterações: {int(iteracao_final)} | Erro = {erro_final:e} | "
+              f"Resíduo = {residuo_final:e} | Tempo = {tempo_total:.4f} s")
+
+
+    # ================================================================
+    # 6. Exibição da solução final
+    # ================================================================
+    print("\n=================== SOLUÇÃO FINAL ===================\n")
+
+    for i in range(n):
+        print(f"x{i+1} = {x[i]}")
+
+    print("\n======================================================\n")
+
+
+if __name__ == "__main__":
+    main()
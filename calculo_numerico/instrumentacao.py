@@ -0,0 +1,300 @@
+# ===================================================================
+# MÓDULO: Instrumentação opcional dos métodos
+#
+# Descrição:
+#   Mostra para onde vai o tempo de uma resolução (leitura dos dados,
+#   eliminação, substituição, varreduras, avaliações de f, ...) sem
+#   custo perceptível quando desligada.
+#
+#   Os métodos do pacote são marcados com o decorador @instrumentado,
+#   que registra uma "fase" por chamada (tempo, número de chamadas e
+#   contadores como flops, iterações e avaliações de f). Desligada, a
+#   instrumentação custa uma chamada de função e um teste por chamada
+#   do método (não por iteração): os laços internos não são tocados.
+#
+#   Uso:
+#       from calculo_numerico import instrumentacao
+#       with instrumentacao.instrumentar() as estatisticas:
+#           x = resolver_sistema(A, b)
+#       print(estatisticas.resumo())
+#       estatisticas.salvar_chrome_trace("perfil.json")  # chrome://tracing, Perfetto
+#       estatisticas.salvar_pilhas("perfil.folded")      # flamegraph.pl, speedscope
+#
+#   Também pela linha de comando: python -m calculo_numerico --perfil perfil.json ...
+# ===================================================================
+
+import functools
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter
+from contextlib import contextmanager
+
+MAX_EVENTOS = 1_000_000   # eventos guardados para o trace (o resumo não tem limite)
+
+_ativo = None             # Estatisticas em uso, ou None (desligada)
+
+
+class RegistroFase:
+    """Totais de uma fase: chamadas, tempo total e próprio (sem subfases), contadores."""
+
+    def __init__(self):
+        self.chamadas = 0
+        self.tempo_total = 0.0
+        self.tempo_proprio = 0.0
+        # Variação líquida dos blocos vivos (sys.getallocatedblocks()) entre
+        # a entrada e a saída: mostra o que a fase deixou alocado, não quantas
+        # alocações fez (temporários criados e liberados não aparecem).
+        self.variacao_blocos_vivos = 0
+        # Só com memoria=True (tracemalloc): pico de bytes e blocos alocados
+        # e liberados, pela diferença, linha de código a linha de código,
+        # entre os blocos vivos na entrada e na saída. Uma linha que cria e
+        # libera temporários dentro da fase conta só o saldo.
+        self.bytes_pico = 0
+        self.blocos_alocados = 0
+        self.blocos_liberados = 0
+        self.contadores = {}
+
+
+class Estatisticas:
+    """
+    Resultado de uma sessão de instrumentação: `fases` (nome ->
+    RegistroFase), `contadores` globais e os eventos para exportar em
+    formato Chrome trace ou pilhas recolhidas (flamegraph).
+    """
+
+    def __init__(self, memoria=False, max_eventos=MAX_EVENTOS):
+        self.memoria = memoria
+        self.max_eventos = max_eventos
+        self.fases = {}
+        self.contadores = {}
+        self.eventos = []            # (nome, pilha, início ns, duração ns, thread)
+        self.eventos_descartados = 0
+        self._pilhas = threading.local()
+        self._trava = threading.Lock()
+        self._origem = time.perf_counter_ns()
+
+    def _pilha(self):
+        pilha = getattr(self._pilhas, "fases", None)
+        if pilha is None:
+            pilha = self._pilhas.fases = []
+        return pilha
+
+    @contextmanager
+    def fase(self, nome):
+        """Mede um trecho de código como a fase `nome`."""
+        pilha = self._pilha()
+        # nome, tempo das subfases (ns), pico das subfases (bytes) e tempo
+        # gasto pela instrumentação de memória das subfases (ns), que não
+        # entra no tempo desta fase
+        quadro = [nome, 0, 0, 0]
+        if self.memoria:
+            custo = time.perf_counter_ns()
+            # O pico da fase de fora até aqui é guardado antes de zerar
+            # o pico do tracemalloc para esta fase.
+            memoria_inicial, pico = tracemalloc.get_traced_memory()
+            if pilha:
+                pilha[-1][2] = max(pilha[-1][2], pico)
+            blocos_iniciais = _blocos_por_linha()
+            tracemalloc.reset_peak()
+            custo = time.perf_counter_ns() - custo
+        pilha.append(quadro)
+        blocos = sys.getallocatedblocks()
+        inicio = time.perf_counter_ns()
+        try:
+            yield self
+        finally:
+            fim = time.perf_counter_ns()
+            duracao = fim - inicio - quadro[3]
+            pilha.pop()
+            if self.memoria:
+                pico = max(tracemalloc.get_traced_memory()[1], quadro[2])
+                variacao = _blocos_por_linha()
+                variacao.subtract(blocos_iniciais)
+                alocados = sum(v for v in variacao.values() if v > 0)
+                liberados = -sum(v for v in variacao.values() if v < 0)
+                del blocos_iniciais, variacao
+                if pilha:
+                    pilha[-1][2] = max(pilha[-1][2], pico)
+                    pilha[-1][3] += quadro[3] + custo + time.perf_counter_ns() - fim
+            if pilha:
+                pilha[-1][1] += duracao
+            with self._trava:
+                registro = self.fases.setdefault(nome, RegistroFase())
+                registro.chamadas += 1
+                registro.tempo_total += duracao * 1e-9
+                registro.tempo_proprio += (duracao - quadro[1]) * 1e-9
+                registro.variacao_blocos_vivos += sys.getallocatedblocks() - blocos
+                if self.memoria:
+                    registro.bytes_pico = max(registro.bytes_pico, pico - memoria_inicial)
+                    registro.blocos_alocados += alocados
+                    registro.blocos_liberados += liberados
+                if len(self.eventos) < self.max_eventos:
+                    caminho = ";".join(q[0] for q in pilha) + (";" if pilha else "") + nome
+                    self.eventos.append((nome, caminho, inicio - self._origem, duracao,
+                                         threading.get_ident()))
+                else:
+                    self.eventos_descartados += 1
+
+    def contar(self, nome, quantidade=1):
+        """Soma `quantidade` ao contador global e ao da fase em andamento."""
+        with self._trava:
+            self.contadores[nome] = self.contadores.get(nome, 0) + quantidade
+            pilha = self._pilha()
+            if pilha:
+                registro = self.fases.setdefault(pilha[-1][0], RegistroFase())
+                registro.contadores[nome] = registro.contadores.get(nome, 0) + quantidade
+
+    # ---------------------------------------------------------------
+    # Relatórios e exportação
+    # ---------------------------------------------------------------
+    def resumo(self):
+        """Tabela de texto com as fases (por tempo total) e os contadores."""
+        memoria = (f" {'pico (MiB)':>10} {'alocados':>9} {'liberados':>9}"
+                   if self.memoria else "")
+        linhas = [f"{'fase':<36} {'chamadas':>9} {'total (s)':>11} {'própria (s)':>12}"
+                  f"{memoria}  contadores"]
+        ordenadas = sorted(self.fases.items(), key=lambda item: -item[1].tempo_total)
+        for nome, registro in ordenadas:
+            contadores = ", ".join(f"{c}={v:.6g}" for c, v in sorted(registro.contadores.items()))
+            memoria = (f" {registro.bytes_pico / 2 ** 20:>10.2f} {registro.blocos_alocados:>9} "
+                       f"{registro.blocos_liberados:>9}" if self.memoria else "")
+            linhas.append(f"{nome:<36} {registro.chamadas:>9} {registro.tempo_total:>11.6f} "
+                          f"{registro.tempo_proprio:>12.6f}{memoria}  {contadores}")
+        if self.contadores:
+            linhas.append("totais: " + ", ".join(f"{c}={v:.6g}"
+                                                 for c, v in sorted(self.contadores.items())))
+        if self.eventos_descartados:
+            linhas.append(f"({self.eventos_descartados} eventos além de {self.max_eventos} "
+                          "ficaram fora do trace)")
+        return "\n".join(linhas)
+
+    def para_dicionario(self):
+        return {
+            "fases": {nome: {"chamadas": r.chamadas, "tempo_total_s": r.tempo_total,
+                             "tempo_proprio_s": r.tempo_proprio,
+                             "variacao_blocos_vivos": r.variacao_blocos_vivos,
+                             "bytes_pico": r.bytes_pico,
+                             "blocos_alocados": r.blocos_alocados,
+                             "blocos_liberados": r.blocos_liberados,
+                             "contadores": r.contadores}
+                      for nome, r in self.fases.items()},
+            "contadores": self.contadores,
+        }
+
+    def para_chrome_trace(self):
+        """Eventos "X" (início + duração, em µs) no formato Trace Event do Chrome."""
+        pid = os.getpid()
+        eventos = [{"name": nome, "cat": nome.split("/")[0], "ph": "X", "pid": pid,
+                    "tid": thread, "ts": inicio / 1000.0, "dur": duracao / 1000.0}
+                   for nome, _, inicio, duracao, thread in self.eventos]
+        return {"traceEvents": eventos, "displayTimeUnit": "ms",
+                "otherData": self.para_dicionario()}
+
+    def salvar_chrome_trace(self, caminho):
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            json.dump(self.para_chrome_trace(), arquivo, ensure_ascii=False)
+
+    def pilhas_recolhidas(self):
+        """
+        Formato "pilhas recolhidas" do flamegraph: uma linha
+        "fase;subfase;... microssegundos" por pilha, com o tempo próprio.
+        """
+        proprio = {}
+        filhos = {}
+        for _, caminho, _, duracao, _ in self.eventos:
+            proprio[caminho] = proprio.get(caminho, 0) + duracao
+            if ";" in caminho:
+                pai = caminho.rsplit(";", 1)[0]
+                filhos[pai] = filhos.get(pai, 0) + duracao
+        linhas = []
+        for caminho, duracao in sorted(proprio.items()):
+            microssegundos = (duracao - filhos.get(caminho, 0)) // 1000
+            if microssegundos > 0:
+                linhas.append(f"{caminho} {microssegundos}")
+        return "\n".join(linhas) + "\n"
+
+    def salvar_pilhas(self, caminho):
+        with open(caminho, "w", encoding="utf-8") as arquivo:
+            arquivo.write(self.pilhas_recolhidas())
+
+
+def _blocos_por_linha():
+    # Blocos vivos rastreados pelo tracemalloc, por linha de código que os
+    # alocou, sem os da própria instrumentação. Usa a lista crua de
+    # rastros (a mesma de take_snapshot()): agrupar os objetos Snapshot
+    # em Python custaria segundos com o numpy carregado.
+    proprios = (__file__, tracemalloc.__file__)
+    blocos = Counter(rastro[2][0] for rastro in tracemalloc._get_traces() if rastro[2])
+    for linha in [linha for linha in blocos if linha[0] in proprios]:
+        del blocos[linha]
+    return blocos
+
+
+# ---------------------------------------------------------------
+# Interface usada pelos módulos
+# ---------------------------------------------------------------
+@contextmanager
+def instrumentar(memoria=False, max_eventos=MAX_EVENTOS):
+    """
+    Liga a instrumentação dentro do bloco `with` e entrega o objeto
+    Estatisticas. Com memoria=True também registra o pico de memória e
+    os blocos alocados e liberados em cada fase (tracemalloc, que deixa
+    o código bem mais lento; o tempo das contagens é descontado das fases).
+    """
+    global _ativo
+    anterior = _ativo
+    estatisticas = Estatisticas(memoria, max_eventos)
+    iniciou_tracemalloc = memoria and not tracemalloc.is_tracing()
+    if iniciou_tracemalloc:
+        tracemalloc.start()
+    _ativo = estatisticas
+    try:
+        yield estatisticas
+    finally:
+        _ativo = anterior
+        if iniciou_tracemalloc:
+            tracemalloc.stop()
+
+
+def ativa():
+    """Estatisticas em uso, ou None se a instrumentação estiver desligada."""
+    return _ativo
+
+
+def contar(nome, quantidade=1):
+    if _ativo is not None:
+        _ativo.contar(nome, quantidade)
+
+
+def instrumentado(nome, contagens=None):
+    """
+    Decorador: cada chamada da função vira uma fase `nome`. `contagens`,
+    se informada, é chamada depois da função como
+    contagens(resultado, argumentos), com `argumentos` o dicionário
+    nome -> valor de todos os parâmetros (inclusive os padrões), e
+    devolve um dicionário {contador: quantidade}.
+    """
+    def decorador(funcao):
+        assinatura = inspect.signature(funcao)
+
+        @functools.wraps(funcao)
+        def envoltorio(*args, **kwargs):
+            estatisticas = _ativo
+            if estatisticas is None:
+                return funcao(*args, **kwargs)
+            with estatisticas.fase(nome):
+                resultado = funcao(*args, **kwargs)
+                if contagens is not None:
+                    argumentos = assinatura.bind(*args, **kwargs)
+                    argumentos.apply_defaults()
+                    for contador, quantidade in contagens(resultado,
+                                                          argumentos.arguments).items():
+                        estatisticas.contar(contador, quantidade)
+            return resultado
+        return envoltorio
+    return decorador
@@ -0,0 +1,675 @@
+# ===============================================================
+# PROGRAMA: Regras de Integração Numérica
+# Métodos: Regra dos Trapézios e Regra de Simpson 1/3
+# Objetivo: Calcular a integral aproximada de uma função definida
+# pelo usuário, dentro de um intervalo [a, b], dividindo esse
+# intervalo em n subintervalos.
+# ===============================================================
+
+# numpy é usado pelas versões vetorizadas das regras, que avaliam
+# f em vetores inteiros de pontos de uma só vez. heapq e math são
+# usados pela integração adaptativa; os e concurrent.futures pelo
+# cálculo em lote com vários processos; ast, functools, inspect e
+# textwrap pela compilação de expressões digitadas pelo usuário (e da
+# própria f).
+import ast
+import functools
+import heapq
+import inspect
+import math
+import os
+import textwrap
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from .instrumentacao import instrumentado
+
+
+# ---------------------------------------------------------------
+# Função f(x) que será integrada
+# Aqui você define a função matemática. No exemplo, usamos
+# a mesma função presente no código C fornecido:
+#
+# Para trocar a função, basta alterar a expressão do return.
+# ---------------------------------------------------------------
+def f(x):
+    return (0.02552 * x**4) + (-0.29958 * x**3) + (0.42111 * x**2) + (-0.47631 * x) + 3.01602
+
+
+# ---------------------------------------------------------------
+# Compilação de integrandos a partir de texto
+#
+# Em vez de editar f(x) no código, a função pode ser informada como
+# texto, por exemplo "0.5*x**2 - 3*x + 1" ou "exp(-x) * sin(x)".
+# A expressão é analisada (módulo ast) e validada uma única vez:
+# só são aceitos números, a variável x, as constantes pi e e, as
+# operações + - * / ** e as funções de FUNCOES_PERMITIDAS.
+#
+# Se a expressão for um polinômio em x, ela é convertida para a
+# forma de Horner:
+#   a0 + a1 x + a2 x² + a3 x³ = a0 + x (a1 + x (a2 + x a3))
+# que usa só multiplicações e somas (sem potências). Caso contrário,
+# vira uma função vetorizada que usa as funções do numpy.
+#
+# O resultado fica em cache pelo texto da expressão, então compilar
+# a mesma expressão de novo não refaz nenhum trabalho.
+#
+# Todas as funções de integração aceitam, no parâmetro `funcao`,
+# tanto uma função Python quanto o texto de uma expressão.
+# ---------------------------------------------------------------
+FUNCOES_PERMITIDAS = {
+    "sin": np.sin, "cos": np.cos, "tan": np.tan,
+    "exp": np.exp, "log": np.log, "log10": np.log10,
+    "sqrt": np.sqrt, "abs": np.abs,
+}
+CONSTANTES_PERMITIDAS = {"pi": math.pi, "e": math.e}
+_NOS_PERMITIDOS = (
+    ast.Expression, ast.BinOp, ast.UnaryOp, ast.Call, ast.Name, ast.Load,
+    ast.Constant, ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Pow,
+    ast.USub, ast.UAdd,
+)
+
+
+# Grau máximo convertido para Horner; acima dele (ou com expoentes
+# maiores) a expressão é avaliada diretamente com potências do numpy.
+GRAU_MAXIMO_POLINOMIO = 64
+
+
+class _NaoPolinomial(Exception):
+    # Sinaliza internamente que a expressão não é um polinômio em x.
+    pass
+
+
+def _validar_expressao(arvore):
+    # Levanta ValueError se a árvore tiver algo fora do permitido.
+    nomes_de_funcoes = set()
+    for no in ast.walk(arvore):
+        if not isinstance(no, _NOS_PERMITIDOS):
+            raise ValueError(f"Construção não permitida na expressão: {type(no).__name__}.")
+        if isinstance(no, ast.Constant) and not isinstance(no.value, (int, float)):
+            raise ValueError(f"Constante não permitida na expressão: {no.value!r}.")
+        if isinstance(no, ast.Call):
+            if (not isinstance(no.func, ast.Name) or no.func.id not in FUNCOES_PERMITIDAS
+                    or len(no.args) != 1 or no.keywords):
+                raise ValueError("Chamadas permitidas: função(x) com funções de FUNCOES_PERMITIDAS.")
+            nomes_de_funcoes.add(id(no.func))
+        if (isinstance(no, ast.Name) and no.id != "x" and no.id not in CONSTANTES_PERMITIDAS
+                and id(no) not in nomes_de_funcoes):
+            raise ValueError(f"Nome desconhecido na expressão: {no.id!r}.")
+
+
+def _coeficientes_polinomio(no):
+    # Converte a árvore em coeficientes [a0, a1, a2, ...] ou levanta
+    # _NaoPolinomial.
+    if isinstance(no, ast.Expression):
+        return _coeficientes_polinomio(no.body)
+    if isinstance(no, ast.Constant):
+        return [float(no.value)]
+    if isinstance(no, ast.Name):
+        if no.id == "x":
+            return [0.0, 1.0]
+        if no.id in CONSTANTES_PERMITIDAS:
+            return [CONSTANTES_PERMITIDAS[no.id]]
+        raise _NaoPolinomial
+    if isinstance(no, ast.UnaryOp):
+        p = _coeficientes_polinomio(no.operand)
+        return [-c for c in p] if isinstance(no.op, ast.USub) else p
+    if isinstance(no, ast.BinOp):
+        p = _coeficientes_polinomio(no.left)
+        q = _coeficientes_polinomio(no.right)
+        if isinstance(no.op, (ast.Add, ast.Sub)):
+            sinal = 1.0 if isinstance(no.op, ast.Add) else -1.0
+            tamanho = max(len(p), len(q))
+            p = p + [0.0] * (tamanho - len(p))
+            q = q + [0.0] * (tamanho - len(q))
+            return [pi + sinal * qi for pi, qi in zip(p, q)]
+        if isinstance(no.op, ast.Mult):
+            if len(p) + len(q) - 2 > GRAU_MAXIMO_POLINOMIO:
+                raise _NaoPolinomial
+            return _multiplicar_polinomios(p, q)
+        if isinstance(no.op, ast.Div) and len(q) == 1 and q[0] != 0.0:
+            return [c / q[0] for c in p]
+        if (isinstance(no.op, ast.Pow) and len(q) == 1
+                and 0 <= q[0] <= GRAU_MAXIMO_POLINOMIO and q[0] == int(q[0])
+                and (len(p) - 1) * int(q[0]) <= GRAU_MAXIMO_POLINOMIO):
+            return _potencia_polinomio(p, int(q[0]))
+    raise _NaoPolinomial
+
+
+def _potencia_polinomio(p, expoente):
+    # p**expoente por quadrados sucessivos (log2(expoente) produtos).
+    resultado = [1.0]
+    while expoente:
+        if expoente & 1:
+            resultado = _multiplicar_polinomios(resultado, p)
+        expoente >>= 1
+        if expoente:
+            p = _multiplicar_polinomios(p, p)
+    return resultado
+
+
+def _multiplicar_polinomios(p, q):
+    # Produto de dois polinômios dados por coeficientes [a0, a1, ...].
+    produto = [0.0] * (len(p) + len(q) - 1)
+    for i, pi in enumerate(p):
+        for j, qj in enumerate(q):
+            produto[i + j] += pi * qj
+    return produto
+
+
+def _funcao_horner(coeficientes):
+    # Cria f(x) que avalia o polinômio pela forma de Horner.
+    # `coeficientes` vai do termo de maior grau para o de menor grau.
+    primeiro, *restantes = coeficientes
+
+    def polinomio(x):
+        if np.ndim(x) == 0:
+            resultado = primeiro
+            for c in restantes:
+                resultado = resultado * x + c
+            return resultado
+
+        resultado = np.full(np.shape(x), primeiro)
+        for c in restantes:
+            resultado *= x
+            resultado += c
+        return resultado
+
+    return polinomio
+
+
+@functools.lru_cache(maxsize=256)
+def compilar_integrando(expressao):
+    # Analisa, valida e compila `expressao` (texto) em uma função
+    # vetorizada f(x). Levanta ValueError se a expressão for inválida.
+    try:
+        arvore = ast.parse(expressao.strip(), mode="eval")
+    except SyntaxError as erro:
+        raise ValueError(f"Expressão inválida: {expressao!r}.") from erro
+    _validar_expressao(arvore)
+
+    try:
+        coeficientes = _coeficientes_polinomio(arvore)
+    except _NaoPolinomial:
+        # Constantes como float: "2**10**9" não vira uma conta de inteiros enormes.
+        for no in ast.walk(arvore):
+            if isinstance(no, ast.Constant):
+                no.value = float(no.value)
+        codigo = compile(arvore, "<integrando>", "eval")
+        nomes = {"__builtins__": {}, **FUNCOES_PERMITIDAS, **CONSTANTES_PERMITIDAS}
+
+        def expressao(x):
+            valor = eval(codigo, nomes, {"x": x})
+            # Expressões sem x (por exemplo "exp(1)") dão um escalar;
+            # como no caminho de Horner, o resultado tem a forma de x.
+            if np.ndim(x) == 0 or np.shape(valor) == np.shape(x):
+                return valor
+            return np.full(np.shape(x), valor)
+
+        return expressao
+
+    # Remove zeros do termo de maior grau e inverte para Horner.
+    while len(coeficientes) > 1 and coeficientes[-1] == 0.0:
+        coeficientes.pop()
+    return _funcao_horner(coeficientes[::-1])
+
+
+@functools.lru_cache(maxsize=None)
+def _f_compilada():
+    # A f do topo do arquivo é um polinômio escrito com potências; a
+    # expressão do seu return é compilada como qualquer outra (forma de
+    # Horner), o que acompanha alterações feitas em f. Se o código-fonte
+    # não estiver disponível ou a expressão não for aceita, usa f mesmo.
+    try:
+        definicao = ast.parse(textwrap.dedent(inspect.getsource(f))).body[0]
+        if len(definicao.body) != 1 or not isinstance(definicao.body[0], ast.Return):
+            return f
+        return compilar_integrando(ast.unparse(definicao.body[0].value))
+    except (OSError, TypeError, ValueError, SyntaxError):
+        return f
+
+
+def _resolver_integrando(funcao):
+    # Aceita uma função ou o texto de uma expressão.
+    if isinstance(funcao, str):
+        return compilar_integrando(funcao)
+    if funcao is f:
+        return _f_compilada()
+    return funcao
+
+
+# ---------------------------------------------------------------
+# Regra dos Trapézios
+#
+# Fórmula geral:
+# ∫ f(x) dx ≈ (h/2) * Σ [ f(x_i) + f(x_{i+1}) ]
+#
+# Onde:
+# - h é o tamanho de cada subintervalo: h = (b - a) / n
+# - Soma feita sobre cada par (x0, x1), (x1, x2), ...
+#
+# A ideia é aproximar a área sob a curva usando trapézios.
+# Cada trapézio tem altura h e bases f(x0) e f(x1).
+# ---------------------------------------------------------------
+@instrumentado("integral/trapezios", lambda _, arg: {"avaliacoes_f": 2 * arg["n"]})
+def trapezios(a, b, n):
+    h = (b - a) / n  # calcula o tamanho de cada subintervalo
+
+    soma = 0  # acumulador das somas das bases dos trapézios
+
+    # Percorre todos os subintervalos
+    for i in range(1, n + 1):
+        x0 = a + (i - 1) * h  # início do trapézio
+        x1 = x0 + h           # fim do trapézio
+
+        # Soma das bases do trapézio
+        soma = soma + (f(x0) + f(x1))
+
+    # Fórmula final da regra dos trapézios
+    resultado = (h / 2) * soma
+    return resultado
+
+
+# ---------------------------------------------------------------
+# Regra de Simpson 1/3
+#
+# A Regra de Simpson é mais precisa que a dos trapézios.
+# Ela usa parábolas para aproximar a função.
+#
+# Fórmula:
+# ∫ f(x) dx ≈ (h/3) * [ f(x0) + f(xn) + 
+#                       4*(f(x1)+f(x3)+...) +
+#                       2*(f(x2)+f(x4)+...) ]
+#
+# OBSERVAÇÃO IMPORTANTE:
+# Para usar Simpson 1/3, o número de subintervalos n deve ser PAR.
+#
+# Caso não seja, o programa ajusta automaticamente somando +1.
+# ---------------------------------------------------------------
+@instrumentado("integral/simpson", lambda _, arg: {"avaliacoes_f": arg["n"] + 1})
+def simpson(a, b, n):
+    # Verifica se n é par
+    if n % 2 != 0:
+        print("AVISO: Para Simpson, n deve ser par. Somando 1 ao valor.")
+        n = n + 1  # ajusta n para o próximo número par
+
+    h = (b - a) / n  # largura dos subintervalos
+
+    # Simpson começa somando os extremos da integral
+    soma = f(a) + f(b)
+
+    # Agora somamos os termos internos, alternando pesos 4 e 2
+    for i in range(1, n):
+        x = a + i * h
+
+        if i % 2 == 0:
+            # Índices pares recebem peso 2,
+            soma = soma + 2 * f(x)
+        else:
+            # Índices ímpares recebem peso 4
+            soma = soma + 4 * f(x)
+
+    # Fórmula final de Simpson
+    resultado = (h / 3) * soma
+    return resultado
+
+
+# ---------------------------------------------------------------
+# Versões vetorizadas (numpy)
+#
+# As regras acima chamam f uma vez por ponto dentro de um laço
+# Python (e a dos trapézios avalia cada ponto interno duas vezes).
+# As versões abaixo escrevem as duas regras como uma soma ponderada
+# dos valores de f nos nós x_i = a + i*h:
+#
+#   Trapézios: pesos h/2 * [1, 2, 2, ..., 2, 1]
+#   Simpson  : pesos h/3 * [1, 4, 2, 4, ..., 2, 4, 1]
+#
+# Os nós são gerados em pedaços de TAMANHO_PEDACO pontos: f é
+# avaliada no pedaço inteiro com uma única chamada e o resultado é
+# combinado com os pesos por um produto escalar. Assim a memória
+# usada não depende de n (n = 10⁸ cabe sem problemas).
+#
+# O vetor de pesos de um pedaço é sempre o mesmo (2, 2, 2, ... ou
+# 2, 4, 2, 4, ...), então é montado uma única vez; só no primeiro e
+# no último pedaço o peso dos extremos a e b passa a ser 1. Cada nó
+# é avaliado exatamente uma vez.
+#
+# A função integrada precisa aceitar arrays numpy (como a f acima).
+# ---------------------------------------------------------------
+TAMANHO_PEDACO = 1 << 16   # número de nós avaliados por vez (par)
+
+
+def _soma_ponderada(a, h, n, pesos, funcao):
+    # Soma Σ pesos[i] * f(a + i*h) para i = 0..n, pedaço por pedaço,
+    # repetindo o mesmo vetor de pesos em todos os pedaços; os nós
+    # i = 0 e i = n recebem peso 1.
+    tamanho_pedaco = pesos.shape[0]
+    deslocamentos = np.arange(tamanho_pedaco) * h
+    nos = np.empty(tamanho_pedaco)   # reaproveitado em todos os pedaços
+    soma = 0.0
+    for inicio in range(0, n + 1, tamanho_pedaco):
+        quantidade = min(tamanho_pedaco, n + 1 - inicio)
+        pesos_pedaco = pesos[:quantidade]
+        if inicio == 0 or inicio + quantidade == n + 1:
+            pesos_pedaco = pesos_pedaco.copy()
+            if inicio == 0:
+                pesos_pedaco[0] = 1.0
+            if inicio + quantidade == n + 1:
+                pesos_pedaco[-1] = 1.0
+        valores = funcao(np.add(deslocamentos[:quantidade], a + inicio * h,
+                                out=nos[:quantidade]))
+        soma += pesos_pedaco @ valores
+    return soma
+
+
+@instrumentado("integral/trapezios_vetorizado", lambda _, arg: {"avaliacoes_f": arg["n"] + 1})
+def trapezios_vetorizado(a, b, n, funcao=f, tamanho_pedaco=TAMANHO_PEDACO):
+    funcao = _resolver_integrando(funcao)
+    h = (b - a) / n
+
+    # Nós internos com peso 2; os extremos (peso 1) são ajustados em
+    # _soma_ponderada.
+    pesos = np.full(min(tamanho_pedaco, n + 1), 2.0)
+    soma = _soma_ponderada(a, h, n, pesos, funcao)
+    return (h / 2) * soma
+
+
+@instrumentado("integral/simpson_vetorizado",
+              lambda _, arg: {"avaliacoes_f": arg["n"] + arg["n"] % 2 + 1})
+def simpson_vetorizado(a, b, n, funcao=f, tamanho_pedaco=TAMANHO_PEDACO):
+    funcao = _resolver_integrando(funcao)
+
+    # Mesmo ajuste de n ímpar da função simpson().
+    if n % 2 != 0:
+        print("AVISO: Para Simpson, n deve ser par. Somando 1 ao valor.")
+        n = n + 1
+
+    h = (b - a) / n
+
+    # Pesos 2, 4, 2, 4, ... (o pedaço tem tamanho par, então todo
+    # pedaço começa em um índice par); os extremos têm peso 1.
+    tamanho_pedaco += tamanho_pedaco % 2
+    pesos = np.tile([2.0, 4.0], min(tamanho_pedaco, n + 2) // 2)
+    soma = _soma_ponderada(a, h, n, pesos, funcao)
+    return (h / 3) * soma
+
+
+# ---------------------------------------------------------------
+# Simpson adaptativo com controle de erro
+#
+# Em vez de escolher n antes, o intervalo é dividido apenas onde o
+# erro estimado é grande. Para cada subintervalo [x0, x4] guardamos
+# f em 5 pontos igualmente espaçados (x0, x1, x2, x3, x4) e duas
+# estimativas:
+#   S1 = Simpson com os pontos x0, x2, x4 (um só passo);
+#   S2 = Simpson composto com os 5 pontos (dois passos).
+# O erro de S2 é estimado por |S2 - S1| / 15 e o valor usado é a
+# extrapolação S2 + (S2 - S1) / 15.
+#
+# Os subintervalos ficam em uma fila de prioridade (heap) ordenada
+# pelo erro; a cada passo o de maior erro é dividido ao meio. As
+# duas metades herdam os 3 valores de f que já conheciam, então
+# cada divisão custa exatamente 4 novas avaliações de f e nenhum
+# ponto é avaliado duas vezes.
+#
+# Critério de parada: erro total <= max(tol_abs, tol_rel * |valor|),
+# ou max_avaliacoes atingido (neste caso o erro estimado devolvido
+# mostra que a tolerância não foi alcançada).
+# ---------------------------------------------------------------
+def _subintervalo_simpson(x0, x4, f0, f2, f4, funcao):
+    # Cria um item da fila a partir dos extremos e do ponto médio já
+    # conhecidos, avaliando f apenas nos pontos x1 e x3.
+    h = (x4 - x0) / 4
+    f1 = funcao(x0 + h)
+    f3 = funcao(x4 - h)
+    s1 = (2 * h / 3) * (f0 + 4 * f2 + f4)
+    s2 = (h / 3) * (f0 + 4 * f1 + 2 * f2 + 4 * f3 + f4)
+    erro = abs(s2 - s1) / 15
+    # O heapq retira o menor primeiro, por isso o erro entra negativo.
+    return (-erro, x0, x4, f0, f1, f2, f3, f4, s2 + (s2 - s1) / 15)
+
+
+@instrumentado("integral/simpson_adaptativo", lambda r, _: {"avaliacoes_f": r[2]})
+def simpson_adaptativo(a, b, tol_abs=1e-10, tol_rel=1e-10, funcao=f,
+                       max_avaliacoes=1_000_000):
+    # Retorna (valor, erro_estimado, numero_de_avaliacoes_de_f).
+    funcao = _resolver_integrando(funcao)
+    avaliacoes = 5
+    inicial = _subintervalo_simpson(a, b, funcao(a), funcao((a + b) / 2),
+                                    funcao(b), funcao)
+    fila = [inicial]
+    valor = inicial[-1]
+    erro_total = -inicial[0]
+
+    while (erro_total > max(tol_abs, tol_rel * abs(valor))
+           and avaliacoes + 4 <= max_avaliacoes):
+        erro_neg, x0, x4, f0, f1, f2, f3, f4, valor_item = heapq.heappop(fila)
+        x2 = (x0 + x4) / 2
+        esquerda = _subintervalo_simpson(x0, x2, f0, f1, f2, funcao)
+        direita = _subintervalo_simpson(x2, x4, f2, f3, f4, funcao)
+        avaliacoes += 4
+
+        heapq.heappush(fila, esquerda)
+        heapq.heappush(fila, direita)
+        valor += esquerda[-1] + direita[-1] - valor_item
+        erro_total += erro_neg - esquerda[0] - direita[0]
+
+    # Soma final com math.fsum para não acumular erros de arredondamento
+    # das atualizações incrementais feitas no laço.
+    valor = math.fsum(item[-1] for item in fila)
+    erro_total = math.fsum(-item[0] for item in fila)
+    return valor, erro_total, avaliacoes
+
+
+# ---------------------------------------------------------------
+# Integração de Romberg (extrapolação de Richardson)
+#
+# Parte da regra dos trapézios com 1 subintervalo e dobra o número
+# de subintervalos a cada nível. Ao dobrar, todos os nós antigos
+# continuam sendo nós, então:
+#
+#   T(h/2) = T(h)/2 + (h/2) * Σ f(pontos médios novos)
+#
+# ou seja, f só é avaliada nos pontos médios novos (de forma
+# vetorizada, em pedaços, como em trapezios_vetorizado()).
+#
+# Cada linha da tabela de Romberg elimina mais um termo do erro:
+#
+#   R[k][j] = R[k][j-1] + (R[k][j-1] - R[k-1][j-1]) / (4^j - 1)
+#
+# Paramos quando dois elementos diagonais seguidos diferem menos
+# que max(tol_abs, tol_rel * |valor|). A diferença entre eles é
+# devolvida como estimativa do erro.
+# ---------------------------------------------------------------
+@instrumentado("integral/romberg", lambda r, _: {"avaliacoes_f": r[2]})
+def romberg(a, b, tol_abs=1e-10, tol_rel=1e-10, funcao=f, max_niveis=25):
+    # Retorna (valor, erro_estimado, numero_de_avaliacoes_de_f).
+    funcao = _resolver_integrando(funcao)
+    h = b - a
+    linha_anterior = [(h / 2) * (funcao(a) + funcao(b))]
+    avaliacoes = 2
+    erro = math.inf
+
+    for k in range(1, max_niveis + 1):
+        novos_pontos = 2 ** (k - 1)
+        h = h / 2
+        pesos = np.ones(min(TAMANHO_PEDACO, novos_pontos))
+        soma_medios = _soma_ponderada(a + h, 2 * h, novos_pontos - 1, pesos, funcao)
+        avaliacoes += novos_pontos
+
+        linha = [linha_anterior[0] / 2 + h * soma_medios]
+        for j in range(1, k + 1):
+            fator = 4 ** j - 1
+            linha.append(linha[j - 1] + (linha[j - 1] - linha_anterior[j - 1]) / fator)
+
+        erro = abs(linha[k] - linha_anterior[k - 1])
+        linha_anterior = linha
+        if k >= 2 and erro <= max(tol_abs, tol_rel * abs(linha[k])):
+            break
+
+    return linha_anterior[-1], erro, avaliacoes
+
+
+# ---------------------------------------------------------------
+# Integração em lote
+#
+# Calcula muitas integrais de uma vez: os argumentos a, b e n podem
+# ser arrays (com broadcasting entre eles) e `funcao` pode ser uma
+# única função ou uma lista de funções, uma por integral.
+#
+# O lote é dividido em fatias contíguas, uma por processo, e cada
+# processo recebe uma única tarefa com a sua fatia de a, b e n (não
+# há envio de arrays grandes por integral). Dentro de cada processo,
+# as integrais com a mesma função e o mesmo n são calculadas juntas:
+# monta-se uma matriz (integrais × nós), avalia-se f nela inteira e
+# aplica-se o vetor de pesos da regra com um produto matriz-vetor.
+#
+# As funções precisam poder ser enviadas a outros processos (funções
+# definidas no nível do módulo; lambdas não servem). Expressões em
+# texto são enviadas como texto e compiladas em cada processo. Para
+# Simpson, n ímpar é ajustado para n + 1, como em simpson(), mas sem
+# aviso.
+# Os resultados voltam na mesma ordem da entrada, em um array numpy.
+# ---------------------------------------------------------------
+def _pesos_regra(regra, n):
+    # Pesos da regra para n subintervalos, já divididos por 2 ou 3
+    # (basta multiplicar por h).
+    pesos = np.ones(n + 1)
+    if regra == "trapezios":
+        pesos[1:-1] = 2.0
+        return pesos / 2
+    pesos[1:-1:2] = 4.0
+    pesos[2:-1:2] = 2.0
+    return pesos / 3
+
+
+def _integrar_fatia(a, b, n, indices_funcoes, funcoes, regra):
+    # Calcula as integrais de uma fatia do lote (executado no processo
+    # trabalhador).
+    resultados = np.empty(a.shape[0])
+    # Sem o decorador: as avaliações já são contadas por integrar_lote.
+    regra_escalar = (trapezios_vetorizado if regra == "trapezios"
+                     else simpson_vetorizado).__wrapped__
+
+    for indice_funcao in np.unique(indices_funcoes):
+        funcao = _resolver_integrando(funcoes[indice_funcao])
+        da_funcao = indices_funcoes == indice_funcao
+
+        for n_grupo in np.unique(n[da_funcao]):
+            posicoes = np.flatnonzero(da_funcao & (n == n_grupo))
+
+            if n_grupo + 1 > TAMANHO_PEDACO:
+                # Grade grande demais para uma linha da matriz: usa a
+                # versão em pedaços, integral por integral.
+                for p in posicoes:
+                    resultados[p] = regra_escalar(a[p], b[p], int(n_grupo), funcao)
+                continue
+
+            pesos = _pesos_regra(regra, int(n_grupo))
+            nos = np.arange(n_grupo + 1) / n_grupo
+            linhas_por_pedaco = max(1, TAMANHO_PEDACO // (int(n_grupo) + 1))
+
+            for inicio in range(0, posicoes.shape[0], linhas_por_pedaco):
+                p = posicoes[inicio:inicio + linhas_por_pedaco]
+                largura = b[p] - a[p]
+                valores = funcao(a[p, None] + largura[:, None] * nos)
+                resultados[p] = (largura / n_grupo) * (valores @ pesos)
+
+    return resultados
+
+
+def _avaliacoes_lote(_, argumentos):
+    # Avaliações de f de integrar_lote: n + 1 por integral, com o n
+    # ímpar de Simpson já ajustado.
+    n = np.broadcast_arrays(argumentos["a"], argumentos["b"],
+                            np.asarray(argumentos["n"], dtype=np.int64))[2]
+    if argumentos["regra"] == "simpson":
+        n = n + n % 2
+    return {"avaliacoes_f": int(np.sum(n + 1))}
+
+
+@instrumentado("integral/lote", _avaliacoes_lote)
+def integrar_lote(a, b, n, funcao=f, regra="simpson", num_processos=None):
+    if regra not in ("trapezios", "simpson"):
+        raise ValueError(f"Regra desconhecida: {regra!r} (use 'trapezios' ou 'simpson').")
+
+    # Uma lista de funções é convertida em índices para funções únicas,
+    # para que integrais com a mesma função sejam agrupadas.
+    if callable(funcao) or isinstance(funcao, str):
+        funcoes = [funcao]
+        indices_funcoes = 0
+    else:
+        unicas = {}
+        indices_funcoes = [unicas.setdefault(g, len(unicas)) for g in funcao]
+        funcoes = list(unicas)
+
+    a, b, n, indices_funcoes = (np.ravel(v) for v in np.broadcast_arrays(
+        np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64),
+        np.asarray(n, dtype=np.int64), np.asarray(indices_funcoes, dtype=np.int64)))
+    if np.any(n < 1):
+        raise ValueError("O número de subintervalos n deve ser pelo menos 1.")
+    if regra == "simpson":
+        n = n + n % 2
+
+    if num_processos is None:
+        num_processos = os.cpu_count() or 1
+    num_processos = max(1, min(num_processos, a.shape[0]))
+
+    if num_processos == 1:
+        return _integrar_fatia(a, b, n, indices_funcoes, funcoes, regra)
+
+    fatias = np.array_split(np.arange(a.shape[0]), num_processos)
+    with ProcessPoolExecutor(num_processos) as executor:
+        partes = executor.map(
+            _integrar_fatia,
+            [a[s] for s in fatias], [b[s] for s in fatias], [n[s] for s in fatias],
+            [indices_funcoes[s] for s in fatias],
+            [funcoes] * num_processos, [regra] * num_processos,
+        )
+        return np.concatenate(list(partes))
+
+
+# ---------------------------------------------------------------
+# PROGRAMA PRINCIPAL
+# Versão simples, estilo iniciante, sem estruturas avançadas.
+# Aqui o usuário digita os limites e o número de subintervalos
+# e o programa mostra o resultado usando os dois métodos.
+# ---------------------------------------------------------------
+def main():
+    print("=======================================================")
+    print("   CÁLCULO DE INTEGRAIS - TRAPÉZIOS E SIMPSON")
+    print("=======================================================\n")
+
+    # Solicita ao usuário os valores necessários
+    a = float(input("Limite inferior a = "))
+    b = float(input("Limite superior b = "))
+    n = int(input("Número de sub-intervalos n = "))
+
+    # A função pode ser digitada como expressão em x (ex.: "x**2 + sin(x)").
+    # Com ENTER vazio, usa a função f(x) definida no início do arquivo.
+    expressao = input("f(x) = (ENTER para usar a função padrão) ").strip()
+    funcao = compilar_integrando(expressao) if expressao else f
+
+    # Calcula a integral pelos dois métodos
+    valor_trap = trapezios_vetorizado(a, b, n, funcao)
+    valor_simp = simpson_vetorizado(a, b, n, funcao)
+
+    # Mostra os resultados na tela
+    print("\n================ RESULTADOS ================")
+    print(f"Regra dos Trapézios : {valor_trap}")
+    print(f"Regra de Simpson    : {valor_simp}")
+
+    valor_adapt, erro_adapt, avaliacoes_adapt = simpson_adaptativo(a, b, funcao=funcao)
+    print(f"Simpson adaptativo  : {valor_adapt}")
+    print(f"  (erro estimado = {erro_adapt:.2e}, {avaliacoes_adapt} avaliações de f)")
+
+    valor_romb, erro_romb, avaliacoes_romb = romberg(a, b, funcao=funcao)
+    print(f"Romberg             : {valor_romb}")
+    print(f"  (erro estimado = {erro_romb:.2e}, {avaliacoes_romb} avaliações de f)")
+    print("============================================")
+
+
+if __name__ == "__main__":
+    main()
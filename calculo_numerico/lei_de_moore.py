@@ -0,0 +1,382 @@
+# -*- coding: utf-8 -*-
+# Importamos a biblioteca math apenas para usar a função log10(),
+# que calcula o logaritmo na base 10.
+import math
+from itertools import islice
+
+# O numpy só é usado para ler arquivos grandes em pedaços.
+import numpy as np
+
+from .instrumentacao import instrumentado
+
+# ================================================================
+# LISTA DE DADOS ORIGINAIS
+# Cada linha contém:
+#   (ano de lançamento, número de transistores do chip)
+#
+# Esses dados foram extraídos da tabela fornecida no enunciado.
+# ================================================================
+dados = [
+    (1971, 2250),
+    (1972, 3500),
+    (1974, 6000),
+    (1978, 29000),
+    (1982, 134000),
+    (1986, 275000),
+    (1989, 1200000),
+    (1993, 3100000),
+    (1997, 7500000),
+    (1999, 9500000),
+    (2000, 42000000)
+]
+
+
+# =====================================================================
+# TRANSFORMAÇÃO LOGARÍTMICA
+#
+# Para cada chip calculamos o log10(N). A transformação logarítmica é
+# essencial, pois a Lei de Moore cresce de forma aproximadamente
+# exponencial; ao aplicar log10, transformamos esse crescimento em algo
+# mais parecido com uma linha reta.
+# =====================================================================
+
+def transformar_dados(dados):
+    anos = [a for a, _ in dados]                          # lista com os anos
+    log_transistores = [math.log10(n) for _, n in dados]  # log10 dos transistores
+    return anos, log_transistores
+
+
+# =====================================================================
+# REGRESSÃO INCREMENTAL (acumuladores centrados, estilo Welford)
+#
+# Em vez das somas Σx, Σy, Σx², Σxy, guardamos:
+#   n              = número de observações
+#   media_x/y      = médias
+#   sxx, syy, sxy  = Σ(x - média_x)², Σ(y - média_y)², Σ(x - média_x)(y - média_y)
+#
+# Cada nova observação atualiza esses valores em O(1). A fórmula
+# ingênua n·Σx² - (Σx)² subtrai dois números da ordem de n²·2000²
+# quase iguais e perde quase todos os algarismos significativos; com
+# os desvios em relação à média esse cancelamento não acontece.
+#
+# Dois acumuladores (por exemplo, de partes diferentes de um arquivo
+# processadas em paralelo) podem ser combinados sem rever os dados
+# (fórmula de Chan et al.).
+#
+# A partir dos acumuladores:
+#   b  = sxy / sxx
+#   a  = media_y - b · media_x
+#   R² = sxy² / (sxx · syy)
+# =====================================================================
+
+class RegressaoIncremental:
+    def __init__(self):
+        self.n = 0
+        self.media_x = 0.0
+        self.media_y = 0.0
+        self.sxx = 0.0
+        self.syy = 0.0
+        self.sxy = 0.0
+
+    # Acrescenta uma observação (x, y) em O(1).
+    def adicionar(self, x, y):
+        self.n += 1
+        dx = x - self.media_x
+        dy = y - self.media_y
+        self.media_x += dx / self.n
+        self.media_y += dy / self.n
+        self.sxx += dx * (x - self.media_x)
+        self.syy += dy * (y - self.media_y)
+        self.sxy += dx * (y - self.media_y)
+
+    # Acrescenta várias observações de uma vez: calcula os acumuladores
+    # do lote (com numpy) e combina com os atuais.
+    def adicionar_lote(self, xs, ys):
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        if xs.shape != ys.shape:
+            raise ValueError("x e y devem ter o mesmo tamanho.")
+        if xs.size == 0:
+            return
+        lote = RegressaoIncremental()
+        lote.n = xs.size
+        lote.media_x = float(xs.mean())
+        lote.media_y = float(ys.mean())
+        dx = xs - lote.media_x
+        dy = ys - lote.media_y
+        lote.sxx = float(dx @ dx)
+        lote.syy = float(dy @ dy)
+        lote.sxy = float(dx @ dy)
+        self.combinar(lote)
+
+    # Incorpora os dados de outro acumulador (sem alterar o outro).
+    def combinar(self, outro):
+        if outro.n == 0:
+            return self
+        n = self.n + outro.n
+        dx = outro.media_x - self.media_x
+        dy = outro.media_y - self.media_y
+        fator = self.n * outro.n / n
+        self.media_x += dx * outro.n / n
+        self.media_y += dy * outro.n / n
+        self.sxx += outro.sxx + dx * dx * fator
+        self.syy += outro.syy + dy * dy * fator
+        self.sxy += outro.sxy + dx * dy * fator
+        self.n = n
+        return self
+
+    def __add__(self, outro):
+        return RegressaoIncremental().combinar(self).combinar(outro)
+
+    # Coeficientes (a, b) da reta y = a + b·x.
+    def _verificar_x(self):
+        if self.n < 2 or self.sxx == 0.0:
+            raise ValueError("São necessários pelo menos dois valores distintos de x.")
+
+    def coeficientes(self):
+        self._verificar_x()
+        coeficiente_b = self.sxy / self.sxx
+        return self.media_y - coeficiente_b * self.media_x, coeficiente_b
+
+    def r2(self):
+        self._verificar_x()
+        if self.syy == 0.0:
+            return 1.0
+        return self.sxy * self.sxy / (self.sxx * self.syy)
+
+    def __repr__(self):
+        return (f"RegressaoIncremental(n={self.n}, media_x={self.media_x:.6g}, "
+                f"media_y={self.media_y:.6g})")
+
+
+# =====================================================================
+# CÁLCULO DOS COEFICIENTES DA REGRESSÃO LINEAR (MÍNIMOS QUADRADOS)
+#
+# Queremos ajustar uma reta da forma:
+#       log10(N) = a + b * ano
+#
+# onde:
+#   a = intercepto da reta
+#   b = inclinação (quanto log10(N) cresce a cada ano)
+#
+# O ajuste usa os acumuladores centrados da RegressaoIncremental.
+# =====================================================================
+
+def ajustar_reta(anos, log_transistores):
+    regressao = RegressaoIncremental()
+    for ano, log_n in zip(anos, log_transistores):
+        regressao.adicionar(ano, log_n)
+    return regressao.coeficientes()
+
+
+# =====================================================================
+# LEITURA DE ARQUIVOS GRANDES
+#
+# Lê um arquivo "ano,transistores" (vírgulas ou espaços; linhas com
+# "#" são comentários) em pedaços de `tamanho_pedaco` linhas e devolve
+# a RegressaoIncremental de log10(transistores) em função do ano.
+# `arquivo` pode ser um caminho ou um arquivo já aberto.
+# =====================================================================
+
+TAMANHO_PEDACO_CSV = 1 << 16
+
+@instrumentado("lei_de_moore/ajuste_csv")
+def ajustar_csv(arquivo, tamanho_pedaco=TAMANHO_PEDACO_CSV, regressao=None):
+    regressao = RegressaoIncremental() if regressao is None else regressao
+    if isinstance(arquivo, (str, bytes)) or hasattr(arquivo, "__fspath__"):
+        with open(arquivo, encoding="utf-8") as aberto:
+            return ajustar_csv(aberto, tamanho_pedaco, regressao)
+
+    while True:
+        linhas = list(islice(arquivo, tamanho_pedaco))
+        if not linhas:
+            return regressao
+        linhas = [linha.replace(",", " ") for linha in linhas
+                  if linha.strip() and not linha.lstrip().startswith("#")]
+        if not linhas:
+            continue
+        tabela = np.loadtxt(linhas, ndmin=2)
+        if tabela.shape[1] != 2:
+            raise ValueError("Cada linha deve conter 'ano transistores'.")
+        regressao.adicionar_lote(tabela[:, 0], np.log10(tabela[:, 1]))
+
+
+# =====================================================================
+# FUNÇÕES DE PREVISÃO
+# =====================================================================
+
+def calcular_log_transistores(ano, coeficiente_a, coeficiente_b):
+    return coeficiente_a + coeficiente_b * ano
+
+def calcular_transistores(ano, coeficiente_a, coeficiente_b):
+    log_valor = calcular_log_transistores(ano, coeficiente_a, coeficiente_b)
+    return 10 ** log_valor
+
+# Versão para vetores de anos (e/ou de coeficientes), por broadcasting.
+def prever_transistores(anos, coeficiente_a, coeficiente_b):
+    anos = np.asarray(anos, dtype=float)
+    return 10.0 ** calcular_log_transistores(anos, np.asarray(coeficiente_a),
+                                             np.asarray(coeficiente_b))
+
+
+# =====================================================================
+# AJUSTE DE VÁRIAS SÉRIES DE UMA VEZ
+#
+# `series` indica a qual série (fabricante, linha de produto, ...)
+# pertence cada observação; os rótulos podem ser de qualquer tipo.
+# Todas as retas são ajustadas numa única passada vetorizada: as
+# médias e as somas centradas de cada série são calculadas com
+# np.bincount (um "group-by"), sem laços em Python.
+#
+# Séries com menos de dois anos distintos ficam com coeficientes NaN.
+# =====================================================================
+
+class AjusteSeries:
+    def __init__(self, rotulos, indice_serie, n, coeficiente_a, coeficiente_b, r2, residuos):
+        self.rotulos = rotulos              # rótulo de cada série (ordenados)
+        self.indice_serie = indice_serie    # série de cada observação (índice em rotulos)
+        self.n = n                          # observações por série
+        self.coeficiente_a = coeficiente_a
+        self.coeficiente_b = coeficiente_b
+        self.r2 = r2
+        self.residuos = residuos            # y - ŷ, na ordem das observações
+
+    def __len__(self):
+        return self.rotulos.shape[0]
+
+    def indices(self, series):
+        # Converte rótulos de série em índices (ValueError se não existirem).
+        series = np.asarray(series)
+        posicoes = np.searchsorted(self.rotulos, series)
+        posicoes = np.minimum(posicoes, len(self) - 1)
+        if not np.all(self.rotulos[posicoes] == series):
+            raise ValueError("Série desconhecida.")
+        return posicoes
+
+    # Previsão de log10(N).
+    #   series=None -> grade: uma linha por série, uma coluna por ano;
+    #   series dado -> um valor por ano, cada um com a reta da sua série
+    #                  (anos e series combinados por broadcasting).
+    def prever_log(self, anos, series=None):
+        anos = np.asarray(anos, dtype=float)
+        if series is None:
+            return self.coeficiente_a[:, None] + self.coeficiente_b[:, None] * anos.ravel()
+        i = self.indices(series)
+        return self.coeficiente_a[i] + self.coeficiente_b[i] * anos
+
+    def prever(self, anos, series=None):
+        return 10.0 ** self.prever_log(anos, series)
+
+
+@instrumentado("lei_de_moore/series", lambda r, _: {"linhas": r.indice_serie.size})
+def ajustar_series(series, anos, log_transistores):
+    anos = np.asarray(anos, dtype=float)
+    log_transistores = np.asarray(log_transistores, dtype=float)
+    if anos.shape != log_transistores.shape or np.shape(series) != anos.shape:
+        raise ValueError("series, anos e log_transistores devem ter o mesmo tamanho.")
+
+    rotulos, indice_serie = np.unique(series, return_inverse=True)
+    indice_serie = indice_serie.ravel()
+    num_series = rotulos.shape[0]
+
+    def somar(pesos):
+        return np.bincount(indice_serie, weights=pesos, minlength=num_series)
+
+    n = np.bincount(indice_serie, minlength=num_series)
+    media_x = somar(anos) / n
+    media_y = somar(log_transistores) / n
+    dx = anos - media_x[indice_serie]
+    dy = log_transistores - media_y[indice_serie]
+    sxx = somar(dx * dx)
+    syy = somar(dy * dy)
+    sxy = somar(dx * dy)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        coeficiente_b = np.where(sxx > 0.0, sxy / sxx, np.nan)
+        coeficiente_a = media_y - coeficiente_b * media_x
+        r2 = np.where(syy > 0.0, sxy * sxy / (sxx * syy), 1.0)
+    r2[np.isnan(coeficiente_b)] = np.nan
+
+    residuos = dy - coeficiente_b[indice_serie] * dx
+    return AjusteSeries(rotulos, indice_serie, n, coeficiente_a, coeficiente_b, r2, residuos)
+
+
+# =====================================================================
+# CÁLCULO DO R² (Coeficiente de Determinação)
+#
+# O R² mede o quanto a reta ajustada consegue explicar o comportamento
+# dos dados originais após aplicarmos log10.
+#
+# Interpretação:
+#   • R² próximo de 1 → o modelo explica muito bem os dados.
+#   • R² próximo de 0 → o modelo não consegue representar os dados.
+#
+# Como a Lei de Moore é quase exponencial, esperamos que o R²
+# (no espaço log10) seja bastante alto.
+# =====================================================================
+
+def calcular_r2(anos, log_transistores, coeficiente_a, coeficiente_b):
+    n = len(anos)
+    media_y = sum(log_transistores) / n
+
+    ss_total = sum((y - media_y)**2 for y in log_transistores)
+    ss_resid = sum((log_transistores[i]
+                    - calcular_log_transistores(anos[i], coeficiente_a, coeficiente_b))**2
+                   for i in range(n))
+
+    return 1 - ss_resid / ss_total
+
+
+# =====================================================================
+# PROGRAMA PRINCIPAL
+# =====================================================================
+
+def main():
+    print("===== LEI DE MOORE - PREVISÃO DE TRANSISTORES =====\n")
+    print("Dados originais (Ano, Transistores, Log10):")
+    print("-" * 50)
+
+    anos, log_transistores = transformar_dados(dados)
+
+    for i in range(len(dados)):
+        ano, trans = dados[i]
+        print(f"Ano: {ano} | Transistores: {trans:>12} | Log10: {log_transistores[i]:.4f}")
+
+    coeficiente_a, coeficiente_b = ajustar_reta(anos, log_transistores)
+
+    print("\n" + "=" * 50)
+    print("COEFICIENTES CALCULADOS:")
+    print("=" * 50)
+    print(f"Coeficiente a (intercepto da reta): {coeficiente_a:.6f}")
+    print(f"Coeficiente b (inclinação da reta): {coeficiente_b:.6f}")
+
+    # =================================================================
+    # PREVISÕES PARA OS ANOS 2010 E 2020
+    # =================================================================
+
+    print("\n" + "=" * 50)
+    print("PREVISÕES:")
+    print("=" * 50)
+
+    for ano in (2010, 2020):
+        log_ano = calcular_log_transistores(ano, coeficiente_a, coeficiente_b)
+        trans_ano = calcular_transistores(ano, coeficiente_a, coeficiente_b)
+
+        print(f"\nAno {ano}:")
+        print(f"  Log10(transistores) = {log_ano:.4f}")
+        print(f"  Transistores = {trans_ano:.0f}")
+
+    r2 = calcular_r2(anos, log_transistores, coeficiente_a, coeficiente_b)
+
+    print("\n" + "=" * 50)
+    print("QUALIDADE DO AJUSTE (R²):")
+    print("=" * 50)
+    print(f"R² = {r2:.6f}")
+    print("\nInterpretação:")
+    print("  Quanto mais próximo de 1, melhor a reta ajustada representa os dados.")
+    print("  Como estamos trabalhando com log10(N), um R² alto indica que a evolução")
+    print("  do número de transistores segue muito de perto um crescimento exponencial.")
+
+
+if __name__ == "__main__":
+    main()
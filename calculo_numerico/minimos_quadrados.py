@@ -0,0 +1,170 @@
+# ===================================================================
+# MÓDULO: Mínimos quadrados por fatoração QR em pedaços
+#
+# Descrição:
+#   Ajusta modelos y ≈ X·β com várias variáveis (polinômios de grau
+#   qualquer, ano e nó de fabricação, ...) sobre milhões de linhas.
+#   Em vez das equações normais (XᵀX)·β = Xᵀy, que elevam ao quadrado
+#   o número de condição, usa a fatoração QR da matriz aumentada
+#   [X | y], acumulada pedaço por pedaço (TSQR, "tall-skinny QR"):
+#
+#       R ← triangular de qr([R; X_pedaço | y_pedaço])
+#
+#   A memória fica limitada a (p+1)² números (p = número de colunas),
+#   qualquer que seja o número de linhas. Dois acumuladores podem ser
+#   combinados empilhando seus R, o que permite dividir os dados entre
+#   vários processos.
+#
+#   Do último R:  R_aug = [[R, z], [0, ρ]]
+#       β           = R⁻¹·z
+#       soma dos quadrados dos resíduos = ρ²
+#       erros padrão = σ·‖linha j de R⁻¹‖,  σ² = ρ² / (n − p)
+#   O R² usa a variância total de y, acumulada à parte (Welford), e
+#   supõe que o modelo tenha intercepto.
+# ===================================================================
+
+import numpy as np
+
+from .instrumentacao import instrumentado
+
+TAMANHO_PEDACO_MQ = 1 << 16   # linhas da matriz de projeto montadas por vez
+
+
+class AcumuladorQR:
+    """Fator R de [X | y] acumulado pedaço a pedaço, mais a variância de y."""
+
+    def __init__(self, num_colunas):
+        self.num_colunas = num_colunas
+        self.R = np.zeros((0, num_colunas + 1))
+        self.n = 0
+        self.media_y = 0.0
+        self.syy = 0.0
+
+    @instrumentado("minimos_quadrados/qr_pedaco", lambda _, arg: {"linhas": len(arg["y"])})
+    def adicionar(self, X, y):
+        """Incorpora as linhas X (m×p) e os valores y (m)."""
+        X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float)
+        if X.ndim != 2 or X.shape[1] != self.num_colunas or X.shape[0] != y.shape[0]:
+            raise ValueError(f"Esperado X m×{self.num_colunas} e y com m valores.")
+        if y.shape[0] == 0:
+            return self
+        self.R = np.linalg.qr(np.vstack([self.R, np.column_stack([X, y])]), mode="r")
+
+        m = y.shape[0]
+        media = float(y.mean())
+        desvios = y - media
+        self._combinar_variancia(m, media, float(desvios @ desvios))
+        return self
+
+    def combinar(self, outro):
+        """Incorpora outro acumulador (por exemplo, de outro processo)."""
+        if outro.num_colunas != self.num_colunas:
+            raise ValueError("Os acumuladores têm números de colunas diferentes.")
+        if outro.n == 0:
+            return self
+        self.R = np.linalg.qr(np.vstack([self.R, outro.R]), mode="r")
+        self._combinar_variancia(outro.n, outro.media_y, outro.syy)
+        return self
+
+    def _combinar_variancia(self, m, media, syy):
+        n = self.n + m
+        delta = media - self.media_y
+        self.syy += syy + delta * delta * self.n * m / n
+        self.media_y += delta * m / n
+        self.n = n
+
+    def resolver(self, montar=None):
+        """Devolve o ResultadoMinimosQuadrados dos dados acumulados."""
+        p = self.num_colunas
+        if self.n <= p:
+            raise ValueError(f"São necessárias mais de {p} observações para {p} coeficientes.")
+        R = self.R[:p, :p]
+        diagonal = np.abs(np.diag(R))
+        if diagonal.min() <= np.finfo(float).eps * p * diagonal.max():
+            raise ValueError("A matriz de projeto tem colunas linearmente dependentes.")
+
+        R_inversa = np.linalg.solve(R, np.eye(p))
+        coeficientes = R_inversa @ self.R[:p, p]
+        soma_residuos = float(self.R[p, p] ** 2)
+        sigma2 = soma_residuos / (self.n - p)
+        erros_padrao = np.sqrt(sigma2 * np.einsum("ij,ij->i", R_inversa, R_inversa))
+        r2 = 1.0 - soma_residuos / self.syy if self.syy > 0.0 else 1.0
+        return ResultadoMinimosQuadrados(coeficientes, erros_padrao, r2, soma_residuos,
+                                         self.n, montar)
+
+
+class ResultadoMinimosQuadrados:
+    """Coeficientes, erros padrão e qualidade de um ajuste por mínimos quadrados."""
+
+    def __init__(self, coeficientes, erros_padrao, r2, soma_residuos, n, montar=None):
+        self.coeficientes = coeficientes
+        self.erros_padrao = erros_padrao
+        self.r2 = r2
+        self.soma_residuos = soma_residuos
+        self.n = n
+        self.montar = montar     # dados -> matriz de projeto (para prever)
+
+    def prever(self, dados):
+        """Valores ajustados; `dados` é a matriz de projeto ou, se houver
+        `montar`, os dados originais (por exemplo, os anos)."""
+        X = self.montar(dados) if self.montar is not None else np.asarray(dados, dtype=float)
+        return X @ self.coeficientes
+
+    def __repr__(self):
+        return (f"ResultadoMinimosQuadrados(coeficientes={self.coeficientes}, "
+                f"r2={self.r2:.6g}, n={self.n})")
+
+
+@instrumentado("minimos_quadrados/ajuste")
+def ajustar_em_pedacos(pedacos, num_colunas, montar=None):
+    """
+    Ajusta y ≈ X·β a partir de um iterável de pedaços (X, y). Cada pedaço
+    é incorporado ao acumulador e descartado em seguida.
+    """
+    acumulador = AcumuladorQR(num_colunas)
+    for X, y in pedacos:
+        acumulador.adicionar(X, y)
+    return acumulador.resolver(montar)
+
+
+def matriz_polinomial(x, grau, centro=0.0, escala=1.0):
+    """Matriz de projeto [1, t, t², ..., t^grau] com t = (x − centro)/escala."""
+    t = (np.asarray(x, dtype=float).ravel() - centro) / escala
+    return np.vander(t, grau + 1, increasing=True)
+
+
+def ajustar_polinomio(x, y, grau, centro=None, escala=1.0,
+                      tamanho_pedaco=TAMANHO_PEDACO_MQ):
+    """
+    Ajusta y ≈ Σ βₖ·((x − centro)/escala)ᵏ. Centralizar x (por padrão na
+    média) evita o mau condicionamento de potências de anos ≈ 2000.
+    x e y podem ser memmaps: a matriz de projeto é montada em pedaços.
+    """
+    if centro is None:
+        centro = float(np.mean(x))
+
+    def montar(valores):
+        return matriz_polinomial(valores, grau, centro, escala)
+
+    pedacos = ((montar(x[i:i + tamanho_pedaco]), y[i:i + tamanho_pedaco])
+               for i in range(0, len(x), tamanho_pedaco))
+    return ajustar_em_pedacos(pedacos, grau + 1, montar)
+
+
+def ajustar_linear(X, y, intercepto=True, tamanho_pedaco=TAMANHO_PEDACO_MQ):
+    """
+    Regressão múltipla y ≈ β₀ + Σ βⱼ·xⱼ sobre as colunas de X (n×k),
+    montada em pedaços de linhas. Sem intercepto, β₀ não é incluído.
+    """
+    def montar(linhas):
+        linhas = np.asarray(linhas, dtype=float)
+        linhas = linhas.reshape(linhas.shape[0], -1)
+        if intercepto:
+            return np.column_stack([np.ones(linhas.shape[0]), linhas])
+        return linhas
+
+    num_colunas = montar(X[:1]).shape[1]
+    pedacos = ((montar(X[i:i + tamanho_pedaco]), y[i:i + tamanho_pedaco])
+               for i in range(0, len(X), tamanho_pedaco))
+    return ajustar_em_pedacos(pedacos, num_colunas, montar)
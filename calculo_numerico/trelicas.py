@@ -0,0 +1,201 @@
+# ===================================================================
+# MÓDULO: Treliças planas e espaciais
+#
+# Descrição:
+#   Monta a matriz de rigidez global K de uma treliça e o vetor de
+#   cargas F, já no formato MatrizCSR usado pelos métodos iterativos
+#   de gauss_seidel.py, e resolve K·u = F para os deslocamentos.
+#
+#   Toda a treliça fica em arrays numpy compactos:
+#     coordenadas  (nós × d)   posição de cada nó, d = 2 ou 3
+#     barras       (barras × 2) nós inicial e final de cada barra
+#     EA           (barras)     rigidez axial (módulo de elasticidade × área)
+#     apoios       (nós × d)    True onde o deslocamento é impedido
+#     cargas       (nós × d)    forças aplicadas nos nós
+#
+#   A rigidez de cada barra é o bloco d×d  k·c·cᵀ  (k = EA/L, c = cossenos
+#   diretores), com sinal + nos pares (i, i), (j, j) e − em (i, j), (j, i).
+#   Os blocos são calculados de uma vez para todas as barras, somados
+#   por par de nós (np.unique + np.bincount) e espalhados diretamente
+#   nas posições do CSR. Os graus de liberdade dos apoios são
+#   eliminados filtrando os arrays do CSR; nenhuma matriz densa é criada.
+# ===================================================================
+
+import numpy as np
+
+from .gauss_seidel import MatrizCSR, gradientes_conjugados, sor_csr
+from .instrumentacao import instrumentado
+
+
+class Trelica:
+    """
+    Treliça de barras articuladas. Grau de liberdade (gdl) d·nó + eixo.
+
+    `EA` pode ser um número (todas as barras iguais) ou um valor por
+    barra; `apoios` e `cargas` podem ser omitidos e preenchidos depois
+    (por exemplo, trelica.apoios[0] = True; trelica.cargas[5, 1] = -10).
+    """
+
+    def __init__(self, coordenadas, barras, EA, apoios=None, cargas=None):
+        self.coordenadas = np.asarray(coordenadas, dtype=np.float64)
+        self.barras = np.asarray(barras, dtype=np.int64)
+        num_nos, d = self.coordenadas.shape
+        if d not in (2, 3):
+            raise ValueError("As coordenadas devem ter 2 ou 3 colunas.")
+        if self.barras.ndim != 2 or self.barras.shape[1] != 2:
+            raise ValueError("Cada barra deve ligar dois nós.")
+        if self.barras.size and (self.barras.min() < 0 or self.barras.max() >= num_nos):
+            raise ValueError("Barra ligada a um nó inexistente.")
+
+        self.EA = np.broadcast_to(np.asarray(EA, dtype=np.float64), (self.barras.shape[0],))
+        self.apoios = (np.zeros((num_nos, d), dtype=bool) if apoios is None
+                       else np.array(apoios, dtype=bool).reshape(num_nos, d))
+        self.cargas = (np.zeros((num_nos, d)) if cargas is None
+                       else np.array(cargas, dtype=np.float64).reshape(num_nos, d))
+
+    @property
+    def dimensao(self):
+        return self.coordenadas.shape[1]
+
+    @property
+    def num_gdl(self):
+        return self.coordenadas.size
+
+    def geometria(self):
+        """Comprimentos e cossenos diretores (barras × d) de todas as barras."""
+        delta = self.coordenadas[self.barras[:, 1]] - self.coordenadas[self.barras[:, 0]]
+        comprimentos = np.sqrt(np.einsum("ij,ij->i", delta, delta))
+        if np.any(comprimentos == 0.0):
+            raise ValueError("Há barras de comprimento zero.")
+        return comprimentos, delta / comprimentos[:, None]
+
+    def rigidez_elementos(self):
+        """Blocos k·c·cᵀ (barras × d × d) de todas as barras."""
+        comprimentos, cossenos = self.geometria()
+        return (self.EA / comprimentos)[:, None, None] * cossenos[:, :, None] * cossenos[:, None, :]
+
+    @instrumentado("trelicas/montagem", lambda _, arg: {"barras": arg["self"].barras.shape[0]})
+    def montar_rigidez(self):
+        """Matriz de rigidez global (todos os gdl, sem apoios) em CSR."""
+        d = self.dimensao
+        num_nos = self.coordenadas.shape[0]
+        blocos = self.rigidez_elementos()
+        i, j = self.barras[:, 0], self.barras[:, 1]
+
+        # Pares de nós (i,i), (j,j), (i,j), (j,i) e o sinal de cada bloco.
+        linhas_nos = np.concatenate([i, j, i, j])
+        colunas_nos = np.concatenate([i, j, j, i])
+        chaves, posicao = np.unique(linhas_nos * num_nos + colunas_nos, return_inverse=True)
+        posicao = posicao.ravel()
+        sinal = np.repeat([1.0, 1.0, -1.0, -1.0], i.shape[0])
+
+        # Soma dos blocos por par de nós (um bincount por componente do bloco).
+        soma = np.empty((chaves.shape[0], d, d))
+        for a in range(d):
+            for b in range(d):
+                pesos = sinal * np.tile(blocos[:, a, b], 4)
+                soma[:, a, b] = np.bincount(posicao, weights=pesos, minlength=chaves.shape[0])
+
+        # Estrutura por nós: o nó I tem vizinhos[ptr_nos[I]:ptr_nos[I+1]].
+        no_linha = chaves // num_nos
+        no_coluna = chaves % num_nos
+        grau = np.bincount(no_linha, minlength=num_nos)
+        ptr_nos = np.zeros(num_nos + 1, dtype=np.int64)
+        np.cumsum(grau, out=ptr_nos[1:])
+
+        # Cada bloco (I, J) ocupa, na linha d·I + a do CSR, as posições
+        # ptr_gdl[d·I + a] + d·(k − ptr_nos[I]) + b, com k o índice do bloco.
+        ptr_gdl = np.zeros(d * num_nos + 1, dtype=np.int64)
+        np.cumsum(np.repeat(d * grau, d), out=ptr_gdl[1:])
+        deslocamento = d * (np.arange(chaves.shape[0]) - ptr_nos[no_linha])
+        eixo = np.arange(d)
+        destino = (ptr_gdl[d * no_linha[:, None, None] + eixo[None, :, None]]
+                   + deslocamento[:, None, None] + eixo[None, None, :])
+
+        valores = np.empty(ptr_gdl[-1])
+        colunas = np.empty(ptr_gdl[-1], dtype=np.int64)
+        valores[destino] = soma
+        colunas[destino] = d * no_coluna[:, None, None] + eixo[None, None, :]
+        return MatrizCSR(valores, colunas, ptr_gdl, d * num_nos)
+
+    @instrumentado("trelicas/condicoes_contorno")
+    def sistema(self):
+        """
+        Sistema K·u = F só com os gdl livres. Retorna (K, F, livres),
+        onde `livres` são os índices globais dos gdl mantidos.
+        """
+        K = self.montar_rigidez()
+        livre = ~self.apoios.ravel()
+        livres = np.flatnonzero(livre)
+        novo_indice = np.cumsum(livre) - 1
+
+        mantidos = livre[K._linhas] & livre[K.indices_colunas] & (K.valores != 0.0)
+        linhas = novo_indice[K._linhas[mantidos]]
+        ponteiros = np.zeros(livres.shape[0] + 1, dtype=np.int64)
+        np.cumsum(np.bincount(linhas, minlength=livres.shape[0]), out=ponteiros[1:])
+        K_livre = MatrizCSR(K.valores[mantidos], novo_indice[K.indices_colunas[mantidos]],
+                            ponteiros, livres.shape[0])
+        return K_livre, self.cargas.ravel()[livres], livres
+
+    @instrumentado("trelicas/resolucao")
+    def resolver(self, tol=1e-10, max_iter=None, metodo="cg", precondicionador="jacobi"):
+        """
+        Deslocamentos nodais (nós × d). `metodo` é "cg" (Gradientes
+        Conjugados, o indicado para K simétrica positiva definida),
+        "gauss-seidel" ou "sor". Retorna (deslocamentos, iteracoes, convergiu).
+        """
+        K, F, livres = self.sistema()
+        if np.any(K.diagonal <= 0.0):
+            raise ValueError("Há gdl livres sem rigidez: a treliça é um mecanismo.")
+        max_iter = 10 * K.n if max_iter is None else max_iter
+
+        if metodo == "cg":
+            u_livre, iteracoes, convergiu, _ = gradientes_conjugados(
+                K, F, tol, max_iter, precondicionador=precondicionador)
+        elif metodo in ("gauss-seidel", "sor"):
+            u_livre, iteracoes, convergiu, _ = sor_csr(
+                K, F, tol, max_iter, 1.0 if metodo == "gauss-seidel" else "auto")
+        else:
+            raise ValueError(f"Método desconhecido: {metodo!r}.")
+
+        deslocamentos = np.zeros(self.num_gdl)
+        deslocamentos[livres] = u_livre
+        return deslocamentos.reshape(self.coordenadas.shape), iteracoes, convergiu
+
+    def forcas_axiais(self, deslocamentos):
+        """Força normal em cada barra (positiva = tração)."""
+        comprimentos, cossenos = self.geometria()
+        u = np.asarray(deslocamentos, dtype=np.float64).reshape(self.coordenadas.shape)
+        alongamento = np.einsum("ij,ij->i", cossenos, u[self.barras[:, 1]] - u[self.barras[:, 0]])
+        return self.EA / comprimentos * alongamento
+
+    def reacoes(self, deslocamentos):
+        """Reações de apoio (nós × d); zero nos gdl livres."""
+        K = self.montar_rigidez()
+        reacoes = K.multiplicar(np.ravel(deslocamentos)) - self.cargas.ravel()
+        reacoes[~self.apoios.ravel()] = 0.0
+        return reacoes.reshape(self.coordenadas.shape)
+
+
+def trelica_retangular(colunas, andares, vao=1.0, altura=1.0, EA=1.0):
+    """
+    Treliça plana em grade (colunas × andares painéis) com barras
+    horizontais, verticais e as duas diagonais de cada painel, apoiada
+    nos dois cantos inferiores (fixo à esquerda, móvel à direita).
+    Útil para testes e medições de desempenho.
+    """
+    nx, ny = colunas + 1, andares + 1
+    xs, ys = np.meshgrid(np.arange(nx) * vao, np.arange(ny) * altura)
+    coordenadas = np.column_stack([xs.ravel(), ys.ravel()])
+    no = np.arange(nx * ny).reshape(ny, nx)
+
+    barras = np.concatenate([
+        np.column_stack([no[:, :-1].ravel(), no[:, 1:].ravel()]),     # horizontais
+        np.column_stack([no[:-1, :].ravel(), no[1:, :].ravel()]),     # verticais
+        np.column_stack([no[:-1, :-1].ravel(), no[1:, 1:].ravel()]),  # diagonais /
+        np.column_stack([no[:-1, 1:].ravel(), no[1:, :-1].ravel()]),  # diagonais \
+    ])
+    apoios = np.zeros((nx * ny, 2), dtype=bool)
+    apoios[no[0, 0]] = True
+    apoios[no[0, -1], 1] = True
+    return Trelica(coordenadas, barras, EA, apoios)
@@ -0,0 +1,42 @@
+# Leitura de sistemas em arquivos: triplas em pedaços para CSR.
+
+import numpy as np
+import pytest
+
+from calculo_numerico import arquivos
+
+
+@pytest.mark.parametrize("nome", ["vazio.bin", "vazio.txt"])
+def test_arquivo_de_triplas_vazio(tmp_path, nome):
+    caminho = tmp_path / nome
+    caminho.write_bytes(b"")
+
+    with pytest.raises(ValueError):
+        arquivos.carregar_triplas_csr(caminho)
+
+    A = arquivos.carregar_triplas_csr(caminho, n=3)
+    assert A.nnz == 0
+    np.testing.assert_array_equal(A.para_densa(), np.zeros((3, 3)))
+
+
+def test_triplas_binarias_em_pedacos(tmp_path):
+    registros = np.array([(0, 0, 4.0), (1, 1, 3.0), (0, 1, -1.0), (1, 0, 2.0), (0, 0, 1.0)],
+                         dtype=arquivos.TIPO_TRIPLA)
+    caminho = tmp_path / "A.bin"
+    registros.tofile(caminho)
+
+    A = arquivos.carregar_triplas_csr(caminho, tamanho_pedaco=2)
+    np.testing.assert_array_equal(A.para_densa(), [[5.0, -1.0], [2.0, 3.0]])
+
+
+@pytest.mark.parametrize("tripla, n", [
+    ((0, -1, 1.0), None),
+    ((-1, 0, 1.0), None),
+    ((-1, 0, 1.0), 2),
+    ((0, 2, 1.0), 2),
+])
+def test_triplas_com_indices_invalidos(tmp_path, tripla, n):
+    caminho = tmp_path / "A.bin"
+    np.array([(0, 0, 1.0), tripla], dtype=arquivos.TIPO_TRIPLA).tofile(caminho)
+    with pytest.raises(ValueError):
+        arquivos.carregar_triplas_csr(caminho, n=n)
@@ -0,0 +1,24 @@
+# Suíte de desempenho: execução reduzida e comparação de resultados.
+
+from calculo_numerico import desempenho
+
+
+def test_comparar_execucao_com_ela_mesma_nao_tem_regressoes():
+    # Com escala minúscula todos os tamanhos viram 2: antes eles se
+    # repetiam e comparar() misturava os registros.
+    resultados = desempenho.executar_suite(filtro="integral/trapezios_original",
+                                           repeticoes=1, escala=1e-6)
+    tamanhos = [r["tamanho"] for r in resultados["resultados"]]
+    assert tamanhos == [2]
+
+    comparacao = desempenho.comparar(resultados, resultados)
+    assert comparacao
+    assert all(situacao == "igual" for *_, situacao in comparacao)
+
+
+def test_salvar_e_carregar(tmp_path):
+    resultados = desempenho.executar_suite(filtro="integral/trapezios_original",
+                                           repeticoes=1, escala=1e-3)
+    caminho = tmp_path / "resultados.json"
+    desempenho.salvar_resultados(resultados, caminho)
+    assert desempenho.carregar_resultados(caminho) == resultados
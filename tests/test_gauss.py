@@ -0,0 +1,99 @@
+# Eliminação de Gauss: LU em blocos, banda e precisão mista.
+
+import numpy as np
+import pytest
+
+from calculo_numerico import gauss
+
+
+def _sistema_dominante(n, semente):
+    # A eliminação original não pivota: a dominância diagonal garante
+    # pivôs não nulos e um sistema bem condicionado.
+    rng = np.random.default_rng(semente)
+    A = rng.uniform(-1.0, 1.0, (n, n))
+    A[np.arange(n), np.arange(n)] = np.abs(A).sum(axis=1) + 1.0
+    b = rng.uniform(-1.0, 1.0, n)
+    return A, b
+
+
+def _sistema_banda(n, inferior, superior, semente):
+    A, b = _sistema_dominante(n, semente)
+    i, j = np.indices((n, n))
+    A[(j < i - inferior) | (j > i + superior)] = 0.0
+    return A, b
+
+
+def _eliminacao_original(A, b):
+    # Mesmo arranjo 1-indexado montado por gauss.main().
+    n = len(b)
+    matriz = [[0.0] * (n + 2)] + [[0.0] + A[i].tolist() + [b[i]] for i in range(n)]
+    gauss.triangularizar_matriz(matriz, n)
+    x = [0.0] * (n + 1)
+    gauss.substituicao_retroativa(matriz, x, n)
+    return np.array(x[1:])
+
+
+@pytest.mark.parametrize("n, tamanho_bloco", [(1, 64), (7, 64), (50, 8), (130, 64)])
+def test_resolver_sistema_concorda_com_eliminacao_original(n, tamanho_bloco):
+    A, b = _sistema_dominante(n, semente=n)
+    x = gauss.resolver_sistema(A, b, tamanho_bloco=tamanho_bloco)
+    np.testing.assert_allclose(x, _eliminacao_original(A, b), rtol=1e-10, atol=1e-12)
+    np.testing.assert_allclose(x, np.linalg.solve(A, b), rtol=1e-10, atol=1e-12)
+
+
+def test_fatorar_lu_reconstroi_matriz_permutada():
+    A, _ = _sistema_dominante(40, semente=3)
+    A[[0, 5]] = A[[5, 0]]   # força trocas de linha
+    lu, perm = gauss.fatorar_lu(A, tamanho_bloco=16)
+    L, U = gauss.separar_fatores(lu)
+    np.testing.assert_allclose(L @ U, A[perm], rtol=1e-12, atol=1e-12)
+
+
+def test_atalho_de_banda_concorda_com_denso():
+    n, inferior, superior = 600, 3, 2
+    assert gauss.usar_banda(n, inferior, superior)
+    A, b = _sistema_banda(n, inferior, superior, semente=1)
+    assert gauss.largura_banda(A) == (inferior, superior)
+    x = gauss.resolver_sistema(A, b)
+    np.testing.assert_allclose(x, np.linalg.solve(A, b), rtol=1e-10, atol=1e-12)
+    np.testing.assert_allclose(x, _eliminacao_original(A, b), rtol=1e-10, atol=1e-12)
+
+
+def test_tridiagonal_thomas():
+    n = 200
+    A, b = _sistema_banda(n, 1, 1, semente=2)
+    x = gauss.resolver_tridiagonal(np.diag(A, -1), np.diag(A), np.diag(A, 1), b)
+    np.testing.assert_allclose(x, np.linalg.solve(A, b), rtol=1e-10, atol=1e-12)
+    np.testing.assert_allclose(gauss.resolver_sistema_banda(A, b), x, rtol=1e-12, atol=1e-14)
+
+
+def test_banda_com_reordenacao_rcm():
+    n = 120
+    A, b = _sistema_banda(n, 2, 2, semente=4)
+    p = np.random.default_rng(4).permutation(n)
+    A_embaralhada = A[np.ix_(p, p)]
+    q = gauss.reordenar_cuthill_mckee(A_embaralhada)
+    assert sorted(q) == list(range(n))
+    assert max(gauss.largura_banda(A_embaralhada[np.ix_(q, q)])) < max(gauss.largura_banda(A_embaralhada))
+    x = gauss.resolver_sistema_banda(A_embaralhada, b[p], reordenar=True)
+    np.testing.assert_allclose(x, np.linalg.solve(A_embaralhada, b[p]), rtol=1e-10, atol=1e-12)
+
+
+def test_precisao_mista_bem_condicionada():
+    A, b = _sistema_dominante(100, semente=5)
+    x, refinamentos, erro, precisao = gauss.resolver_precisao_mista(A, b)
+    assert precisao == "mista"
+    assert refinamentos >= 1
+    assert erro <= np.sqrt(100) * np.finfo(np.float64).eps
+    np.testing.assert_allclose(x, np.linalg.solve(A, b), rtol=1e-10, atol=1e-12)
+
+
+def test_precisao_mista_recorre_a_dupla_quando_mal_condicionada():
+    n = 12
+    i = np.arange(n)
+    hilbert = 1.0 / (i[:, None] + i[None, :] + 1.0)
+    b = hilbert @ np.ones(n)
+    x, _, erro, precisao = gauss.resolver_precisao_mista(hilbert, b)
+    assert precisao == "dupla"
+    assert erro <= np.sqrt(n) * np.finfo(np.float64).eps
+    np.testing.assert_allclose(hilbert @ x, b, rtol=1e-10)
@@ -0,0 +1,65 @@
+# Matriz CSR e métodos iterativos.
+
+import numpy as np
+import pytest
+
+from calculo_numerico.gauss_seidel import MatrizCSR, MonitorConvergencia, gauss_seidel_csr
+
+
+def test_de_triplas_soma_repetidas_e_descarta_zeros():
+    A = MatrizCSR.de_triplas([0, 0, 1, 1, 0], [0, 1, 1, 0, 0], [1.0, 2.0, 3.0, 0.0, 4.0], 2)
+    np.testing.assert_array_equal(A.para_densa(), [[5.0, 2.0], [0.0, 3.0]])
+    assert A.nnz == 3
+
+
+@pytest.mark.parametrize("linhas, colunas", [
+    ([0], [2]),     # coluna = n (antes virava A[1, 0])
+    ([2], [0]),
+    ([-1], [0]),
+    ([0], [-1]),
+])
+def test_de_triplas_rejeita_indices_fora_da_matriz(linhas, colunas):
+    with pytest.raises(ValueError):
+        MatrizCSR.de_triplas(linhas, colunas, [5.0], 2)
+
+
+def _sistema_tridiagonal(n=20):
+    i = np.arange(n)
+    linhas = np.concatenate([i, i[1:], i[:-1]])
+    colunas = np.concatenate([i, i[:-1], i[1:]])
+    valores = np.concatenate([np.full(n, 4.0), np.full(2 * (n - 1), -1.0)])
+    return MatrizCSR.de_triplas(linhas, colunas, valores, n), np.ones(n)
+
+
+def test_monitor_exige_A_e_b_juntos():
+    A, b = _sistema_tridiagonal()
+    with pytest.raises(ValueError):
+        MonitorConvergencia(A=A)
+    with pytest.raises(ValueError):
+        MonitorConvergencia(b=b)
+
+
+def test_monitor_calcula_residuo_so_no_intervalo(capsys):
+    A, b = _sistema_tridiagonal()
+    monitor = MonitorConvergencia(A=A, b=b, intervalo_residuo=5, exibir=True)
+    x, iteracoes, convergiu = gauss_seidel_csr(A, b, 1e-12, 100, monitor=monitor)
+
+    assert convergiu
+    historico = monitor.historico
+    assert historico.shape[0] == iteracoes
+    com_residuo = ~np.isnan(historico[:, 2])
+    np.testing.assert_array_equal(historico[com_residuo, 0] % 5, 0)
+    assert com_residuo.sum() == iteracoes // 5
+    assert monitor.residuo(x) == pytest.approx(np.linalg.norm(b - A.multiplicar(np.array(x))))
+
+    linhas = capsys.readouterr().out.splitlines()
+    assert len(linhas) == iteracoes
+    assert "Resíduo" in linhas[4] and "Resíduo" not in linhas[0]
+
+
+def test_monitor_sem_residuo_e_silencioso(capsys):
+    A, b = _sistema_tridiagonal()
+    monitor = MonitorConvergencia(A=A, b=b, intervalo_residuo=0)
+    gauss_seidel_csr(A, b, 1e-12, 100, monitor=monitor)
+    assert np.all(np.isnan(monitor.historico[:, 2]))
+    assert capsys.readouterr().out == ""
@@ -0,0 +1,30 @@
+# Instrumentação: fases aninhadas, pico de memória e contagem de blocos.
+
+import numpy as np
+
+from calculo_numerico import instrumentacao
+
+
+def test_blocos_alocados_e_pico_aninhado():
+    with instrumentacao.instrumentar(memoria=True) as estatisticas:
+        with estatisticas.fase("pai"):
+            grande = np.ones(1_000_000)
+            del grande
+            with estatisticas.fase("filho"):
+                guardados = [object() for _ in range(500)]
+    pai, filho = estatisticas.fases["pai"], estatisticas.fases["filho"]
+
+    assert filho.blocos_alocados >= 500
+    assert pai.blocos_alocados >= filho.blocos_alocados
+    assert pai.bytes_pico >= 8_000_000 > filho.bytes_pico
+    assert "alocados" in estatisticas.resumo()
+    assert estatisticas.para_dicionario()["fases"]["filho"]["blocos_alocados"] >= 500
+    del guardados
+
+
+def test_desligada_nao_registra():
+    assert instrumentacao.ativa() is None
+    with instrumentacao.instrumentar() as estatisticas:
+        assert instrumentacao.ativa() is estatisticas
+    assert instrumentacao.ativa() is None
+    assert "alocados" not in estatisticas.resumo()
@@ -0,0 +1,30 @@
+# Regressão incremental da Lei de Moore.
+
+import pytest
+
+from calculo_numerico import lei_de_moore
+from calculo_numerico.lei_de_moore import RegressaoIncremental
+
+
+def test_regressao_incremental_reproduz_calcular_r2():
+    anos, log_transistores = lei_de_moore.transformar_dados(lei_de_moore.dados)
+    regressao = RegressaoIncremental()
+    regressao.adicionar_lote(anos[:4], log_transistores[:4])
+    resto = RegressaoIncremental()
+    for ano, log_n in zip(anos[4:], log_transistores[4:]):
+        resto.adicionar(ano, log_n)
+    regressao = regressao + resto
+
+    a, b = regressao.coeficientes()
+    assert (a, b) == pytest.approx(lei_de_moore.ajustar_reta(anos, log_transistores))
+    assert regressao.r2() == pytest.approx(lei_de_moore.calcular_r2(anos, log_transistores, a, b))
+
+
+@pytest.mark.parametrize("ys", [[1.0, 2.0, 3.0], [5.0, 5.0, 5.0]])
+def test_x_todos_iguais(ys):
+    regressao = RegressaoIncremental()
+    regressao.adicionar_lote([2000.0] * 3, ys)
+    with pytest.raises(ValueError):
+        regressao.coeficientes()
+    with pytest.raises(ValueError):
+        regressao.r2()
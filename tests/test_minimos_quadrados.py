@@ -0,0 +1,58 @@
+# Regressão: o ajuste por QR em pedaços (minimos_quadrados) deve
+# reproduzir a reta da Lei de Moore calculada por lei_de_moore.
+
+import numpy as np
+import pytest
+
+from calculo_numerico import lei_de_moore
+from calculo_numerico.minimos_quadrados import (AcumuladorQR, ajustar_em_pedacos,
+                                                ajustar_linear)
+
+
+@pytest.fixture
+def moore():
+    anos, log_transistores = lei_de_moore.transformar_dados(lei_de_moore.dados)
+    a, b = lei_de_moore.ajustar_reta(anos, log_transistores)
+    r2 = lei_de_moore.calcular_r2(anos, log_transistores, a, b)
+    return np.array(anos, dtype=float), np.array(log_transistores), (a, b), r2
+
+
+def _projeto(anos):
+    return np.column_stack([np.ones(len(anos)), anos])
+
+
+def test_ajustar_linear_reproduz_ajustar_reta(moore):
+    anos, y, coeficientes, r2 = moore
+    resultado = ajustar_linear(anos, y)
+    np.testing.assert_allclose(resultado.coeficientes, coeficientes, rtol=1e-10)
+    assert resultado.r2 == pytest.approx(r2, rel=1e-10)
+    assert resultado.n == len(anos)
+
+
+@pytest.mark.parametrize("tamanho_pedaco", [1, 2, 3, 5, 11])
+def test_pedacos_nao_alteram_resultado(moore, tamanho_pedaco):
+    anos, y, coeficientes, r2 = moore
+    pedacos = ((_projeto(anos[i:i + tamanho_pedaco]), y[i:i + tamanho_pedaco])
+               for i in range(0, len(anos), tamanho_pedaco))
+    resultado = ajustar_em_pedacos(pedacos, 2)
+    np.testing.assert_allclose(resultado.coeficientes, coeficientes, rtol=1e-10)
+    assert resultado.r2 == pytest.approx(r2, rel=1e-10)
+    np.testing.assert_allclose(ajustar_linear(anos, y, tamanho_pedaco=tamanho_pedaco)
+                               .coeficientes, coeficientes, rtol=1e-10)
+
+
+def test_acumuladores_combinados(moore):
+    anos, y, coeficientes, r2 = moore
+    inteiro = AcumuladorQR(2).adicionar(_projeto(anos), y).resolver()
+
+    partes = [AcumuladorQR(2) for _ in range(3)]
+    for k, parte in enumerate(partes):
+        parte.adicionar(_projeto(anos[k::3]), y[k::3])
+    combinado = partes[0].combinar(partes[1]).combinar(partes[2]).combinar(AcumuladorQR(2))
+    resultado = combinado.resolver()
+
+    assert resultado.n == inteiro.n == len(anos)
+    np.testing.assert_allclose(resultado.coeficientes, coeficientes, rtol=1e-10)
+    np.testing.assert_allclose(resultado.erros_padrao, inteiro.erros_padrao, rtol=1e-10)
+    assert resultado.r2 == pytest.approx(r2, rel=1e-10)
+    assert resultado.soma_residuos == pytest.approx(inteiro.soma_residuos, rel=1e-10)